@@ -9,7 +9,7 @@ from PySide6.QtCore import QObject, Signal
 
 from ghostline.ai.ai_client import AIClient
 from ghostline.core import threads
-from ghostline.core.threads import BackgroundWorkers
+from ghostline.core.threads import NORMAL, TaskLane, shared_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +27,10 @@ class AnalysisService(QObject):
 
     suggestions_changed = Signal(list)
 
-    def __init__(self, client: AIClient, workers: BackgroundWorkers | None = None, parent=None) -> None:
+    def __init__(self, client: AIClient, workers: TaskLane | None = None, parent=None) -> None:
         super().__init__(parent)
         self.client = client
-        self._workers = workers or BackgroundWorkers()
+        self._workers = workers or shared_scheduler().lane(NORMAL)
         self._suggestions: list[AISuggestion] = []
         self._state_cache: dict[str, str] = {}
 
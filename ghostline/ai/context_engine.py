@@ -1,12 +1,13 @@
 """Context assembly for AI prompts."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Sequence
 
 from ghostline.ai.workspace_memory import WorkspaceMemory
-from ghostline.indexer.workspace_indexer import IndexedFile, WorkspaceIndexer
+from ghostline.core.cache import CacheManager
+from ghostline.indexer.workspace_indexer import ChunkMatch, IndexedFile, WorkspaceIndexer
 from ghostline.semantic.index_manager import SemanticIndexManager
 from ghostline.search.symbol_search import SymbolSearcher
 
@@ -21,6 +22,16 @@ class ContextChunk:
     reason: str = ""
 
 
+@dataclass
+class _RetrievalEntry:
+    """Cached retrieval results plus the file versions they were built from."""
+
+    chunks: list[ContextChunk]
+    layout_generation: int
+    recent_paths: tuple[Path, ...]
+    versions: dict[Path, int] = field(default_factory=dict)
+
+
 class ContextEngine:
     """Collects contextual snippets for AI prompts."""
 
@@ -38,6 +49,8 @@ class ContextEngine:
         *,
         max_snippet_chars: int = 800,
         max_results: int = 5,
+        cache_size: int = 32,
+        cache: CacheManager | None = None,
     ) -> None:
         self.indexer = indexer
         self.semantic_index = semantic_index
@@ -45,14 +58,16 @@ class ContextEngine:
         self.memory = memory
         self.max_snippet_chars = max_snippet_chars
         self.max_results = max_results
+        self.cache_size = cache_size
         self._pinned: list[ContextChunk] = []
-        self._cache_key: tuple[int, str] | None = None
-        self._cached_context: tuple[str, list[ContextChunk]] | None = None
+        # Prompt -> _RetrievalEntry; usually a namespace of the shared cache.
+        self._retrieval_cache = (
+            cache if cache is not None else CacheManager(auto_cleanup=False, max_entries=cache_size)
+        )
 
     def on_workspace_changed(self, root: Path | str | None) -> None:
         self._pinned.clear()
-        self._cache_key = None
-        self._cached_context = None
+        self._retrieval_cache.clear()
         self.indexer.set_workspace(root)
 
     def pin_context(self, chunk: ContextChunk) -> None:
@@ -74,10 +89,6 @@ class ContextEngine:
         active_document: tuple[Path | str, str] | None = None,
         open_documents: Iterable[tuple[Path | str | None, str]] | None = None,
     ) -> tuple[str, list[ContextChunk]]:
-        cache_key = (self.indexer.generation, prompt + instructions)
-        if cache_key == self._cache_key and self._cached_context:
-            return self._cached_context
-
         chunks: list[ContextChunk] = []
         if instructions.strip():
             chunks.append(ContextChunk("Custom instructions", instructions.strip(), None, "User instruction"))
@@ -112,15 +123,45 @@ class ContextEngine:
                         )
                     )
 
+        chunks.extend(self._retrieve(prompt))
+
+        combined = self._format_chunks(chunks)
+        return combined, chunks
+
+    def _retrieve(self, prompt: str) -> list[ContextChunk]:
+        """Return workspace retrieval results for ``prompt``, reusing cached work.
+
+        Entries stay valid until a file that contributed a chunk changes or
+        files are added to/removed from the index; edits elsewhere (such as
+        the active buffer) leave them untouched.
+        """
+
+        recent = tuple(self.semantic_index.recent_paths()) if self.semantic_index else ()
+        entry = self._retrieval_cache.get(prompt)
+        if entry is not None:
+            if self._is_fresh(entry, recent):
+                return list(entry.chunks)
+            self._retrieval_cache.invalidate(prompt)
+
+        layout_generation = self.indexer.layout_generation
+        chunks: list[ContextChunk] = []
         chunks.extend(self._mentions(prompt))
         chunks.extend(self._semantic_recent())
         chunks.extend(self._symbol_matches(prompt))
         chunks.extend(self._keyword_search(prompt))
 
-        combined = self._format_chunks(chunks)
-        self._cache_key = cache_key
-        self._cached_context = (combined, chunks)
-        return combined, chunks
+        versions = {
+            chunk.source_path: self.indexer.file_version(chunk.source_path)
+            for chunk in chunks
+            if chunk.source_path is not None
+        }
+        self._retrieval_cache.set(prompt, _RetrievalEntry(chunks, layout_generation, recent, versions))
+        return list(chunks)
+
+    def _is_fresh(self, entry: _RetrievalEntry, recent: tuple[Path, ...]) -> bool:
+        if entry.layout_generation != self.indexer.layout_generation or entry.recent_paths != recent:
+            return False
+        return all(self.indexer.file_version(path) == version for path, version in entry.versions.items())
 
     def _mentions(self, prompt: str) -> list[ContextChunk]:
         mentions = [token[1:] for token in prompt.split() if token.startswith("@") and len(token) > 1]
@@ -142,28 +183,43 @@ class ContextEngine:
         return results[: self.max_results]
 
     def _keyword_search(self, prompt: str) -> list[ContextChunk]:
-        matches = self.indexer.search(prompt, limit=self.max_results)
-        return [self._chunk_from_indexed(match, "Keyword match") for match in matches]
+        matches = self.indexer.search_chunks(prompt, limit=self.max_results)
+        return [self._chunk_from_match(match, "Keyword match") for match in matches]
 
     def _symbol_matches(self, prompt: str) -> list[ContextChunk]:
         tokens = [token.strip(".,()") for token in prompt.split() if len(token) > 3]
         chunks: list[ContextChunk] = []
-        seen_paths: set[Path] = set()
+        seen: set[tuple[Path, int]] = set()
+
+        def _add_symbol(symbol: str, reason: str) -> None:
+            matches = self.indexer.chunks_for_symbol(symbol, limit=2)
+            for match in matches:
+                key = (match.file.path, match.chunk.start_line)
+                if key not in seen:
+                    seen.add(key)
+                    chunks.append(self._chunk_from_match(match, reason))
+            if matches:
+                return
+            # Files indexed before chunking (or with no parsable symbols) still
+            # fall back to their head.
+            for indexed in self.indexer.symbols_for(symbol, limit=2):
+                key = (indexed.path, 0)
+                if key not in seen:
+                    seen.add(key)
+                    chunks.append(self._chunk_from_indexed(indexed, reason))
 
         for token in tokens:
-            for indexed in self.indexer.symbols_for(token, limit=2):
-                if indexed.path in seen_paths:
-                    continue
-                seen_paths.add(indexed.path)
-                chunks.append(self._chunk_from_indexed(indexed, f"Symbol mention: {token}"))
+            _add_symbol(token, f"Symbol mention: {token}")
 
         if self.semantic_index:
-            for node in self.semantic_index.graph.nodes():
-                if any(token.lower() in node.name.lower() for token in tokens):
-                    indexed = self.indexer.get(node.file)
-                    if indexed and indexed.path not in seen_paths:
-                        seen_paths.add(indexed.path)
-                        chunks.append(self._chunk_from_indexed(indexed, f"Semantic graph: {node.name}"))
+            graph = self.semantic_index.graph
+            names = dict.fromkeys(
+                name for token in tokens for name in graph.search_symbols(token, limit=self.max_results)
+            )
+            for name in names:
+                if len(chunks) >= self.max_results:
+                    break
+                _add_symbol(name, f"Semantic graph: {name}")
         return chunks[: self.max_results]
 
     def _chunk_from_indexed(self, indexed: IndexedFile, reason: str) -> ContextChunk:
@@ -174,6 +230,14 @@ class ContextEngine:
             reason=reason,
         )
 
+    def _chunk_from_match(self, match: ChunkMatch, reason: str) -> ContextChunk:
+        return ContextChunk(
+            title=match.title,
+            content=match.text()[: self.max_snippet_chars],
+            source_path=match.file.path,
+            reason=reason,
+        )
+
     def _format_chunks(self, chunks: Iterable[ContextChunk]) -> str:
         blocks = []
         if self.memory:
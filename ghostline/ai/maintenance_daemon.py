@@ -9,7 +9,7 @@ from typing import Callable, List
 from PySide6.QtCore import QObject, Signal
 
 from ghostline.ai.ai_client import AIClient
-from ghostline.core.threads import BackgroundWorkers
+from ghostline.core.threads import BACKGROUND, TaskLane, shared_scheduler
 from ghostline.semantic.graph import SemanticGraph
 from ghostline.semantic.index_manager import SemanticIndexManager
 from ghostline.vcs.git_service import GitService
@@ -46,14 +46,14 @@ class MaintenanceDaemon(QObject):
         index_manager: SemanticIndexManager,
         workspace_provider: Callable[[], str | None],
         git_service: GitService | None = None,
-        workers: BackgroundWorkers | None = None,
+        workers: TaskLane | None = None,
     ) -> None:
         super().__init__()
         self.client = client
         self.index_manager = index_manager
         self.workspace_provider = workspace_provider
         self.git_service = git_service or GitService(workspace_provider())
-        self.workers = workers or BackgroundWorkers()
+        self.workers = workers or shared_scheduler().lane(BACKGROUND)
         self.findings: list[MaintenanceFinding] = []
         self.last_scan_at: float = 0
 
@@ -98,31 +98,27 @@ class MaintenanceDaemon(QObject):
 
     def _detect_duplicates(self, graph: SemanticGraph) -> list[MaintenanceFinding]:
         findings: list[MaintenanceFinding] = []
-        seen: dict[str, list[Path]] = {}
-        for node in graph.nodes():
-            seen.setdefault(node.name, []).append(node.file)
-        for name, locations in seen.items():
-            if len(locations) > 1:
-                findings.append(
-                    MaintenanceFinding(
-                        label=f"Duplicate symbol: {name}",
-                        detail="Symbol appears across multiple files; consider extraction.",
-                        severity="warn",
-                        actions=[
-                            MaintenanceAction(
-                                title="Propose module extraction",
-                                description=f"Extract shared logic for {name}.",
-                                files=list({Path(p) for p in locations}),
-                                kind="module-extraction",
-                            )
-                        ],
-                    )
+        for name, locations in graph.shared_names().items():
+            findings.append(
+                MaintenanceFinding(
+                    label=f"Duplicate symbol: {name}",
+                    detail="Symbol appears across multiple files; consider extraction.",
+                    severity="warn",
+                    actions=[
+                        MaintenanceAction(
+                            title="Propose module extraction",
+                            description=f"Extract shared logic for {name}.",
+                            files=list({Path(p) for p in locations}),
+                            kind="module-extraction",
+                        )
+                    ],
                 )
+            )
         return findings
 
     def _detect_architecture_anomalies(self, graph: SemanticGraph) -> list[MaintenanceFinding]:
         findings: list[MaintenanceFinding] = []
-        for cycle in graph.find_cycles():
+        for cycle in graph.module_cycles():
             label = " -> ".join(node.name for node in cycle)
             findings.append(
                 MaintenanceFinding(
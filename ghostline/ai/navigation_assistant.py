@@ -43,16 +43,14 @@ class NavigationAssistant:
         modules = response.text.split()
         results: list[NavigationResult] = []
         for module in modules:
-            for node in self.query.search_by_kind("module"):
-                if module.lower() in node.name.lower():
-                    results.append(NavigationResult(f"Module {node.name}", node))
+            for node in self.query.search(module, kind="module", limit=None):
+                results.append(NavigationResult(f"Module {node.name}", node))
         return results
 
     def jump_to_error_construction(self) -> list[NavigationResult]:
         results: list[NavigationResult] = []
-        for node in self.query.search_by_kind("function"):
-            if "error" in node.name.lower():
-                results.append(NavigationResult(f"Error factory {node.name}", node))
+        for node in self.query.search("error", kind="function", limit=None):
+            results.append(NavigationResult(f"Error factory {node.name}", node))
         return results
 
     def predict_actions(self, context: PredictiveContext) -> list[PredictedAction]:
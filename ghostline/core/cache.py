@@ -1,11 +1,20 @@
 """Cache utilities for AI, LSP, and semantic layers."""
 from __future__ import annotations
 
+import sys
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from ghostline.core.disk_cache import DiskCache
+
+DEFAULT_MAX_ENTRIES = 4096
+
+_MISSING = object()
 
 
 @dataclass
@@ -13,23 +22,94 @@ class CacheEntry:
     value: Any
     timestamp: float
     ttl: float | None = None
+    size: int = 0
 
     def expired(self) -> bool:
         return self.ttl is not None and (time.time() - self.timestamp) > self.ttl
 
 
+@dataclass
+class CacheStats:
+    """Counters for one cache partition, as shown in diagnostics."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class _Flight:
+    """A factory call in progress that concurrent readers wait on."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    found: bool = False
+    error: BaseException | None = None
+
+
+def estimate_size(value: Any) -> int:
+    """Cheap, shallow size estimate used for the byte budget."""
+
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
 class CacheManager:
-    """Simple in-memory cache with automatic cleanup of expired entries."""
+    """Bounded, thread-safe LRU cache with TTLs and automatic cleanup.
+
+    Entries are evicted least recently used first once ``max_entries`` or
+    ``max_bytes`` is exceeded. Concurrent ``get`` calls for a missing key
+    share one factory call. :meth:`namespace` hands out independent
+    partitions with their own budget, lock and statistics, so the AI, LSP
+    and semantic layers do not evict each other's entries.
 
-    def __init__(self, auto_cleanup: bool = True, cleanup_interval: float = 300) -> None:
+    With a :class:`DiskCache` behind it, misses are looked up on disk before
+    calling the factory and every ``set`` is written through, so values
+    survive restarts. ``disk_version`` is part of each disk key; bump it
+    when the cached format changes.
+    """
+
+    def __init__(
+        self,
+        auto_cleanup: bool = True,
+        cleanup_interval: float = 300,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        sizer: Callable[[Any], int] = estimate_size,
+        disk: DiskCache | None = None,
+        disk_namespace: str = "default",
+        disk_version: str | int = 0,
+    ) -> None:
         """
         Initialize cache manager.
 
         Args:
             auto_cleanup: Whether to automatically cleanup expired entries
             cleanup_interval: How often to run cleanup (in seconds)
+            max_entries: Entry budget, or None for no limit
+            max_bytes: Byte budget as measured by ``sizer``, or None for no limit
+            sizer: Estimates the size of a cached value
+            disk: Persistent tier consulted on misses and written through
+            disk_namespace: Partition of ``disk`` used by this cache
+            disk_version: Version mixed into every disk key
         """
-        self._entries: Dict[str, CacheEntry] = {}
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizer = sizer
+        self._disk = disk
+        self._disk_namespace = disk_namespace
+        self._disk_version = disk_version
+        self._lock = threading.RLock()
+        self._flights: Dict[str, _Flight] = {}
+        self._stats = CacheStats()
+        self._bytes = 0
+        self._namespaces: Dict[str, CacheManager] = {}
         self._cleanup_interval = cleanup_interval
         self._cleanup_thread: threading.Thread | None = None
         self._stop_cleanup = threading.Event()
@@ -38,23 +118,199 @@ class CacheManager:
             self._start_cleanup_thread()
 
     def get(self, key: str, factory: Optional[Callable[[], Any]] = None, ttl: float | None = None) -> Any:
-        entry = self._entries.get(key)
-        if entry and not entry.expired():
-            return entry.value
-        if factory:
-            value = factory()
-            self.set(key, value, ttl=ttl)
-            return value
-        return None
+        while True:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    self._stats.hits += 1
+                    return entry.value
+                self._stats.misses += 1
+                if not factory and self._disk is None:
+                    return None
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight()
+            if leader:
+                return self._lead(flight, key, factory, ttl)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            # A leader without a factory may come back empty; retry so ours runs.
+            if flight.found or not factory:
+                return flight.value
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
-        self._entries[key] = CacheEntry(value, time.time(), ttl)
+        self._store(key, value, ttl)
+        if self._disk is not None:
+            self._disk.set(self._disk_namespace, key, value, self._disk_version, ttl)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._discard(key)
+        if self._disk is not None:
+            self._disk.delete(self._disk_namespace, key, self._disk_version)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; the disk tier is left alone."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and not entry.expired()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def namespace(
+        self,
+        name: str,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        disk: DiskCache | None = None,
+        disk_version: str | int | None = None,
+    ) -> CacheManager:
+        """Return the partition called ``name``, creating it on first use.
+
+        A new partition inherits this cache's budgets unless given its own;
+        it is cleaned up by this cache's cleanup thread. Passing ``disk``
+        makes it persistent under the disk namespace ``name``. Asking for an
+        existing partition with different settings raises :class:`ValueError`.
+        """
+
+        with self._lock:
+            partition = self._namespaces.get(name)
+            if partition is not None:
+                conflicts = [
+                    setting
+                    for setting, wanted, current in (
+                        ("max_entries", max_entries, partition.max_entries),
+                        ("max_bytes", max_bytes, partition.max_bytes),
+                        ("disk", disk, partition._disk),
+                        ("disk_version", disk_version, partition._disk_version),
+                    )
+                    if wanted is not None and wanted != current
+                ]
+                if conflicts:
+                    differing = ", ".join(conflicts)
+                    raise ValueError(f"Cache namespace {name!r} already exists with a different {differing}")
+            else:
+                partition = CacheManager(
+                    auto_cleanup=False,
+                    max_entries=max_entries if max_entries is not None else self.max_entries,
+                    max_bytes=max_bytes if max_bytes is not None else self.max_bytes,
+                    sizer=self._sizer,
+                    disk=disk,
+                    disk_namespace=name,
+                    disk_version=disk_version if disk_version is not None else 0,
+                )
+                self._namespaces[name] = partition
+            return partition
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of this partition's counters."""
+
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                disk_hits=self._stats.disk_hits,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def all_stats(self) -> Dict[str, CacheStats]:
+        """Counters for this cache (under ``""``) and every namespace."""
+
+        with self._lock:
+            namespaces = dict(self._namespaces)
+        stats = {"": self.stats()}
+        stats.update((name, partition.stats()) for name, partition in namespaces.items())
+        return stats
 
     def cleanup(self) -> None:
         """Manually cleanup expired entries."""
-        to_remove = [key for key, entry in self._entries.items() if entry.expired()]
-        for key in to_remove:
-            self._entries.pop(key, None)
+        with self._lock:
+            to_remove = [key for key, entry in self._entries.items() if entry.expired()]
+            for key in to_remove:
+                self._discard(key)
+            self._stats.expirations += len(to_remove)
+            namespaces = list(self._namespaces.values())
+        for partition in namespaces:
+            partition.cleanup()
+
+    def _lead(
+        self, flight: _Flight, key: str, factory: Optional[Callable[[], Any]], ttl: float | None
+    ) -> Any:
+        """Load ``key`` for every caller waiting on ``flight``."""
+
+        try:
+            value = self._load(key)
+            if value is not _MISSING:
+                self._store(key, value, ttl)
+                flight.found = True
+            elif factory:
+                value = factory()
+                self.set(key, value, ttl=ttl)
+                flight.found = True
+            else:
+                value = None
+            flight.value = value
+            return value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _store(self, key: str, value: Any, ttl: float | None) -> None:
+        entry = CacheEntry(value, time.time(), ttl, self._sizer(value))
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+
+    def _load(self, key: str) -> Any:
+        if self._disk is None:
+            return _MISSING
+        value = self._disk.get(self._disk_namespace, key, self._disk_version, _MISSING)
+        if value is not _MISSING:
+            with self._lock:
+                self._stats.disk_hits += 1
+        return value
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expired():
+            self._discard(key)
+            self._stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats.evictions += 1
 
     def _start_cleanup_thread(self) -> None:
         """Start background thread for automatic cleanup."""
@@ -74,7 +330,9 @@ class CacheManager:
         self._stop_cleanup.set()
         if self._cleanup_thread:
             self._cleanup_thread.join(timeout=1)
-        self._entries.clear()
+        self.clear()
+        for partition in list(self._namespaces.values()):
+            partition.shutdown()
 
     def __del__(self) -> None:
         """Ensure cleanup thread is stopped on garbage collection."""
@@ -84,6 +342,20 @@ class CacheManager:
             pass  # Ignore errors during cleanup in __del__
 
 
+_shared_cache: CacheManager | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> CacheManager:
+    """Return the process-wide cache whose namespaces the subsystems share."""
+
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = CacheManager()
+        return _shared_cache
+
+
 class FileSignatureCache(CacheManager):
     """Caches file signatures to avoid repeated hashing across systems."""
 
@@ -92,12 +364,11 @@ class FileSignatureCache(CacheManager):
         self.root = root
 
     def signature(self, file_path: Path) -> str:
-        stat = file_path.stat()
         key = str(file_path)
         cached = self.get(key)
         if cached:
             return cached
+        stat = file_path.stat()
         signature = f"{stat.st_mtime}-{stat.st_size}"
         self.set(key, signature, ttl=60)
         return signature
-
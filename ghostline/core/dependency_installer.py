@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import importlib.util
 import os
 import subprocess
@@ -10,6 +11,13 @@ import sysconfig
 from pathlib import Path
 from typing import Callable, Iterable, Set
 
+from ghostline.core.cache import CacheManager, shared_cache
+from ghostline.core.disk_cache import shared_disk_cache
+from ghostline.workspace.crawler import shared_crawler
+
+# Bump when the import discovery changes what it extracts from a file.
+IMPORTS_CACHE_VERSION = 1
+
 
 def project_root() -> Path:
     """Return the absolute path to the repository root."""
@@ -83,14 +91,25 @@ def _first_party_packages(root: Path) -> Set[str]:
     return packages
 
 
-def _discover_imports(py_file: Path) -> Set[str]:
-    """Parse a Python file and return discovered top-level import names."""
-    discovered: set[str] = set()
+def _discover_imports(py_file: Path, cache: CacheManager | None = None) -> Set[str]:
+    """Parse a Python file and return discovered top-level import names.
+
+    With ``cache``, results are keyed by a digest of the source, so
+    unchanged files are not parsed again on the next scan.
+    """
     try:
         source = py_file.read_text(encoding="utf-8", errors="ignore")
     except OSError:
-        return discovered
+        return set()
 
+    if cache is None:
+        return _parse_imports(source, py_file)
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return set(cache.get(digest, lambda: frozenset(_parse_imports(source, py_file))))
+
+
+def _parse_imports(source: str, py_file: Path) -> Set[str]:
+    discovered: set[str] = set()
     try:
         tree = ast.parse(source, filename=str(py_file))
     except SyntaxError:
@@ -113,13 +132,21 @@ def _discover_imports(py_file: Path) -> Set[str]:
     return discovered
 
 
-def collect_dependencies(root: Path) -> Set[str]:
-    """Collect third-party dependencies used in the project."""
+def collect_dependencies(root: Path, cache: CacheManager | None = None) -> Set[str]:
+    """Collect third-party dependencies used in the project.
+
+    Per-file imports are cached in ``cache``, by default a namespace of the
+    shared cache backed by the disk tier, so startup scans survive restarts.
+    """
+    if cache is None:
+        cache = shared_cache().namespace(
+            "dependency-imports", disk=shared_disk_cache(), disk_version=IMPORTS_CACHE_VERSION
+        )
     first_party = _first_party_packages(root)
     discovered: set[str] = set()
 
-    for py_file in root.rglob("*.py"):
-        discovered.update(_discover_imports(py_file))
+    for py_file in shared_crawler().iter_files(root, suffixes=(".py",)):
+        discovered.update(_discover_imports(py_file, cache))
 
     dependencies: set[str] = set()
     for name in discovered:
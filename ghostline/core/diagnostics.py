@@ -8,10 +8,12 @@ import shutil
 import sys
 import tempfile
 import zipfile
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from ghostline.core.cache import shared_cache
 from ghostline.core.config import CONFIG_DIR, USER_SETTINGS_PATH
 from ghostline.core.logging import LOG_DIR, LOG_FILE
 from ghostline.core.urls import get_app_version
@@ -43,6 +45,7 @@ class DiagnosticsCollector:
             "app_info": self._collect_app_info(),
             "config": self._collect_config(),
             "logs": self._collect_logs(),
+            "caches": self._collect_cache_stats(),
         }
 
     def _collect_system_info(self) -> dict[str, str]:
@@ -122,6 +125,10 @@ class DiagnosticsCollector:
 
         return logs
 
+    def _collect_cache_stats(self) -> dict[str, dict[str, int]]:
+        """Collect hit, miss and eviction counters of the shared cache namespaces."""
+        return {name or "shared": asdict(stats) for name, stats in shared_cache().all_stats().items()}
+
     def _redact_sensitive_data(self, data: Any, depth: int = 0) -> Any:
         """Recursively redact sensitive data from config."""
         if depth > 10:  # Prevent infinite recursion
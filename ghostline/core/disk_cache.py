@@ -0,0 +1,197 @@
+"""Persistent, content-addressed cache tier shared across sessions."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import ghostline.core.config as config
+from ghostline.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIRNAME = "cache"
+# Bumping this orphans every entry written by older releases.
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Eviction trims the cache to this fraction of its budget, so it does not run on every write.
+EVICTION_TARGET = 0.8
+
+_MISSING = object()
+
+
+class DiskCache:
+    """Pickled values in sharded files, addressed by a digest of their key.
+
+    A key is hashed together with its namespace and the caller's version,
+    so bumping a subsystem's version makes its old entries unreachable;
+    they age out through eviction. Writes land in a temporary file that is
+    then renamed over the entry, so readers never see a partial value.
+    Reads refresh the file's mtime, and once the directory outgrows
+    ``max_bytes`` the least recently used files are deleted. Unreadable
+    entries count as misses and are removed.
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root or config.CONFIG_DIR / CACHE_DIRNAME
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes on disk, counted on the first write and kept up to date after.
+        self._size: int | None = None
+
+    def digest(self, namespace: str, key: str, version: str | int = 0) -> str:
+        material = f"{CACHE_FORMAT_VERSION}\0{namespace}\0{version}\0{key}"
+        return hashlib.sha256(material.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, namespace: str, key: str, version: str | int = 0, default: Any = None) -> Any:
+        path = self._path(namespace, self.digest(namespace, key, version))
+        try:
+            with path.open("rb") as handle:
+                timestamp, ttl, value = pickle.load(handle)
+        except FileNotFoundError:
+            return default
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError, AttributeError, ImportError):
+            logger.debug("Dropping unreadable cache entry %s", path, exc_info=True)
+            self._unlink(path)
+            return default
+        if ttl is not None and time.time() - timestamp > ttl:
+            self._unlink(path)
+            return default
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, namespace: str, key: str, value: Any, version: str | int = 0, ttl: float | None = None) -> bool:
+        """Store ``value``; returns False when it cannot be pickled or written."""
+
+        path = self._path(namespace, self.digest(namespace, key, version))
+        try:
+            payload = pickle.dumps((time.time(), ttl, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug("Value for %s/%s cannot be cached on disk", namespace, key, exc_info=True)
+            return False
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = _file_size(path)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(payload)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.warning("Unable to write cache entry %s", path, exc_info=True)
+            return False
+        self._grow(len(payload) - previous)
+        return True
+
+    def delete(self, namespace: str, key: str, version: str | int = 0) -> None:
+        self._unlink(self._path(namespace, self.digest(namespace, key, version)))
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Remove every entry, or only those of ``namespace``."""
+
+        base = self._namespace_dir(namespace) if namespace else self.root
+        for path in list(_entries(base)):
+            self._unlink(path)
+
+    def size(self) -> int:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(_file_size(path) for path in _entries(self.root))
+            return self._size
+
+    # Internal ---------------------------------------------------------
+    def _path(self, namespace: str, digest: str) -> Path:
+        return self._namespace_dir(namespace) / digest[:2] / digest
+
+    def _namespace_dir(self, namespace: str) -> Path:
+        """Directory of ``namespace``, which must be a single path component."""
+
+        if namespace in ("", ".", "..") or any(sep in namespace for sep in ("/", "\\", "\0")):
+            raise ValueError(f"Invalid cache namespace: {namespace!r}")
+        return self.root / namespace
+
+    def _grow(self, delta: int) -> None:
+        with self._lock:
+            if self._size is None:
+                # The first scan already counts the entry just written.
+                self._size = sum(_file_size(path) for path in _entries(self.root))
+            else:
+                self._size += delta
+            total = self._size
+        if total > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the eviction target."""
+
+        files = []
+        for path in _entries(self.root):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _mtime, size, _path in files)
+        target = self.max_bytes * EVICTION_TARGET
+        files.sort()
+        for _mtime, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        with self._lock:
+            self._size = total
+
+    def _unlink(self, path: Path) -> None:
+        size = _file_size(path)
+        try:
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size = max(self._size - size, 0)
+
+
+def _entries(base: Path) -> Iterator[Path]:
+    if not base.is_dir():
+        return
+    for dirpath, _dirnames, filenames in os.walk(base):
+        for filename in filenames:
+            if not filename.startswith(".tmp-"):
+                yield Path(dirpath) / filename
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+_shared_disk_cache: DiskCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_disk_cache() -> DiskCache:
+    """Return the process-wide cache under ``CONFIG_DIR/cache``."""
+
+    global _shared_disk_cache
+    with _shared_lock:
+        if _shared_disk_cache is None:
+            _shared_disk_cache = DiskCache()
+        return _shared_disk_cache
@@ -1,10 +1,22 @@
 """Lightweight command registry used by the command palette."""
 from __future__ import annotations
 
+import heapq
+import math
+import re
+import time
 from dataclasses import dataclass, field, replace
-from difflib import SequenceMatcher
 from typing import Any, Callable, Iterable, List
 
+SCORE_SUBSTRING = 100.0
+SCORE_ACRONYM = 80.0
+SCORE_CHAR = 4.0
+BONUS_WORD_START = 6.0
+BONUS_CONSECUTIVE = 3.0
+FRECENCY_WEIGHT = 10.0
+FRECENCY_HALF_LIFE = 7 * 24 * 60 * 60
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
 
 @dataclass
 class CommandParameter:
@@ -39,36 +51,110 @@ class CommandDescriptor:
         return replace(self, arguments={**self.arguments, **kwargs})
 
 
+@dataclass
+class _IndexedCommand:
+    """Matching data precomputed when a command is registered."""
+
+    command: CommandDescriptor
+    order: int
+    haystack: str
+    acronym: str
+    word_starts: frozenset[int]
+
+
+def _index_command(command: CommandDescriptor, order: int) -> _IndexedCommand:
+    text = f"{command.id} {command.description}"
+    words = list(_WORD.finditer(text))
+    return _IndexedCommand(
+        command=command,
+        order=order,
+        haystack=text.lower(),
+        acronym="".join(match.group(0)[0] for match in words).lower(),
+        word_starts=frozenset(match.start() for match in words),
+    )
+
+
+def _match_score(query: str, entry: _IndexedCommand) -> float | None:
+    """Score ``entry`` for the lowercase ``query`` in a single pass."""
+
+    haystack = entry.haystack
+    index = haystack.find(query)
+    if index >= 0:
+        bonus = BONUS_WORD_START * 2 if index in entry.word_starts else 0.0
+        return SCORE_SUBSTRING + SCORE_CHAR * len(query) + bonus - index * 0.1
+    if entry.acronym.startswith(query):
+        return SCORE_ACRONYM + SCORE_CHAR * len(query)
+    score = 0.0
+    position = -1
+    for char in query:
+        found = haystack.find(char, position + 1)
+        if found < 0:
+            return None
+        score += SCORE_CHAR
+        if found == position + 1:
+            score += BONUS_CONSECUTIVE
+        if found in entry.word_starts:
+            score += BONUS_WORD_START
+        position = found
+    return score - position * 0.05
+
+
 class CommandRegistry:
     def __init__(self) -> None:
         self._commands: list[CommandDescriptor] = []
+        self._index: dict[str, _IndexedCommand] = {}
+        self._history: dict[str, tuple[int, float]] = {}
+        self._order = 0
         self._undo_stack: list[CommandDescriptor] = []
         self._redo_stack: list[CommandDescriptor] = []
 
     def register_command(self, command: CommandDescriptor) -> None:
-        self._commands = [cmd for cmd in self._commands if cmd.id != command.id]
+        if command.id in self._index:
+            self._commands = [cmd for cmd in self._commands if cmd.id != command.id]
         self._commands.append(command)
+        self._order += 1
+        self._index[command.id] = _index_command(command, self._order)
 
     def get(self, command_id: str) -> CommandDescriptor | None:
-        for cmd in self._commands:
-            if cmd.id == command_id:
-                return cmd
-        return None
-
-    def list_commands(self, filter_text: str | None = None) -> List[CommandDescriptor]:
-        if not filter_text:
-            return list(self._commands)
-
-        def _score(command: CommandDescriptor) -> float:
-            haystack = f"{command.id} {command.description}"
-            return SequenceMatcher(None, filter_text.lower(), haystack.lower()).ratio()
-
-        scored = [cmd for cmd in self._commands if _score(cmd) > 0.1]
-        scored.sort(key=_score, reverse=True)
-        return scored
+        entry = self._index.get(command_id)
+        return entry.command if entry else None
+
+    def list_commands(self, filter_text: str | None = None, limit: int | None = None) -> List[CommandDescriptor]:
+        """Return commands matching ``filter_text``, best first.
+
+        Matching uses the haystacks and acronyms precomputed at registration,
+        scores each command once and boosts frequently and recently executed
+        commands. With ``limit`` only the top results are selected.
+        """
+
+        query = "".join((filter_text or "").lower().split())
+        if not query:
+            commands = list(self._commands)
+            return commands[:limit] if limit is not None else commands
+
+        now = time.time()
+        scored: list[tuple[float, int, CommandDescriptor]] = []
+        for entry in self._index.values():
+            score = _match_score(query, entry)
+            if score is not None:
+                scored.append((score + self._frecency(entry.command.id, now), -entry.order, entry.command))
+        if limit is not None:
+            best = heapq.nlargest(limit, scored, key=lambda item: item[:2])
+        else:
+            best = sorted(scored, key=lambda item: item[:2], reverse=True)
+        return [command for _score, _order, command in best]
+
+    def _frecency(self, command_id: str, now: float) -> float:
+        entry = self._history.get(command_id)
+        if not entry:
+            return 0.0
+        count, last_run = entry
+        return FRECENCY_WEIGHT * math.log2(1 + count) * 0.5 ** ((now - last_run) / FRECENCY_HALF_LIFE)
 
     # Execution helpers -------------------------------------------------
     def execute(self, descriptor: CommandDescriptor) -> None:
+        count, _ = self._history.get(descriptor.id, (0, 0.0))
+        self._history[descriptor.id] = (count + 1, time.time())
         descriptor.callback(**descriptor.arguments)
         if descriptor.undo:
             self._undo_stack.append(descriptor)
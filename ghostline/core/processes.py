@@ -0,0 +1,221 @@
+"""Shared process pool for CPU-bound background work."""
+from __future__ import annotations
+
+import concurrent.futures
+import importlib
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping
+
+from ghostline.core import threads
+
+logger = logging.getLogger(__name__)
+
+# Worker crashes tolerated before the service stops starting new pools.
+MAX_RESTARTS = 3
+
+
+def default_process_count() -> int:
+    """Leave a core for the UI thread."""
+
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+@dataclass(frozen=True)
+class ProcessJob:
+    """Picklable description of one call to run in a worker process.
+
+    ``func`` must be importable by name (a module-level function) and the
+    arguments picklable; the job is pickled by reference to ``func``.
+    """
+
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+
+    def run(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+
+def _run_job(job: ProcessJob) -> Any:
+    return job.run()
+
+
+def _preload(modules: tuple[str, ...]) -> None:
+    for module in modules:
+        importlib.import_module(module)
+
+
+class ProcessWorkers:
+    """Lazily started pool of spawned worker processes behind ``submit(key, func, *args)``.
+
+    The pool starts on first use and its workers stay alive between jobs, so
+    every subsystem sharing the service pays the interpreter start-up once;
+    ``preload`` names modules each worker imports as it starts. Workers are
+    spawned rather than forked, since forking a process running Qt and other
+    threads is unsafe. A crashed worker only fails the jobs in flight (with
+    :class:`BrokenProcessPool`): the pool is replaced on the next submit,
+    until ``max_restarts`` crashes disable the service. While unavailable,
+    :meth:`submit` returns ``None`` and callers run the work themselves.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        preload: Iterable[str] = (),
+        max_restarts: int = MAX_RESTARTS,
+    ) -> None:
+        self.max_workers = max_workers or default_process_count()
+        self.preload = tuple(preload)
+        self.max_restarts = max_restarts
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._tasks: dict[Hashable, Future] = {}
+        self._restarts = 0
+        self._available = True
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        return self._available and not self._closed and not threads.SHUTTING_DOWN
+
+    @property
+    def started(self) -> bool:
+        return self._pool is not None
+
+    def submit(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future | None:
+        """Run ``func(*args, **kwargs)`` in a worker, cancelling a queued job with ``key``.
+
+        Returns ``None`` when the service is unavailable.
+        """
+
+        job = ProcessJob(func, args, kwargs)
+        with self._lock:
+            previous = self._tasks.pop(key, None)
+            if previous is not None:
+                previous.cancel()
+            while True:
+                pool = self._ensure_pool()
+                if pool is None:
+                    return None
+                try:
+                    future = pool.submit(_run_job, job)
+                    break
+                except (BrokenProcessPool, RuntimeError):
+                    # Broke before its crash was reported; replace it.
+                    self._discard(pool)
+            self._tasks[key] = future
+        future.add_done_callback(lambda done: self._finished(key, pool, done))
+        return future
+
+    def stream(
+        self, func: Callable[..., Any], argsets: Iterable[tuple], fallback: bool = True
+    ) -> Iterator[tuple[tuple, Any]]:
+        """Run ``func`` once per argument tuple and yield ``(args, result)`` as each completes.
+
+        Results come back through a queue in completion order. With
+        ``fallback`` a job the pool cannot run, or that fails because a
+        worker crashed, is run on the calling thread instead; other errors
+        propagate.
+        """
+
+        results: queue.SimpleQueue[tuple[tuple, Future | None]] = queue.SimpleQueue()
+        pending = 0
+        for args in argsets:
+            future = self.submit((id(results), pending), func, *args)
+            pending += 1
+            if future is None:
+                results.put((args, None))
+            else:
+                future.add_done_callback(lambda done, args=args: results.put((args, done)))
+        for _ in range(pending):
+            args, future = results.get()
+            if future is not None:
+                try:
+                    yield args, future.result()
+                    continue
+                except (BrokenProcessPool, concurrent.futures.CancelledError):
+                    if not fallback:
+                        raise
+            elif not fallback:
+                raise BrokenProcessPool("Process workers are unavailable")
+            yield args, func(*args)
+
+    def warm(self) -> None:
+        """Start the pool and spawn every worker now rather than on first use."""
+
+        futures = [self.submit(("warm", index), os.getpid) for index in range(self.max_workers)]
+        concurrent.futures.wait([future for future in futures if future is not None])
+
+    def cancel(self, key: Hashable) -> None:
+        with self._lock:
+            future = self._tasks.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+            self._tasks.clear()
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    # Internal ---------------------------------------------------------
+    def _ensure_pool(self) -> ProcessPoolExecutor | None:
+        if not self.available:
+            return None
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_preload if self.preload else None,
+                    initargs=(self.preload,) if self.preload else (),
+                )
+            except (OSError, ValueError, NotImplementedError):
+                logger.warning("Process pool unavailable; running CPU work in-process", exc_info=True)
+                self._available = False
+        return self._pool
+
+    def _finished(self, key: Hashable, pool: ProcessPoolExecutor, future: Future) -> None:
+        broken = not future.cancelled() and isinstance(future.exception(), BrokenProcessPool)
+        with self._lock:
+            if self._tasks.get(key) is future:
+                del self._tasks[key]
+            if broken:
+                self._discard(pool)
+
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool, counting the crash; called with the lock held."""
+
+        if self._pool is not pool:
+            return
+        self._pool = None
+        self._restarts += 1
+        if self._restarts > self.max_restarts:
+            logger.warning("Worker processes crashed %d times; running CPU work in-process", self._restarts)
+            self._available = False
+        else:
+            logger.warning("A worker process crashed; restarting the pool on next use")
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_processes: ProcessWorkers | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_process_workers() -> ProcessWorkers:
+    """Return the process-wide pool used by default for CPU-bound jobs."""
+
+    global _shared_processes
+    with _shared_lock:
+        if _shared_processes is None:
+            _shared_processes = ProcessWorkers()
+        return _shared_processes
@@ -2,51 +2,390 @@
 from __future__ import annotations
 
 import concurrent.futures
+import itertools
 import logging
+import threading
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Mapping
 
 SHUTTING_DOWN = False
 
 logger = logging.getLogger(__name__)
 
+# Lanes in priority order.
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BACKGROUND = "background"
+LANES = (INTERACTIVE, NORMAL, BACKGROUND)
 
-class BackgroundWorkers:
-    """Shared thread pool for non-UI tasks."""
+# Concurrent tasks per lane; the pool has a thread for each slot, so a busy
+# background lane never delays interactive work.
+DEFAULT_LANE_LIMITS = {INTERACTIVE: 2, NORMAL: 4, BACKGROUND: 2}
 
-    def __init__(self, max_workers: int | None = None) -> None:
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
-        self._tasks: dict[str, concurrent.futures.Future] = {}
 
-    def submit(self, key: str, func: Callable, *args, **kwargs) -> concurrent.futures.Future:
-        global SHUTTING_DOWN
-        if SHUTTING_DOWN:
-            return None  # type: ignore[return-value]
-        self.cancel(key)
-        try:
-            future = self._executor.submit(func, *args, **kwargs)
-        except RuntimeError:
-            return None  # type: ignore[return-value]
-        self._tasks[key] = future
-        return future
+class TaskCancelled(Exception):
+    """Raised by :meth:`CancellationToken.raise_if_cancelled`."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag handed to every scheduled task.
+
+    A task is cancelled when a newer submission supersedes its key, when its
+    lane is shut down or once its deadline passes. Long-running work should
+    check :attr:`cancelled` (via :func:`current_token`) and return early.
+    """
+
+    __slots__ = ("_event", "deadline")
+
+    def __init__(self, deadline: float | None = None) -> None:
+        self._event = threading.Event()
+        # ``time.monotonic()`` value after which the task counts as cancelled.
+        self.deadline = deadline
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or self.expired
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline, or ``None`` without one."""
+
+        return None if self.deadline is None else max(self.deadline - time.monotonic(), 0.0)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise TaskCancelled()
+
+
+_current = threading.local()
 
-    def cancel(self, key: str) -> None:
-        future = self._tasks.pop(key, None)
-        if future and not future.done():
-            future.cancel()
+
+def current_token() -> CancellationToken | None:
+    """Return the token of the scheduled task running on this thread, if any."""
+
+    return getattr(_current, "token", None)
+
+
+@dataclass(eq=False)
+class _Task:
+    key: Hashable
+    lane: str
+    func: Callable
+    args: tuple
+    kwargs: dict
+    owner: TaskLane | None
+    token: CancellationToken
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+
+
+class TaskScheduler:
+    """Thread pool with priority lanes, key coalescing and deadlines.
+
+    Each lane runs at most its limit of tasks at once and the pool has a
+    thread for every slot, so interactive work never queues behind bulk
+    indexing. Submitting a key that is still queued or running supersedes
+    the older task: a queued one is dropped and a running one has its
+    :class:`CancellationToken` cancelled. A task still queued at its deadline
+    fails with :class:`TimeoutError` as soon as the deadline passes, even
+    when its lane is full; a running one sees its token expire.
+    """
+
+    def __init__(self, lane_limits: Mapping[str, int] | None = None) -> None:
+        self._limits = {**DEFAULT_LANE_LIMITS, **(lane_limits or {})}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=sum(self._limits.values()), thread_name_prefix="ghostline-task"
+        )
+        self._lock = threading.RLock()
+        self._queues: dict[str, deque[_Task]] = {lane: deque() for lane in LANES}
+        self._running: dict[str, int] = {lane: 0 for lane in LANES}
+        # Latest task per key, queued or running.
+        self._tasks: dict[Hashable, _Task] = {}
+        self._closed = False
+        # Fires at the earliest deadline of a queued task.
+        self._expiry_timer: threading.Timer | None = None
+        self._expiry_at: float | None = None
+
+    def submit(
+        self,
+        key: Hashable,
+        func: Callable,
+        *args: Any,
+        lane: str = NORMAL,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        """Queue ``func(*args, **kwargs)`` on ``lane``, superseding any task with ``key``.
+
+        ``timeout`` is relative to now; ``deadline`` is a ``time.monotonic()``
+        value. Once the scheduler is shutting down the returned future is
+        already cancelled and ``func`` never runs.
+        """
+
+        return self._submit(key, func, args, kwargs, lane, None, timeout, deadline)
+
+    def lane(self, name: str = NORMAL, limit: int | None = None) -> TaskLane:
+        """Return a handle submitting to lane ``name`` with its own key space.
+
+        ``limit`` caps how many of the handle's own tasks run at once, e.g. 1
+        for work that must not overlap with itself.
+        """
+
+        if name not in self._queues:
+            raise ValueError(f"Unknown lane: {name}")
+        return TaskLane(self, name, limit)
+
+    def cancel(self, key: Hashable) -> None:
+        with self._lock:
+            task = self._tasks.pop(key, None)
+        if task is not None:
+            _supersede(task)
 
     def shutdown(self, wait: bool = False) -> None:
-        global SHUTTING_DOWN
-        SHUTTING_DOWN = True
-        for key, future in list(self._tasks.items()):
-            if not future.done():
-                future.cancel()
-            self._tasks.pop(key, None)
+        with self._lock:
+            self._closed = True
+            tasks = list(self._tasks.values())
+            self._tasks.clear()
+            for queue in self._queues.values():
+                tasks.extend(queue)
+                queue.clear()
+            if self._expiry_timer is not None:
+                self._expiry_timer.cancel()
+                self._expiry_timer = None
+        for task in tasks:
+            _supersede(task)
         try:
             self._executor.shutdown(wait=wait, cancel_futures=True)
         except TypeError:
             self._executor.shutdown(wait=wait)
 
+    # Internal ---------------------------------------------------------
+    def _submit(
+        self,
+        key: Hashable,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        lane: str,
+        owner: TaskLane | None,
+        timeout: float | None,
+        deadline: float | None,
+    ) -> concurrent.futures.Future:
+        if SHUTTING_DOWN or self._closed:
+            future: concurrent.futures.Future = concurrent.futures.Future()
+            future.cancel()
+            return future
+        if lane not in self._queues:
+            raise ValueError(f"Unknown lane: {lane}")
+        if timeout is not None:
+            expiry = time.monotonic() + timeout
+            deadline = expiry if deadline is None else min(deadline, expiry)
+        task = _Task(key, lane, func, args, kwargs, owner, CancellationToken(deadline))
+        with self._lock:
+            previous = self._tasks.get(key)
+            if previous is not None:
+                _supersede(previous)
+            self._tasks[key] = task
+            self._queues[lane].append(task)
+            ready = self._take_ready()
+            if task not in ready:
+                self._arm_expiry(deadline)
+        self._start(ready)
+        return task.future
+
+    def _take_ready(self) -> list[_Task]:
+        """Claim every queued task a free slot allows, highest lane first."""
+
+        ready: list[_Task] = []
+        for lane in LANES:
+            queue = self._queues[lane]
+            while queue and self._running[lane] < self._limits[lane]:
+                task = self._next(queue)
+                if task is None:
+                    break
+                self._running[lane] += 1
+                if task.owner is not None:
+                    task.owner._running += 1
+                ready.append(task)
+        return ready
+
+    def _next(self, queue: deque[_Task]) -> _Task | None:
+        """Pop the first runnable task, dropping cancelled and expired ones on the way."""
+
+        blocked: list[_Task] = []
+        chosen = None
+        while queue:
+            task = queue.popleft()
+            if task.future.cancelled():
+                continue
+            if task.token.expired:
+                self._expire(task)
+                continue
+            owner = task.owner
+            if owner is not None and owner.limit is not None and owner._running >= owner.limit:
+                blocked.append(task)
+                continue
+            chosen = task
+            break
+        queue.extendleft(reversed(blocked))
+        return chosen
+
+    def _expire(self, task: _Task) -> None:
+        """Fail a queued ``task`` whose deadline passed; called with the lock held."""
+
+        if self._tasks.get(task.key) is task:
+            del self._tasks[task.key]
+        if task.future.set_running_or_notify_cancel():
+            task.future.set_exception(TimeoutError(f"Task {task.key!r} missed its deadline"))
+
+    def _arm_expiry(self, deadline: float | None) -> None:
+        """Make the expiry timer fire by ``deadline``; called with the lock held.
+
+        The timer only ever moves earlier here. When it fires it sweeps the
+        queues and re-arms for the earliest deadline still queued, so tasks
+        that started or were superseded meanwhile cost nothing.
+        """
+
+        if deadline is None or self._closed:
+            return
+        if self._expiry_at is not None and self._expiry_at <= deadline:
+            return
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+        self._expiry_at = deadline
+        self._expiry_timer = threading.Timer(max(deadline - time.monotonic(), 0.0), self._expire_queued)
+        self._expiry_timer.daemon = True
+        self._expiry_timer.start()
+
+    def _expire_queued(self) -> None:
+        with self._lock:
+            self._expiry_at = None
+            self._expiry_timer = None
+            pending: list[float] = []
+            for queue in self._queues.values():
+                for task in list(queue):
+                    if task.token.expired:
+                        queue.remove(task)
+                        self._expire(task)
+                    elif task.token.deadline is not None and not task.future.done():
+                        pending.append(task.token.deadline)
+            self._arm_expiry(min(pending, default=None))
+
+    def _start(self, ready: list[_Task]) -> None:
+        for task in ready:
+            try:
+                self._executor.submit(self._run, task)
+            except RuntimeError:
+                task.future.cancel()
+                self._finish(task)
+
+    def _run(self, task: _Task) -> None:
+        try:
+            if not task.future.set_running_or_notify_cancel():
+                return
+            _current.token = task.token
+            try:
+                result = task.func(*task.args, **task.kwargs)
+            except BaseException as exc:  # noqa: BLE001 - delivered through the future
+                task.future.set_exception(exc)
+            else:
+                task.future.set_result(result)
+            finally:
+                _current.token = None
+        finally:
+            self._finish(task)
+
+    def _finish(self, task: _Task) -> None:
+        with self._lock:
+            self._running[task.lane] -= 1
+            if task.owner is not None:
+                task.owner._running -= 1
+            if self._tasks.get(task.key) is task:
+                del self._tasks[task.key]
+            ready = self._take_ready()
+        self._start(ready)
+
+
+def _supersede(task: _Task) -> None:
+    task.token.cancel()
+    task.future.cancel()
+
+
+class TaskLane:
+    """Handle on one lane of a :class:`TaskScheduler`.
+
+    Offers the ``submit(key, func, *args)`` interface of
+    :class:`BackgroundWorkers`. Keys are private to the handle, so services
+    sharing a scheduler cannot supersede each other's tasks, and
+    :meth:`shutdown` only cancels this handle's work.
+    """
+
+    _ids = itertools.count()
+
+    def __init__(self, scheduler: TaskScheduler, lane: str, limit: int | None = None) -> None:
+        self.scheduler = scheduler
+        self.lane = lane
+        self.limit = limit
+        self._id = next(self._ids)
+        # Maintained by the scheduler under its lock.
+        self._running = 0
+
+    def submit(
+        self,
+        key: Hashable,
+        func: Callable,
+        *args: Any,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        return self.scheduler._submit((self._id, key), func, args, kwargs, self.lane, self, timeout, deadline)
+
+    def cancel(self, key: Hashable) -> None:
+        self.scheduler.cancel((self._id, key))
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self.scheduler._lock:
+            tasks = [task for task in self.scheduler._tasks.values() if task.owner is self]
+        for task in tasks:
+            self.scheduler.cancel(task.key)
+        if wait:
+            concurrent.futures.wait([task.future for task in tasks])
+
+
+class BackgroundWorkers(TaskScheduler):
+    """Private scheduler whose ``submit`` defaults to the normal lane.
+
+    ``max_workers`` limits the normal lane; prefer a :func:`shared_scheduler`
+    lane for new code.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        super().__init__({NORMAL: max_workers} if max_workers else None)
+
+
+_shared_scheduler: TaskScheduler | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler() -> TaskScheduler:
+    """Return the process-wide scheduler used by default by every service."""
+
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = TaskScheduler()
+        return _shared_scheduler
+
 
 class WorkerPool:
     def __init__(self, max_workers: int = 4):
@@ -1,6 +1,7 @@
 """Workspace indexing utilities."""
 
 from ghostline.indexer.index_manager import IndexManager
+from ghostline.indexer.pipeline import IndexingPipeline
 from ghostline.indexer.workspace_indexer import IndexedFile, WorkspaceIndexer
 
-__all__ = ["IndexManager", "IndexedFile", "WorkspaceIndexer"]
+__all__ = ["IndexManager", "IndexedFile", "IndexingPipeline", "WorkspaceIndexer"]
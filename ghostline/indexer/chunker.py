@@ -0,0 +1,186 @@
+"""Split source files into retrieval-sized chunks."""
+from __future__ import annotations
+
+import ast
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+DEFAULT_MAX_CHUNK_LINES = 80
+MIN_CHUNK_LINES = 3
+
+_DECLARATION_RE = re.compile(
+    r"\b(?:def|class|function|fn|func|struct|interface|impl|enum|trait|type|module)\s+([A-Za-z_][A-Za-z0-9_]*)"
+)
+_CLOSING_PREFIXES = ("}", ")", "]", "end")
+# Boundaries ``str.splitlines`` breaks on but Python's tokenizer does not.
+_EXTRA_BREAKS_RE = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@dataclass(frozen=True, slots=True)
+class CodeChunk:
+    """A contiguous range of lines with its own retrieval identity."""
+
+    start_line: int
+    end_line: int
+    kind: str
+    name: str
+    symbols: tuple[str, ...] = ()
+
+    @property
+    def line_count(self) -> int:
+        return self.end_line - self.start_line + 1
+
+
+def chunk_source(path: Path, text: str, *, max_lines: int = DEFAULT_MAX_CHUNK_LINES) -> list[CodeChunk]:
+    """Split ``text`` into function/class/top-level-block chunks.
+
+    Python files are split along their AST; anything else (or Python that
+    does not parse) falls back to indentation-delimited blocks. Chunks longer
+    than ``max_lines`` are cut into windows so no single hit dominates a
+    prompt.
+    """
+
+    lines = text.splitlines()
+    if not lines:
+        return []
+    chunks: list[CodeChunk] | None = None
+    if path.suffix == ".py":
+        chunks = _python_chunks(text, lines, max_lines)
+    if chunks is None:
+        chunks = _indentation_chunks(lines)
+    return [piece for chunk in chunks for piece in _split_long(chunk, max_lines)]
+
+
+def _defined_names(node: ast.AST) -> tuple[str, ...]:
+    names = [
+        child.name
+        for child in ast.walk(node)
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    ]
+    return tuple(dict.fromkeys(names))
+
+
+def _python_chunks(text: str, lines: list[str], max_lines: int) -> list[CodeChunk] | None:
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return None
+
+    chunks: list[CodeChunk] = []
+    cursor = 1
+    starts = _splitline_starts(text)
+
+    def _span(node: ast.AST, first: int) -> tuple[int, int]:
+        """Map AST line numbers onto ``lines``, which ``str.splitlines`` produced."""
+
+        last = node.end_lineno or node.lineno
+        if starts is None:
+            return first, last
+        return starts[first - 1], min(starts[last] - 1, len(lines))
+
+    def _flush_block(until: int) -> None:
+        nonlocal cursor
+        if until >= cursor and any(line.strip() for line in lines[cursor - 1 : until]):
+            chunks.append(CodeChunk(cursor, until, "block", "module" if cursor == 1 else "block"))
+        cursor = until + 1
+
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        first = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+        start, end = _span(node, first)
+        _flush_block(start - 1)
+        kind = "class" if isinstance(node, ast.ClassDef) else "function"
+        if kind == "class" and end - start + 1 > max_lines:
+            chunks.extend(_class_member_chunks(node, start, end, lines, _span))
+        else:
+            chunks.append(CodeChunk(start, end, kind, node.name, _defined_names(node)))
+        cursor = end + 1
+    _flush_block(len(lines))
+    return chunks
+
+
+def _splitline_starts(text: str) -> list[int] | None:
+    """Return the ``str.splitlines`` line on which each source line starts.
+
+    ``None`` when both agree, which is the case unless the text contains a
+    form feed or another break the tokenizer treats as ordinary whitespace.
+    """
+
+    if not _EXTRA_BREAKS_RE.search(text):
+        return None
+    starts = [1]
+    for physical in re.split(r"\r\n|\r|\n", text):
+        starts.append(starts[-1] + len(_EXTRA_BREAKS_RE.findall(physical)) + 1)
+    return starts
+
+
+def _class_member_chunks(
+    node: ast.ClassDef,
+    start: int,
+    end: int,
+    lines: list[str],
+    span: Callable[[ast.AST, int], tuple[int, int]],
+) -> list[CodeChunk]:
+    chunks: list[CodeChunk] = []
+    cursor = start
+
+    def _has_code(first: int, last: int) -> bool:
+        return any(line.strip() for line in lines[first - 1 : last])
+
+    for member in node.body:
+        if not isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        member_start, member_end = span(
+            member, min([member.lineno] + [decorator.lineno for decorator in member.decorator_list])
+        )
+        if member_start > cursor and _has_code(cursor, member_start - 1):
+            chunks.append(CodeChunk(cursor, member_start - 1, "class", node.name, (node.name,)))
+        qualified = f"{node.name}.{member.name}"
+        chunks.append(CodeChunk(member_start, member_end, "method", qualified, (node.name, member.name)))
+        cursor = member_end + 1
+    if cursor <= end and _has_code(cursor, end):
+        chunks.append(CodeChunk(cursor, end, "class", node.name, (node.name,)))
+    return chunks
+
+
+def _indentation_chunks(lines: list[str]) -> list[CodeChunk]:
+    starts: list[int] = [0]
+    previous_blank = False
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            previous_blank = True
+            continue
+        top_level = not line[0].isspace()
+        if (
+            index
+            and top_level
+            and previous_blank
+            and not stripped.startswith(_CLOSING_PREFIXES)
+            and index - starts[-1] >= MIN_CHUNK_LINES
+        ):
+            starts.append(index)
+        previous_blank = False
+
+    chunks: list[CodeChunk] = []
+    for position, start in enumerate(starts):
+        end = starts[position + 1] if position + 1 < len(starts) else len(lines)
+        header = next((line for line in lines[start:end] if line.strip()), "")
+        match = _DECLARATION_RE.search(header)
+        name = match.group(1) if match else "block"
+        symbols = tuple(dict.fromkeys(m.group(1) for line in lines[start:end] for m in _DECLARATION_RE.finditer(line)))
+        chunks.append(CodeChunk(start + 1, end, "block", name, symbols))
+    return chunks
+
+
+def _split_long(chunk: CodeChunk, max_lines: int) -> list[CodeChunk]:
+    if chunk.line_count <= max_lines:
+        return [chunk]
+    pieces: list[CodeChunk] = []
+    for start in range(chunk.start_line, chunk.end_line + 1, max_lines):
+        end = min(start + max_lines - 1, chunk.end_line)
+        pieces.append(CodeChunk(start, end, chunk.kind, chunk.name, chunk.symbols))
+    return pieces
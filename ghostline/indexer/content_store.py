@@ -0,0 +1,122 @@
+"""Memory-bounded storage for indexed file contents."""
+from __future__ import annotations
+
+import mmap
+import re
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CONTENT_BUDGET = 32 * 1024 * 1024
+
+
+# UTF-8 encodings of every boundary ``str.splitlines`` recognises.
+_LINE_BREAK_RE = re.compile(rb"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+
+def line_offsets(data: bytes) -> array:
+    """Return the byte offset at which every line of UTF-8 ``data`` starts.
+
+    Lines break wherever ``str.splitlines`` breaks them, so the offsets agree
+    with line numbers computed from the decoded text.
+    """
+
+    offsets = array("I", [0])
+    offsets.extend(match.end() for match in _LINE_BREAK_RE.finditer(data))
+    return offsets
+
+
+def read_byte_range(path: Path, start: int, end: int | None = None) -> bytes:
+    """Read ``[start, end)`` from ``path`` through a read-only memory map."""
+
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return b""
+        with mapped:
+            return mapped[start:end]
+
+
+class ContentStore:
+    """Compressed LRU tier in front of the filesystem.
+
+    Only recently used contents stay resident, zlib-compressed, within
+    ``budget_bytes``; everything else is re-read from disk on demand. Range
+    reads go straight to a memory map so previews never decode whole files.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_CONTENT_BUDGET, *, compress_level: int = 1) -> None:
+        self.budget_bytes = budget_bytes
+        self.compress_level = compress_level
+        self._entries: OrderedDict[Path, bytes] = OrderedDict()
+        self._resident_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._resident_bytes
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._entries
+
+    def put(self, path: Path, data: bytes) -> None:
+        """Keep ``data`` hot for ``path`` if it fits within the budget."""
+
+        compressed = zlib.compress(data, self.compress_level)
+        with self._lock:
+            self._discard_locked(path)
+            if len(compressed) > self.budget_bytes:
+                return
+            self._entries[path] = compressed
+            self._resident_bytes += len(compressed)
+            while self._resident_bytes > self.budget_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._resident_bytes -= len(evicted)
+
+    def read_bytes(self, path: Path) -> bytes:
+        with self._lock:
+            compressed = self._entries.get(path)
+            if compressed is not None:
+                self._entries.move_to_end(path)
+        if compressed is not None:
+            return zlib.decompress(compressed)
+        data = path.read_bytes()
+        self.put(path, data)
+        return data
+
+    def read_text(self, path: Path) -> str:
+        try:
+            return self.read_bytes(path).decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return ""
+
+    def read_range(self, path: Path, start: int, end: int | None = None) -> str:
+        """Decode the byte range ``[start, end)`` of ``path``."""
+
+        with self._lock:
+            compressed = self._entries.get(path)
+        try:
+            if compressed is not None:
+                data = zlib.decompress(compressed)[start:end]
+            else:
+                data = read_byte_range(path, start, end)
+        except OSError:
+            return ""
+        return data.decode("utf-8", errors="ignore")
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self._discard_locked(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+
+    def _discard_locked(self, path: Path) -> None:
+        previous = self._entries.pop(path, None)
+        if previous is not None:
+            self._resident_bytes -= len(previous)
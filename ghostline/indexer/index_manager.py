@@ -4,15 +4,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable
 
-from ghostline.core.threads import BackgroundWorkers
+from ghostline.core.threads import BACKGROUND, TaskLane, shared_scheduler
 
 
 class IndexManager:
     """Coordinates indexing and search tasks in the background."""
 
-    def __init__(self, workspace_provider, workers: BackgroundWorkers | None = None) -> None:
+    def __init__(self, workspace_provider, workers: TaskLane | None = None) -> None:
         self.workspace_provider = workspace_provider
-        self.workers = workers or BackgroundWorkers()
+        self.workers = workers or shared_scheduler().lane(BACKGROUND)
         self._observers: list[callable[[Path], None]] = []
 
     def register_observer(self, callback) -> None:
@@ -0,0 +1,110 @@
+"""On-disk persistence for the workspace index."""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Mapping
+
+from ghostline.core.logging import get_logger
+from ghostline.indexer.chunker import CodeChunk
+
+logger = get_logger(__name__)
+
+INDEX_DIR = ".ghostline/index"
+INDEX_FILENAME = "workspace_index.json.gz"
+INDEX_FORMAT_VERSION = 2
+
+
+@dataclass
+class FileRecord:
+    """Persisted metadata for a single indexed file."""
+
+    mtime: float
+    size: int
+    digest: str
+    symbols: tuple[str, ...] = ()
+    tokens: dict[str, int] = field(default_factory=dict)
+    chunks: tuple[CodeChunk, ...] = ()
+    chunk_tokens: tuple[dict[str, int], ...] = ()
+
+
+class IndexStore:
+    """Load and save the workspace index manifest under the workspace metadata dir.
+
+    Paths are stored relative to the workspace root so the snapshot survives a
+    project being moved. Writes go through a temporary file and ``os.replace``
+    so a crash mid-save never leaves a truncated index behind.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / INDEX_DIR / INDEX_FILENAME
+
+    def load(self) -> dict[Path, FileRecord]:
+        if not self.path.exists():
+            return {}
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, EOFError, ValueError):
+            logger.warning("Discarding unreadable workspace index at %s", self.path)
+            return {}
+        if payload.get("version") != INDEX_FORMAT_VERSION:
+            logger.info("Workspace index format changed; rebuilding from scratch")
+            return {}
+
+        records: dict[Path, FileRecord] = {}
+        for relative, entry in payload.get("files", {}).items():
+            try:
+                chunk_entries = entry.get("chunks", ())
+                records[self.root / relative] = FileRecord(
+                    mtime=float(entry["mtime"]),
+                    size=int(entry["size"]),
+                    digest=str(entry["digest"]),
+                    symbols=tuple(entry.get("symbols", ())),
+                    tokens=dict(entry.get("tokens", {})),
+                    chunks=tuple(
+                        CodeChunk(int(start), int(end), str(kind), str(name), tuple(symbols))
+                        for start, end, kind, name, symbols, _tokens in chunk_entries
+                    ),
+                    chunk_tokens=tuple(dict(chunk[5]) for chunk in chunk_entries),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return records
+
+    def save(self, records: Mapping[Path, FileRecord]) -> None:
+        files: dict[str, dict] = {}
+        for path, record in records.items():
+            try:
+                relative = path.relative_to(self.root).as_posix()
+            except ValueError:
+                continue
+            files[relative] = {
+                "mtime": record.mtime,
+                "size": record.size,
+                "digest": record.digest,
+                "symbols": list(record.symbols),
+                "tokens": record.tokens,
+                "chunks": [
+                    [chunk.start_line, chunk.end_line, chunk.kind, chunk.name, list(chunk.symbols), tokens]
+                    for chunk, tokens in zip(record.chunks, record.chunk_tokens)
+                ],
+            }
+
+        payload = {"version": INDEX_FORMAT_VERSION, "files": files}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=3) as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            logger.warning("Unable to persist workspace index to %s", self.path, exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
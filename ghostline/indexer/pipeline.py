@@ -0,0 +1,194 @@
+"""Debounced, batched delivery of filesystem events to the indexers."""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Mapping, Protocol, Sequence
+
+from ghostline.core.logging import get_logger
+from ghostline.core.threads import BACKGROUND, TaskLane, shared_scheduler
+
+logger = get_logger(__name__)
+
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+ChangeSet = dict[Path, str]
+
+
+class ChangeTarget(Protocol):
+    def apply_changes(self, changes: Mapping[Path, str]) -> None: ...
+
+
+def merge_event(previous: str | None, event_type: str) -> str | None:
+    """Fold ``event_type`` into the pending event for a path.
+
+    Returns ``None`` when the two cancel out (a file created and deleted
+    within the same window never needs indexing).
+    """
+
+    if previous is None:
+        return event_type
+    if previous == CREATED:
+        return None if event_type == DELETED else CREATED
+    if previous == DELETED:
+        return MODIFIED if event_type in (CREATED, MODIFIED) else DELETED
+    return DELETED if event_type == DELETED else MODIFIED
+
+
+class EventCoalescer:
+    """Collect per-path events and fire ``callback`` once a burst settles.
+
+    Each new event pushes the flush back by ``debounce`` seconds, but a burst
+    is never held longer than ``max_delay`` so a long-running checkout still
+    produces progress.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], None],
+        *,
+        debounce: float = 0.25,
+        max_delay: float = 2.0,
+    ) -> None:
+        self.callback = callback
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._pending: ChangeSet = {}
+        self._first_event: float | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def add(self, event_type: str, path: Path | str) -> None:
+        resolved = Path(path)
+        with self._lock:
+            merged = merge_event(self._pending.get(resolved), event_type)
+            if merged is None:
+                self._pending.pop(resolved, None)
+            else:
+                self._pending[resolved] = merged
+            now = time.monotonic()
+            if self._first_event is None:
+                self._first_event = now
+            delay = min(self.debounce, max(0.0, self._first_event + self.max_delay - now))
+            self._restart_timer_locked(delay)
+
+    def take(self) -> ChangeSet:
+        """Return and clear everything collected so far."""
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._first_event = None
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        return pending
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._first_event = None
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+    def _restart_timer_locked(self, delay: float) -> None:
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._fire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.callback()
+        except Exception:  # noqa: BLE001
+            logger.exception("Event coalescer callback failed")
+
+
+class IndexingPipeline:
+    """Route watcher events to every index in coalesced, de-duplicated batches.
+
+    Events are folded per path (see :func:`merge_event`); once a burst settles
+    the whole change set is applied to each target with ``apply_changes`` on a
+    single background task, and subscribers receive one notification per
+    batch.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[ChangeTarget],
+        *,
+        workers: TaskLane | None = None,
+        debounce: float = 0.25,
+        max_delay: float = 2.0,
+    ) -> None:
+        self.targets = list(targets)
+        self.workers = workers or shared_scheduler().lane(BACKGROUND, limit=1)
+        self._coalescer = EventCoalescer(self._schedule, debounce=debounce, max_delay=max_delay)
+        self._subscribers: list[Callable[[ChangeSet], None]] = []
+        self._apply_lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[ChangeSet], None]) -> Callable[[], None]:
+        """Receive each applied change set; returns an unsubscribe function."""
+
+        self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def handle_file_event(self, event_type: str, path: Path | str) -> None:
+        self._coalescer.add(event_type, path)
+
+    def file_created(self, path: Path | str) -> None:
+        self.handle_file_event(CREATED, path)
+
+    def file_modified(self, path: Path | str) -> None:
+        self.handle_file_event(MODIFIED, path)
+
+    def file_deleted(self, path: Path | str) -> None:
+        self.handle_file_event(DELETED, path)
+
+    def flush(self) -> None:
+        """Apply pending events now on the calling thread."""
+
+        self._drain()
+
+    def cancel(self) -> None:
+        self._coalescer.cancel()
+
+    def shutdown(self) -> None:
+        self._coalescer.cancel()
+        self.workers.shutdown()
+
+    def _schedule(self) -> None:
+        # A pending drain that has not started yet is replaced, which is fine:
+        # the change set lives in the coalescer until a drain takes it.
+        self.workers.submit("indexing-pipeline", self._drain)
+
+    def _drain(self) -> None:
+        with self._apply_lock:
+            changes = self._coalescer.take()
+            if not changes:
+                return
+            logger.debug("Applying %d coalesced file changes", len(changes))
+            for target in self.targets:
+                try:
+                    target.apply_changes(changes)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Failed to apply file changes to %s", type(target).__name__)
+            for callback in list(self._subscribers):
+                try:
+                    callback(changes)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Indexing pipeline subscriber failed")
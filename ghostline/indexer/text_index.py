@@ -0,0 +1,106 @@
+"""Inverted index with BM25 ranking for workspace retrieval."""
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+from typing import Generic, Hashable, Iterable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class InvertedIndex(Generic[K]):
+    """Term → posting list index scored with Okapi BM25.
+
+    Documents are identified by any hashable key and described by a
+    term-frequency mapping. Queries only touch the posting lists of their own
+    terms, so latency scales with the number of matching postings rather than
+    with the size of the workspace.
+    """
+
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[K, int]] = {}
+        self._doc_terms: dict[K, tuple[str, ...]] = {}
+        self._doc_lengths: dict[K, int] = {}
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._doc_lengths
+
+    def add(self, key: K, term_counts: Mapping[str, int]) -> None:
+        """Index ``key`` with ``term_counts``, replacing any previous postings."""
+
+        with self._lock:
+            self._remove_locked(key)
+            length = 0
+            for term, count in term_counts.items():
+                if count <= 0:
+                    continue
+                self._postings.setdefault(term, {})[key] = count
+                length += count
+            self._doc_terms[key] = tuple(term for term, count in term_counts.items() if count > 0)
+            self._doc_lengths[key] = length
+            self._total_length += length
+
+    def remove(self, key: K) -> None:
+        with self._lock:
+            self._remove_locked(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0
+
+    def term_counts(self, key: K) -> dict[str, int]:
+        """Reconstruct the term-frequency mapping stored for ``key``."""
+
+        with self._lock:
+            return {term: self._postings[term][key] for term in self._doc_terms.get(key, ())}
+
+    def search(self, terms: Iterable[str], limit: int = 10) -> list[tuple[float, K]]:
+        """Return up to ``limit`` ``(score, key)`` pairs ordered by BM25 score."""
+
+        unique_terms = list(dict.fromkeys(terms))
+        if not unique_terms or limit <= 0:
+            return []
+
+        with self._lock:
+            total_docs = len(self._doc_lengths)
+            if not total_docs:
+                return []
+            avg_length = self._total_length / total_docs or 1.0
+            scores: dict[K, float] = {}
+            for term in unique_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1.0 + (total_docs - df + 0.5) / (df + 0.5))
+                for key, tf in postings.items():
+                    norm = self.k1 * (1.0 - self.b + self.b * self._doc_lengths[key] / avg_length)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, key) for key, score in top]
+
+    # Internal ---------------------------------------------------------
+    def _remove_locked(self, key: K) -> None:
+        terms = self._doc_terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(key, 0)
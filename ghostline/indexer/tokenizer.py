@@ -0,0 +1,44 @@
+"""Identifier-aware tokenisation shared by the workspace indexes."""
+from __future__ import annotations
+
+import re
+from collections import Counter
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+MIN_TOKEN_LENGTH = 3
+
+
+def _subwords(identifier: str) -> list[str]:
+    parts: list[str] = []
+    for chunk in identifier.split("_"):
+        if chunk:
+            parts.extend(_CAMEL_RE.findall(chunk))
+    return parts
+
+
+def tokenize(text: str) -> list[str]:
+    """Split ``text`` into lowercase identifier tokens.
+
+    Compound identifiers (``snake_case`` or ``CamelCase``) yield the full
+    identifier followed by each of their sub-words so that partial queries
+    such as ``indexer`` still hit ``WorkspaceIndexer``.
+    """
+
+    tokens: list[str] = []
+    for match in _IDENTIFIER_RE.finditer(text):
+        identifier = match.group(0)
+        lowered = identifier.lower()
+        if len(lowered) >= MIN_TOKEN_LENGTH:
+            tokens.append(lowered)
+        parts = _subwords(identifier)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts if len(part) >= MIN_TOKEN_LENGTH)
+    return tokens
+
+
+def term_counts(text: str) -> dict[str, int]:
+    """Return a term-frequency map for ``text``."""
+
+    return dict(Counter(tokenize(text)))
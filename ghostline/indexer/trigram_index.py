@@ -0,0 +1,220 @@
+"""Trigram posting lists used to narrow substring and regex searches."""
+from __future__ import annotations
+
+import re
+import threading
+from array import array
+from typing import Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+def trigrams(data: bytes) -> set[int]:
+    """Return the ASCII-lowercased byte trigrams of ``data`` packed into ints."""
+
+    lowered = data.lower()
+    return {(a << 16) | (b << 8) | c for a, b, c in set(zip(lowered, lowered[1:], lowered[2:]))}
+
+
+def literal_trigrams(literal: str) -> set[int]:
+    """Trigrams every match of ``literal`` must contain.
+
+    Only ASCII runs are used: case-insensitive matching of other characters
+    cannot be mirrored by a bytewise lowercase index.
+    """
+
+    grams: set[int] = set()
+    for run in re.split(r"[^\x00-\x7f]+", literal):
+        if len(run) >= 3:
+            grams |= trigrams(run.encode("ascii"))
+    return grams
+
+
+def _skip_class(pattern: str, start: int) -> int:
+    """Return the index just past the character class opening at ``start``."""
+
+    i = start + 1
+    if i < len(pattern) and pattern[i] == "^":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+_ESCAPE_WIDTHS = {"x": 2, "u": 4, "U": 8}
+
+
+def _skip_escape(pattern: str, start: int) -> int:
+    """Return the index just past the alphanumeric escape opening at ``start``.
+
+    Numeric and named escapes (``\\x41``, ``\\u00e9``, ``\\N{...}``, octal
+    and backreference digits) span several characters after the letter.
+    """
+
+    kind = pattern[start + 1]
+    i = start + 2
+    if kind in _ESCAPE_WIDTHS:
+        return i + _ESCAPE_WIDTHS[kind]
+    if kind == "N" and i < len(pattern) and pattern[i] == "{":
+        return pattern.find("}", i) + 1 or len(pattern)
+    if kind.isdigit():
+        # At most three digits in all: ``\\0``-``\\077`` or ``\\1``-``\\377``.
+        end = min(start + 4, len(pattern))
+        while i < end and pattern[i].isdigit():
+            i += 1
+    return i
+
+
+def required_literals(pattern: str, flags: int = 0) -> list[str] | None:
+    """Extract literal runs that every match of ``pattern`` must contain.
+
+    The extraction is deliberately conservative: alternation and verbose
+    patterns return ``None`` (no constraint), group and class contents are
+    ignored, and characters made optional by a quantifier are dropped.
+    Raises :class:`re.error` for invalid patterns.
+    """
+
+    compiled = re.compile(pattern, flags)
+    if "|" in pattern or compiled.flags & re.VERBOSE:
+        return None
+
+    literals: list[str] = []
+    current: list[str] = []
+
+    def _cut() -> None:
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    depth = 0
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if char == "\\" and i + 1 < length:
+            escaped = pattern[i + 1]
+            if escaped.isalnum():
+                # Classes, anchors, numeric escapes and backreferences.
+                _cut()
+                i = _skip_escape(pattern, i)
+                continue
+            i += 2
+            token = escaped
+        elif char == "[":
+            _cut()
+            i = _skip_class(pattern, i)
+            continue
+        elif char == "(":
+            _cut()
+            depth += 1
+            i += 1
+            continue
+        elif char == ")":
+            _cut()
+            depth = max(0, depth - 1)
+            i += 1
+            continue
+        elif char in ".^$+":
+            # ``+`` keeps the preceding character required but ends the run.
+            _cut()
+            i += 1
+            continue
+        elif char in "*?{":
+            if current:
+                current.pop()
+            _cut()
+            if char == "{":
+                i = pattern.find("}", i) + 1 or length
+            else:
+                i += 1
+            continue
+        else:
+            token = char
+            i += 1
+        if depth:
+            continue
+        current.append(token)
+    _cut()
+    return literals
+
+
+class TrigramIndex(Generic[K]):
+    """Posting list per trigram, as used by code-search engines.
+
+    Queries intersect the postings of every trigram a match must contain,
+    starting from the rarest, to produce a small candidate set that is then
+    verified by an actual scan.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[int, set[K]] = {}
+        self._grams: dict[K, array] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._grams
+
+    def add(self, key: K, grams: Iterable[int]) -> None:
+        packed = array("I", sorted(grams))
+        with self._lock:
+            self._remove_locked(key)
+            self._grams[key] = packed
+            for gram in packed:
+                self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: K) -> None:
+        with self._lock:
+            self._remove_locked(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._grams.clear()
+
+    def candidates(self, grams: Iterable[int]) -> set[K]:
+        """Keys whose content contains every trigram in ``grams``."""
+
+        with self._lock:
+            postings = [self._postings.get(gram) for gram in set(grams)]
+            if not postings or any(not posting for posting in postings):
+                return set()
+            postings.sort(key=len)
+            result = set(postings[0])
+            for posting in postings[1:]:
+                result &= posting
+                if not result:
+                    break
+            return result
+
+    def query(self, literals: Iterable[str] | None) -> set[K] | None:
+        """Candidates for a search requiring all ``literals``.
+
+        Returns ``None`` when the literals carry no usable trigram, meaning
+        every key is a candidate.
+        """
+
+        if literals is None:
+            return None
+        grams: set[int] = set()
+        for literal in literals:
+            grams |= literal_trigrams(literal)
+        if not grams:
+            return None
+        return self.candidates(grams)
+
+    def _remove_locked(self, key: K) -> None:
+        previous = self._grams.pop(key, None)
+        if previous is None:
+            return
+        for gram in previous:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(key)
+            if not posting:
+                del self._postings[gram]
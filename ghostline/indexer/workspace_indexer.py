@@ -1,50 +1,206 @@
 """Workspace-aware file indexing helpers."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Iterable, Sequence
+from typing import Callable, Iterable, Mapping, Sequence
 
 from ghostline.core.logging import get_logger
-from ghostline.core.threads import BackgroundWorkers
+from ghostline.core.threads import BACKGROUND, TaskLane, shared_scheduler
+from ghostline.indexer.chunker import CodeChunk, chunk_source
+from ghostline.indexer.content_store import DEFAULT_CONTENT_BUDGET, ContentStore, line_offsets, read_byte_range
+from ghostline.indexer.index_store import FileRecord, IndexStore
+from ghostline.indexer.text_index import InvertedIndex
+from ghostline.indexer.tokenizer import term_counts, tokenize
+from ghostline.indexer.trigram_index import TrigramIndex, required_literals, trigrams
+from ghostline.workspace.crawler import WorkspaceCrawler, shared_crawler
 
 logger = get_logger(__name__)
 
+# Extra weight given to a chunk's own symbol names over incidental mentions.
+SYMBOL_TERM_BOOST = 3
+
+
+def content_digest(data: bytes) -> str:
+    """Return the content hash used to detect unchanged files."""
+
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 @dataclass
 class IndexedFile:
-    """In-memory representation of an indexed file."""
+    """Resident metadata for an indexed file.
+
+    Only metadata, symbols and line offsets stay in memory. Contents live in
+    the indexer's :class:`ContentStore` (or on disk) and are read on demand;
+    ``content`` is only set for in-memory editor snapshots.
+    """
 
     path: Path
-    content: str
+    content: str | None
     mtime: float
+    size: int = 0
+    digest: str = ""
+    symbols: tuple[str, ...] = ()
+    line_offsets: array | None = field(default=None, repr=False, compare=False)
+    store: ContentStore | None = field(default=None, repr=False, compare=False)
+    chunks: tuple[CodeChunk, ...] = field(default=(), repr=False, compare=False)
+
+    def text(self) -> str:
+        """Return the full file contents."""
+
+        if self.content is not None:
+            return self.content
+        if self.store is not None:
+            return self.store.read_text(self.path)
+        try:
+            return self.path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return ""
 
     def snippet(self, max_chars: int = 600) -> str:
         """Return a shortened preview of file contents."""
 
-        return self.content[:max_chars]
+        if self.content is not None:
+            return self.content[:max_chars]
+        # UTF-8 needs at most four bytes per character.
+        return self._read_range(0, max_chars * 4)[:max_chars]
+
+    def read_lines(self, start_line: int, end_line: int) -> str:
+        """Return lines ``start_line``..``end_line`` (1-based, inclusive)."""
+
+        if self.content is not None:
+            return "\n".join(self.content.splitlines()[start_line - 1 : end_line])
+        offsets = self.line_offsets
+        if offsets is None:
+            # Files restored from the manifest get their offsets on first use.
+            offsets = self.line_offsets = self._compute_offsets()
+            if offsets is None:
+                return ""
+        start_index = max(start_line - 1, 0)
+        if start_index >= len(offsets):
+            return ""
+        end = offsets[end_line] if end_line < len(offsets) else None
+        return "\n".join(self._read_range(offsets[start_index], end).splitlines())
+
+    def _compute_offsets(self) -> array | None:
+        try:
+            if self.store is not None:
+                return line_offsets(self.store.read_bytes(self.path))
+            return line_offsets(self.path.read_bytes())
+        except OSError:
+            return None
+
+    def _read_range(self, start: int, end: int | None) -> str:
+        if self.store is not None:
+            return self.store.read_range(self.path, start, end)
+        try:
+            return read_byte_range(self.path, start, end).decode("utf-8", errors="ignore")
+        except OSError:
+            return ""
+
+
+@dataclass
+class _PreparedFile:
+    """Result of reading a file off the indexing thread.
+
+    ``data`` is ``None`` when the file's bytes match what is already indexed,
+    in which case only the manifest entry needs refreshing.
+    """
+
+    path: Path
+    mtime: float
+    size: int
+    digest: str
+    data: bytes | None = None
+    symbols: tuple[str, ...] = ()
+    tokens: dict[str, int] | None = None
+    line_offsets: array | None = None
+    chunks: tuple[CodeChunk, ...] = ()
+    chunk_tokens: tuple[dict[str, int], ...] = ()
+    trigrams: set[int] | None = None
+
+
+@dataclass
+class ChunkMatch:
+    """A ranked chunk hit returned by :meth:`WorkspaceIndexer.search_chunks`."""
+
+    file: IndexedFile
+    chunk: CodeChunk
+    score: float = 0.0
+
+    @property
+    def title(self) -> str:
+        return f"{self.file.path.name}:{self.chunk.start_line}-{self.chunk.end_line} {self.chunk.name}"
+
+    def text(self) -> str:
+        return self.file.read_lines(self.chunk.start_line, self.chunk.end_line)
+
+
+def chunk_term_counts(lines: Sequence[str], chunk: CodeChunk) -> dict[str, int]:
+    """Term counts for ``chunk``, boosting the symbols it defines."""
+
+    counts = Counter(tokenize("\n".join(lines[chunk.start_line - 1 : chunk.end_line])))
+    for symbol in chunk.symbols:
+        for token in tokenize(symbol):
+            counts[token] += SYMBOL_TERM_BOOST
+    return dict(counts)
 
 
 class WorkspaceIndexer:
-    """Indexes workspace files and provides lightweight retrieval APIs."""
+    """Indexes workspace files and provides lightweight retrieval APIs.
+
+    The file manifest (mtime, size, content hash), symbols and per-file term
+    counts are persisted under the workspace metadata directory. Reopening a
+    workspace restores that snapshot first and then revalidates it in the
+    background, re-reading only files whose stat or hash changed. Term counts
+    feed an :class:`InvertedIndex` that ranks :meth:`search` results with BM25.
+    Files are also split into function/class/block chunks with their own
+    postings and symbol tags so retrieval can return the relevant range of a
+    file instead of its head (:meth:`search_chunks`). Trigram postings over
+    contents and paths narrow substring/regex searches to candidate files
+    (:meth:`candidate_files`, :meth:`find_by_name`).
+    """
 
     def __init__(
         self,
         workspace_provider: Callable[[], Path | str | None],
         *,
-        workers: BackgroundWorkers | None = None,
+        workers: TaskLane | None = None,
         max_file_bytes: int = 400_000,
         include_hidden: bool = False,
+        persist: bool = True,
+        crawler: WorkspaceCrawler | None = None,
+        content_budget_bytes: int = DEFAULT_CONTENT_BUDGET,
     ) -> None:
         self.workspace_provider = workspace_provider
-        self.workers = workers or BackgroundWorkers()
+        self.workers = workers or shared_scheduler().lane(BACKGROUND)
         self.max_file_bytes = max_file_bytes
         self.include_hidden = include_hidden
+        self.persist = persist
+        self.crawler = crawler or (WorkspaceCrawler(include_hidden=True) if include_hidden else shared_crawler())
+        self._root: Path | None = None
+        self._store: IndexStore | None = None
+        self._dirty = False
         self._files: dict[Path, IndexedFile] = {}
+        self._contents = ContentStore(content_budget_bytes)
         self._memory_overrides: dict[Path, str] = {}
         self._recent: list[Path] = []
         self._symbol_index: dict[str, set[Path]] = {}
+        self._text_index: InvertedIndex[Path] = InvertedIndex()
+        self._chunk_index: InvertedIndex[tuple[Path, int]] = InvertedIndex()
+        self._chunk_symbols: dict[str, set[tuple[Path, int]]] = {}
+        self._content_trigrams: TrigramIndex[Path] = TrigramIndex()
+        self._path_trigrams: TrigramIndex[Path] = TrigramIndex()
+        # Files restored from the manifest have no content trigrams until
+        # their text is next read; they are always search candidates.
+        self._trigram_pending: set[Path] = set()
         self._generation = 0
+        self._layout_generation = 0
+        self._versions: dict[Path, int] = {}
 
     @property
     def generation(self) -> int:
@@ -52,19 +208,55 @@ class WorkspaceIndexer:
 
         return self._generation
 
+    @property
+    def root(self) -> Path | None:
+        return self._root
+
+    @property
+    def layout_generation(self) -> int:
+        """Counter bumped only when files enter or leave the index.
+
+        Unlike :attr:`generation` it is not touched by edits to files that are
+        already indexed, so callers can pair it with :meth:`file_version` to
+        invalidate only what actually depends on a changed file.
+        """
+
+        return self._layout_generation
+
+    def file_version(self, path: Path | str) -> int:
+        """Return the generation at which ``path`` last changed (0 if never)."""
+
+        return self._versions.get(Path(path), 0)
+
+    def _bump(self, path: Path) -> None:
+        self._generation += 1
+        self._versions[path] = self._generation
+
     def set_workspace(self, path: Path | str | None) -> None:
+        self.flush()
         self._files.clear()
         self._memory_overrides.clear()
         self._recent.clear()
         self._symbol_index.clear()
+        self._text_index.clear()
+        self._chunk_index.clear()
+        self._chunk_symbols.clear()
+        self._content_trigrams.clear()
+        self._path_trigrams.clear()
+        self._trigram_pending.clear()
+        self._contents.clear()
+        self._versions.clear()
         self._generation += 1
-        if path:
-            self._schedule_index(Path(path))
+        self._layout_generation += 1
+        self._root = Path(path) if path else None
+        self._store = IndexStore(self._root) if self._root and self.persist else None
+        if self._root:
+            self._schedule_index(self._root, warm_start=True)
 
-    def _schedule_index(self, root: Path) -> None:
+    def _schedule_index(self, root: Path, *, warm_start: bool = False) -> None:
         if not root.exists():
             return
-        self.workers.submit("workspace-index", self._index_path, root)
+        self.workers.submit("workspace-index", self._index_workspace, root, warm_start)
 
     def rebuild(self, paths: Iterable[str] | None = None) -> None:
         workspace = self.workspace_provider()
@@ -75,46 +267,195 @@ class WorkspaceIndexer:
         if workspace:
             self._schedule_index(Path(workspace))
 
-    def _index_path(self, path: Path) -> None:
+    def apply_changes(self, changes: Mapping[Path, str]) -> None:
+        """Apply a coalesced batch of ``created``/``modified``/``deleted`` events.
+
+        Directory events re-sync the directory (unchanged files are skipped on
+        their stat); deletions drop everything beneath the path.
+        """
+
+        for raw, event_type in changes.items():
+            path = Path(raw)
+            if self._root is None or not self._is_under(path, self._root):
+                continue
+            if event_type == "deleted" or not path.exists():
+                self._drop_tree(path)
+            elif path != self._root and self.crawler.is_ignored(path, self._root):
+                self._drop_tree(path)
+            else:
+                self._sync_path(path)
+
+    def _index_workspace(self, root: Path, warm_start: bool = False) -> None:
+        if warm_start:
+            self._restore_snapshot()
+        self._sync_path(root)
+        self.flush()
+
+    def _sync_path(self, path: Path) -> None:
+        """Index ``path`` and drop tracked files beneath it that are gone."""
+
+        seen: set[Path] = set()
+        self._index_path(path, seen)
+        for stale in [tracked for tracked in list(self._files) if tracked not in seen and self._is_under(tracked, path)]:
+            self._drop_file(stale)
+
+    def _drop_tree(self, path: Path) -> None:
+        for tracked in [tracked for tracked in list(self._files) if self._is_under(tracked, path)]:
+            self._drop_file(tracked)
+
+    def _restore_snapshot(self) -> None:
+        if not self._store:
+            return
+        records = self._store.load()
+        for path, record in records.items():
+            self._files[path] = IndexedFile(
+                path,
+                None,
+                record.mtime,
+                record.size,
+                record.digest,
+                record.symbols,
+                store=self._contents,
+                chunks=record.chunks,
+            )
+            self._add_symbols(path, record.symbols)
+            self._text_index.add(path, record.tokens)
+            self._add_chunks(path, record.chunks, record.chunk_tokens)
+            self._path_trigrams.add(path, self._path_grams(path))
+            self._trigram_pending.add(path)
+        if records:
+            self._generation += 1
+            self._layout_generation += 1
+            logger.info("Restored %d files from workspace index", len(records))
+
+    def _index_path(self, path: Path, seen: set[Path] | None = None) -> None:
         if path.is_dir():
-            for child in path.rglob("*"):
-                if child.is_file():
-                    self._maybe_index_file(child)
+            for batch in self.crawler.crawl(path, self._prepare_file):
+                for prepared in batch:
+                    if self._apply_prepared(prepared) and seen is not None:
+                        seen.add(prepared.path)
         elif path.is_file():
-            self._maybe_index_file(path)
+            if self.include_hidden or not self._is_hidden(path):
+                prepared = self._prepare_file(path)
+                if prepared and self._apply_prepared(prepared) and seen is not None:
+                    seen.add(path)
+
+    def _prepare_file(self, path: Path) -> _PreparedFile | None:
+        """Stat, read, hash and tokenise ``path``; safe to run on crawler threads."""
 
-    def _maybe_index_file(self, path: Path) -> None:
-        if not self.include_hidden and any(part.startswith(".") for part in path.parts):
-            return
         try:
-            if path.stat().st_size > self.max_file_bytes:
-                logger.debug("Skipping large file %s", path)
-                return
+            stat = path.stat()
         except OSError:
-            return
+            return None
+        if stat.st_size > self.max_file_bytes:
+            logger.debug("Skipping large file %s", path)
+            return None
+
+        existing = self._files.get(path)
+        if existing and existing.mtime == stat.st_mtime and existing.size == stat.st_size:
+            return _PreparedFile(path, stat.st_mtime, stat.st_size, existing.digest)
 
         try:
-            content = path.read_text(encoding="utf-8")
+            data = path.read_bytes()
+            content = data.decode("utf-8")
         except (OSError, UnicodeDecodeError):
             logger.debug("Unable to read %s for indexing", path)
-            return
+            return None
 
-        self._files[path] = IndexedFile(path, content, path.stat().st_mtime)
-        self._generation += 1
+        digest = content_digest(data)
+        if existing and existing.digest == digest:
+            return _PreparedFile(path, stat.st_mtime, stat.st_size, digest)
+        lines = content.splitlines()
+        chunks = tuple(chunk_source(path, content))
+        return _PreparedFile(
+            path,
+            stat.st_mtime,
+            stat.st_size,
+            digest,
+            data,
+            tuple(self._extract_symbols(content)),
+            term_counts(content),
+            line_offsets(data),
+            chunks,
+            tuple(chunk_term_counts(lines, chunk) for chunk in chunks),
+            trigrams(data),
+        )
+
+    def _apply_prepared(self, prepared: _PreparedFile) -> bool:
+        """Merge a prepared file into the index; return whether it is tracked."""
+
+        path = prepared.path
+        existing = self._files.get(path)
+        if prepared.data is None:
+            if existing is None:
+                return False
+            if existing.mtime != prepared.mtime or existing.size != prepared.size:
+                # Touched but unchanged: refresh the manifest without re-tokenising.
+                existing.mtime = prepared.mtime
+                existing.size = prepared.size
+                self._dirty = True
+            return True
+
+        if existing:
+            self._remove_symbols(path, existing.symbols)
+            self._remove_chunks(path, existing.chunks)
+        self._files[path] = IndexedFile(
+            path,
+            None,
+            prepared.mtime,
+            prepared.size,
+            prepared.digest,
+            prepared.symbols,
+            prepared.line_offsets,
+            self._contents,
+            prepared.chunks,
+        )
+        self._contents.discard(path)
+        self._text_index.add(path, prepared.tokens or {})
+        self._add_chunks(path, prepared.chunks, prepared.chunk_tokens)
+        self._content_trigrams.add(path, prepared.trigrams or ())
+        self._trigram_pending.discard(path)
+        self._dirty = True
+        if not existing:
+            self._path_trigrams.add(path, self._path_grams(path))
+            self._layout_generation += 1
+        self._bump(path)
         self._recent.append(path)
         self._recent = self._recent[-20:]
-        self._index_symbols(path, content)
+        self._add_symbols(path, prepared.symbols)
+        return True
+
+    def _drop_file(self, path: Path) -> None:
+        indexed = self._files.pop(path, None)
+        if not indexed:
+            return
+        self._remove_symbols(path, indexed.symbols)
+        self._remove_chunks(path, indexed.chunks)
+        self._text_index.remove(path)
+        self._content_trigrams.remove(path)
+        self._path_trigrams.remove(path)
+        self._trigram_pending.discard(path)
+        self._contents.discard(path)
+        self._dirty = True
+        self._layout_generation += 1
+        self._bump(path)
 
     def update_memory_snapshot(self, path: Path | str, content: str) -> None:
-        """Store an in-memory version of a file (e.g., unsaved editor buffer)."""
+        """Store an in-memory version of a file (e.g., unsaved editor buffer).
+
+        Re-sending an unchanged buffer is a no-op so it does not invalidate
+        caches keyed on :meth:`file_version`.
+        """
 
         resolved = Path(path)
+        if self._memory_overrides.get(resolved) == content:
+            return
         self._memory_overrides[resolved] = content
-        self._generation += 1
+        self._bump(resolved)
         if resolved not in self._recent:
             self._recent.append(resolved)
             self._recent = self._recent[-20:]
-        self._index_symbols(resolved, content)
+        self._add_symbols(resolved, self._extract_symbols(content))
 
     def get(self, path: Path | str) -> IndexedFile | None:
         resolved = Path(path)
@@ -124,26 +465,72 @@ class WorkspaceIndexer:
 
     def find_by_name(self, term: str, limit: int = 5) -> list[IndexedFile]:
         term_lower = term.lower()
-        matches = [
-            file
-            for file in self._files.values()
-            if term_lower in file.path.name.lower() or term_lower in str(file.path).lower()
-        ]
+        candidates = self._path_trigrams.query([term_lower])
+        if candidates is None:
+            files = list(self._files.values())
+        else:
+            files = [self._files[path] for path in sorted(candidates) if path in self._files]
+        matches = [file for file in files if term_lower in str(file.path).lower()]
         return matches[:limit]
 
+    def indexed_paths(self) -> set[Path]:
+        """Return the paths of every file the index currently holds."""
+
+        # Copy the keys in one step; indexing threads may be adding files.
+        return set(list(self._files))
+
+    def candidate_files(self, query: str, *, regex: bool = False, flags: int = 0) -> list[IndexedFile]:
+        """Return indexed files that may contain ``query``, sorted by path.
+
+        The trigram index rules out files that cannot match; callers still
+        scan the candidates. With ``regex`` set, ``query`` is a pattern and
+        :class:`re.error` propagates for invalid ones.
+        """
+
+        literals = required_literals(query, flags) if regex else [query]
+        candidates = self._content_trigrams.query(literals)
+        if candidates is None:
+            return sorted(self._files.values(), key=lambda file: file.path)
+        keys = candidates | self._trigram_pending
+        return [self._files[path] for path in sorted(keys) if path in self._files]
+
+    def note_scanned(self, path: Path, text: str) -> None:
+        """Fill in content trigrams for a restored file a scan just read."""
+
+        if path in self._trigram_pending and path in self._files:
+            self._content_trigrams.add(path, trigrams(text.encode("utf-8")))
+            self._trigram_pending.discard(path)
+
     def search(self, query: str, limit: int = 5) -> list[IndexedFile]:
-        tokens = [token.lower() for token in query.split() if len(token) > 3]
-        if not tokens:
-            return []
-
-        scored: list[tuple[int, IndexedFile]] = []
-        for file in self._files.values():
-            text = file.content.lower()
-            score = sum(text.count(token) for token in tokens)
-            if score:
-                scored.append((score, file))
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return [file for _, file in scored[:limit]]
+        """Return the ``limit`` best BM25 matches for ``query``."""
+
+        results: list[IndexedFile] = []
+        for _score, path in self._text_index.search(tokenize(query), limit):
+            indexed = self._files.get(path)
+            if indexed:
+                results.append(indexed)
+        return results
+
+    def search_chunks(self, query: str, limit: int = 5) -> list[ChunkMatch]:
+        """Return the ``limit`` best BM25-ranked chunks for ``query``."""
+
+        results: list[ChunkMatch] = []
+        for score, key in self._chunk_index.search(tokenize(query), limit):
+            match = self._chunk_match(key, score)
+            if match:
+                results.append(match)
+        return results
+
+    def chunks_for_symbol(self, symbol: str, limit: int = 5) -> list[ChunkMatch]:
+        """Return chunks that define ``symbol``."""
+
+        keys = sorted(self._chunk_symbols.get(symbol.lower(), set()), key=lambda key: (str(key[0]), key[1]))
+        results: list[ChunkMatch] = []
+        for key in keys[:limit]:
+            match = self._chunk_match(key)
+            if match:
+                results.append(match)
+        return results
 
     def symbols_for(self, symbol: str, limit: int = 5) -> list[IndexedFile]:
         """Return files that define or import a given symbol."""
@@ -156,8 +543,47 @@ class WorkspaceIndexer:
                 results.append(indexed)
         return results
 
+    def flush(self) -> None:
+        """Persist the index manifest if it changed since the last save."""
+
+        if not self._store or not self._dirty:
+            return
+        records = {
+            path: FileRecord(
+                file.mtime,
+                file.size,
+                file.digest,
+                file.symbols,
+                self._text_index.term_counts(path),
+                file.chunks,
+                tuple(self._chunk_index.term_counts((path, index)) for index in range(len(file.chunks))),
+            )
+            for path, file in list(self._files.items())
+        }
+        self._store.save(records)
+        self._dirty = False
+
     # Internal ---------------------------------------------------------
-    def _index_symbols(self, path: Path, content: str) -> None:
+    @staticmethod
+    def _path_grams(path: Path) -> set[int]:
+        return trigrams(str(path).lower().encode("utf-8"))
+
+    def _is_hidden(self, path: Path) -> bool:
+        parts = path.parts
+        if self._root and self._is_under(path, self._root):
+            parts = path.relative_to(self._root).parts
+        return any(part.startswith(".") for part in parts)
+
+    @staticmethod
+    def _is_under(path: Path, root: Path) -> bool:
+        try:
+            path.relative_to(root)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _extract_symbols(content: str) -> list[str]:
         tokens = []
         for line in content.splitlines():
             line_stripped = line.strip()
@@ -167,12 +593,52 @@ class WorkspaceIndexer:
             elif line_stripped.startswith("import ") or line_stripped.startswith("from "):
                 parts = line_stripped.replace("from", "").replace("import", "").replace(",", " ").split()
                 tokens.extend(parts)
-        for token in tokens:
+        return tokens
+
+    def _add_symbols(self, path: Path, symbols: Iterable[str]) -> None:
+        for token in symbols:
             key = token.lower()
             self._symbol_index.setdefault(key, set()).add(path)
 
+    def _remove_symbols(self, path: Path, symbols: Iterable[str]) -> None:
+        for token in symbols:
+            key = token.lower()
+            bucket = self._symbol_index.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(path)
+            if not bucket:
+                self._symbol_index.pop(key, None)
+
+    def _add_chunks(
+        self, path: Path, chunks: Sequence[CodeChunk], chunk_tokens: Sequence[dict[str, int]]
+    ) -> None:
+        for index, (chunk, tokens) in enumerate(zip(chunks, chunk_tokens)):
+            self._chunk_index.add((path, index), tokens)
+            for symbol in chunk.symbols:
+                self._chunk_symbols.setdefault(symbol.lower(), set()).add((path, index))
+
+    def _remove_chunks(self, path: Path, chunks: Sequence[CodeChunk]) -> None:
+        for index, chunk in enumerate(chunks):
+            self._chunk_index.remove((path, index))
+            for symbol in chunk.symbols:
+                bucket = self._chunk_symbols.get(symbol.lower())
+                if bucket is None:
+                    continue
+                bucket.discard((path, index))
+                if not bucket:
+                    self._chunk_symbols.pop(symbol.lower(), None)
+
+    def _chunk_match(self, key: tuple[Path, int], score: float = 0.0) -> ChunkMatch | None:
+        path, index = key
+        indexed = self._files.get(path)
+        if not indexed or index >= len(indexed.chunks):
+            return None
+        return ChunkMatch(indexed, indexed.chunks[index], score)
+
     def recent_files(self) -> Sequence[Path]:
         return tuple(self._recent)
 
     def shutdown(self) -> None:
         self.workers.shutdown()
+        self.flush()
@@ -1,10 +1,11 @@
 """Diagnostics model for editor and UI panels."""
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Iterable
 
-from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
 
 
 @dataclass
@@ -16,27 +17,134 @@ class Diagnostic:
     message: str
 
 
-class DiagnosticsModel(QStandardItemModel):
-    """Simple table-like model to display diagnostics."""
+class DiagnosticsModel(QAbstractTableModel):
+    """Table model to display diagnostics.
+
+    Rows live in parallel arrays with file names and severities interned, and
+    cell text is produced on demand in :meth:`data`, so large result sets stay
+    cheap. Per-file updates insert and remove rows instead of resetting.
+    """
 
     headers = ["File", "Line", "Column", "Severity", "Message"]
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self.setHorizontalHeaderLabels(self.headers)
+        self._files: list[str] = []
+        self._file_ids: dict[str, int] = {}
+        self._severities: list[str] = []
+        self._severity_ids: dict[str, int] = {}
+        self._clear_rows()
+
+    # Qt model API ---------------------------------------------------------
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._row_files)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # noqa: N802
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.headers):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        row = index.row()
+        if not 0 <= row < len(self._row_files):
+            return None
+        column = index.column()
+        if column == 0:
+            return self._files[self._row_files[row]]
+        if column == 1:
+            return str(self._row_lines[row] + 1)
+        if column == 2:
+            return str(self._row_cols[row] + 1)
+        if column == 3:
+            return self._severities[self._row_severities[row]]
+        if column == 4:
+            return self._messages[row]
+        return None
+
+    # Diagnostics API ------------------------------------------------------
+    def diagnostic(self, row: int) -> Diagnostic:
+        return Diagnostic(
+            self._files[self._row_files[row]],
+            self._row_lines[row],
+            self._row_cols[row],
+            self._severities[self._row_severities[row]],
+            self._messages[row],
+        )
+
+    def diagnostics(self) -> list[Diagnostic]:
+        return [self.diagnostic(row) for row in range(self.rowCount())]
 
     def set_diagnostics(self, diagnostics: Iterable[Diagnostic]) -> None:
-        self.clear()
-        self.setHorizontalHeaderLabels(self.headers)
+        """Replace every row."""
+
+        self.beginResetModel()
+        self._clear_rows()
         for diag in diagnostics:
-            self.appendRow(self._items_for_diag(diag))
+            self._append_row(diag)
+        self.endResetModel()
+
+    def append_diagnostics(self, diagnostics: Iterable[Diagnostic]) -> None:
+        batch = list(diagnostics)
+        if not batch:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        for diag in batch:
+            self._append_row(diag)
+        self.endInsertRows()
+
+    def remove_file(self, file: str) -> None:
+        """Remove the rows reported for ``file``."""
+
+        file_id = self._file_ids.get(str(file))
+        if file_id is None:
+            return
+        row = self.rowCount() - 1
+        # Walk backwards so earlier row numbers stay valid, removing each
+        # contiguous run with a single remove notification.
+        while row >= 0:
+            if self._row_files[row] != file_id:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and self._row_files[row] == file_id:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, end)
+            for column in (self._row_files, self._row_lines, self._row_cols, self._row_severities, self._messages):
+                del column[row + 1 : end + 1]
+            self.endRemoveRows()
+
+    def set_file_diagnostics(self, file: str, diagnostics: Iterable[Diagnostic]) -> None:
+        """Replace only the rows for ``file`` (LSP publishes per document)."""
+
+        self.remove_file(file)
+        self.append_diagnostics(diagnostics)
+
+    # Internal -------------------------------------------------------------
+    def _clear_rows(self) -> None:
+        self._row_files = array("I")
+        self._row_lines = array("i")
+        self._row_cols = array("i")
+        self._row_severities = array("H")
+        self._messages: list[str] = []
 
-    def _items_for_diag(self, diag: Diagnostic) -> List[QStandardItem]:
-        return [
-            QStandardItem(str(diag.file)),
-            QStandardItem(str(diag.line + 1)),
-            QStandardItem(str(diag.col + 1)),
-            QStandardItem(diag.severity),
-            QStandardItem(diag.message),
-        ]
+    def _append_row(self, diag: Diagnostic) -> None:
+        self._row_files.append(self._intern(self._files, self._file_ids, str(diag.file)))
+        self._row_lines.append(int(diag.line))
+        self._row_cols.append(int(diag.col))
+        self._row_severities.append(self._intern(self._severities, self._severity_ids, str(diag.severity)))
+        self._messages.append(diag.message)
 
+    @staticmethod
+    def _intern(table: list[str], ids: dict[str, int], value: str) -> int:
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = len(table)
+            ids[value] = value_id
+            table.append(value)
+        return value_id
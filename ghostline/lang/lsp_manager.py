@@ -34,6 +34,8 @@ class LSPManager(QObject):
         self.workspace_manager = workspace_manager
         self.clients: dict[str, dict[str, dict[str, LSPClient]]] = {}
         self._diag_callbacks: list[Callable[[list[Diagnostic]], None]] = []
+        self._file_diag_callbacks: list[Callable[[str, list[Diagnostic]], None]] = []
+        self._failure_diagnostics: list[Diagnostic] = []
         self._pending: dict[int, Callable[[dict], None]] = {}
         self._semantic_request_meta: dict[int, dict[str, str]] = {}
         self._language_settings = self._build_language_settings()
@@ -650,6 +652,17 @@ class LSPManager(QObject):
     def subscribe_diagnostics(self, callback: Callable[[list[Diagnostic]], None]) -> None:
         self._diag_callbacks.append(callback)
 
+    def subscribe_file_diagnostics(self, callback: Callable[[str, list[Diagnostic]], None]) -> None:
+        """Call ``callback(file, diagnostics)`` with the complete, current list for each published file."""
+
+        self._file_diag_callbacks.append(callback)
+
+    def _publish_diagnostics(self, file: str, diagnostics: list[Diagnostic]) -> None:
+        for callback in self._diag_callbacks:
+            callback(diagnostics)
+        for file_callback in self._file_diag_callbacks:
+            file_callback(file, diagnostics)
+
     def _handle_notification(self, message: Dict[str, Any]) -> None:
         method = message.get("method")
         params = message.get("params", {})
@@ -669,8 +682,7 @@ class LSPManager(QObject):
                         message=diag.get("message", ""),
                     )
                 )
-            for callback in self._diag_callbacks:
-                callback(diagnostics)
+            self._publish_diagnostics(str(file_path), diagnostics)
 
     def _handle_response(self, message: Dict[str, Any]) -> None:
         request_id = message.get("id")
@@ -796,5 +808,9 @@ class LSPManager(QObject):
         diagnostic = Diagnostic(file="(LSP)", line=0, col=0, severity="Warning", message=message)
         for callback in self._diag_callbacks:
             callback([diagnostic])
+        # Per-file subscribers get every failure so far, since each publish replaces the file's rows.
+        self._failure_diagnostics.append(diagnostic)
+        for file_callback in self._file_diag_callbacks:
+            file_callback(diagnostic.file, list(self._failure_diagnostics))
         self._reported_failures.add(language)
 
@@ -1,62 +1,78 @@
 """Workspace-wide text search."""
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Iterable, List, Callable
+from typing import List, Callable
 
+from PySide6.QtCore import QModelIndex, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QHBoxLayout,
+    QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QVBoxLayout,
 )
 
+from ghostline.indexer.workspace_indexer import WorkspaceIndexer
+from ghostline.search.results_model import SearchResultsModel
+from ghostline.search.search_engine import GlobalSearchResult, SearchEngine, iter_matches
 
-@dataclass
-class GlobalSearchResult:
-    path: Path
-    line: int
-    content: str
+__all__ = ["GlobalSearchDialog", "GlobalSearchResult", "search_workspace"]
 
 
-def search_workspace(root: str, query: str) -> List[GlobalSearchResult]:
-    results: List[GlobalSearchResult] = []
+def search_workspace(root: str, query: str, indexer: WorkspaceIndexer | None = None) -> List[GlobalSearchResult]:
+    """Synchronously find ``query`` case-insensitively under ``root``.
+
+    See :func:`~ghostline.search.search_engine.iter_matches`; interactive
+    callers should use :class:`~ghostline.search.search_engine.SearchEngine`.
+    """
+
     if not query:
-        return results
-    root_path = Path(root)
-    pattern = re.compile(re.escape(query), re.IGNORECASE)
-    for file in root_path.rglob("*"):
-        if file.is_dir():
-            continue
-        try:
-            for idx, line in enumerate(file.read_text(encoding="utf-8", errors="ignore").splitlines(), start=1):
-                if pattern.search(line):
-                    results.append(GlobalSearchResult(file, idx, line.strip()))
-        except OSError:
-            continue
-    return results
+        return []
+    return list(iter_matches(root, query, indexer=indexer))
 
 
 class GlobalSearchDialog(QDialog):
-    def __init__(self, workspace_root: Callable[[], str | None], open_callback: Callable[[str, int], None], parent=None) -> None:
+    SEARCH_DELAY_MS = 200
+
+    def __init__(
+        self,
+        workspace_root: Callable[[], str | None],
+        open_callback: Callable[[str, int], None],
+        parent=None,
+        indexer: WorkspaceIndexer | None = None,
+    ) -> None:
         super().__init__(parent)
         self.workspace_root = workspace_root
         self.open_callback = open_callback
+        self.indexer = indexer
         self.setWindowTitle("Global Search")
 
+        self.engine = SearchEngine(indexer, self)
+        self.engine.resultsFound.connect(self._append_results)
+        self.engine.searchFinished.connect(self._search_finished)
+        self.engine.searchFailed.connect(self._search_failed)
+        self._search_id = 0
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.SEARCH_DELAY_MS)
+        self._debounce.timeout.connect(self._perform_search)
+
         self.input = QLineEdit(self)
         self.input.setPlaceholderText("Find in workspace...")
         self.button = QPushButton("Search", self)
         self.button.clicked.connect(self._perform_search)
         self.input.returnPressed.connect(self._perform_search)
+        self.input.textChanged.connect(lambda _text: self._debounce.start())
 
-        self.results = QListWidget(self)
-        self.results.itemActivated.connect(self._open_result)
+        self.model = SearchResultsModel(self)
+        self.results = QListView(self)
+        self.results.setUniformItemSizes(True)
+        self.results.setModel(self.model)
+        self.results.activated.connect(self._open_result)
+        self.status = QLabel(self)
 
         row = QHBoxLayout()
         row.addWidget(self.input)
@@ -65,23 +81,48 @@ class GlobalSearchDialog(QDialog):
         layout = QVBoxLayout(self)
         layout.addLayout(row)
         layout.addWidget(self.results)
+        layout.addWidget(self.status)
 
     def _perform_search(self) -> None:
+        self._debounce.stop()
+        self.engine.cancel()
+        self.model.clear()
         root = self.workspace_root()
-        if not root:
+        query = self.input.text()
+        if not root or not query:
+            self.status.clear()
+            return
+        self.model.set_root(root)
+        self.status.setText("Searching…")
+        self._search_id = self.engine.start(root, query)
+
+    def _append_results(self, search_id: int, batch: list) -> None:
+        if search_id != self._search_id:
             return
-        self.results.clear()
-        for result in search_workspace(root, self.input.text()):
-            item = QListWidgetItem(f"{result.path.relative_to(root)}:{result.line}  {result.content}")
-            item.setData(256, result)
-            self.results.addItem(item)
-
-    def _open_result(self, item: QListWidgetItem) -> None:
-        result: GlobalSearchResult | None = item.data(256)
-        if result:
-            self.open_callback(str(result.path), result.line - 1)
-            self.close()
+        self.model.append_results(batch)
+        self.status.setText(f"{self.model.rowCount()} results…")
+
+    def _search_finished(self, search_id: int, total: int, truncated: bool) -> None:
+        if search_id != self._search_id:
+            return
+        suffix = " (limit reached)" if truncated else ""
+        self.status.setText(f"{total} results{suffix}")
+
+    def _search_failed(self, search_id: int, message: str) -> None:
+        if search_id == self._search_id:
+            self.status.setText(f"Invalid search: {message}")
+
+    def _open_result(self, index: QModelIndex) -> None:
+        if not index.isValid():
+            return
+        result = self.model.result(index.row())
+        self.open_callback(str(result.path), result.line - 1)
+        self.close()
 
     def open_with_query(self, query: str) -> None:
         self.input.setText(query)
         self._perform_search()
+
+    def closeEvent(self, event) -> None:  # noqa: N802 - Qt override
+        self.engine.cancel()
+        super().closeEvent(event)
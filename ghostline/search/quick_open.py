@@ -0,0 +1,330 @@
+"""Fuzzy "quick open" file finder over a precomputed path list."""
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from ghostline.core.logging import get_logger
+from ghostline.core.threads import NORMAL, TaskLane, shared_scheduler
+from ghostline.indexer.pipeline import DELETED
+from ghostline.workspace.crawler import WorkspaceCrawler, shared_crawler
+
+logger = get_logger(__name__)
+
+SCORE_MATCH = 16
+BONUS_SEGMENT = 10
+BONUS_SEPARATOR = 8
+BONUS_CAMEL = 7
+BONUS_CONSECUTIVE = 5
+BONUS_BASENAME = 6
+MAX_GAP_PENALTY = 12
+FRECENCY_WEIGHT = 12.0
+FRECENCY_HALF_LIFE = 3 * 24 * 60 * 60
+MAX_SCORED = 400
+_SEPARATORS = "_-. "
+
+
+def _match_positions(query: str, text: str, start: int) -> list[int] | None:
+    """fzf v1 matching: scan forward for the earliest end, then tighten backwards."""
+
+    qi = 0
+    i = start
+    while qi < len(query):
+        i = text.find(query[qi], i)
+        if i < 0:
+            return None
+        qi += 1
+        i += 1
+    positions: list[int] = []
+    i -= 1
+    for char in reversed(query):
+        i = text.rfind(char, start, i + 1)
+        positions.append(i)
+        i -= 1
+    positions.reverse()
+    return positions
+
+
+def fuzzy_score(query: str, path: str, path_lower: str) -> float | None:
+    """Score ``path`` for the lowercase ``query`` in the style of fzf.
+
+    The match is tried within the file name first and then across the whole
+    path; matches at path-segment starts, after separators, on camel-case
+    humps and in runs score higher, gaps cost a little. Returns ``None`` when
+    ``query`` is not a subsequence of the path.
+    """
+
+    if len(path) != len(path_lower):
+        path = path_lower
+    basename_start = path_lower.rfind("/") + 1
+    positions = _match_positions(query, path_lower, basename_start)
+    if positions is None:
+        positions = _match_positions(query, path_lower, 0)
+        if positions is None:
+            return None
+
+    score = 0.0
+    previous = -2
+    for pos in positions:
+        score += SCORE_MATCH
+        if pos == previous + 1:
+            score += BONUS_CONSECUTIVE
+        elif previous >= 0:
+            score -= min(pos - previous - 1, MAX_GAP_PENALTY)
+        before = path[pos - 1] if pos else "/"
+        if before == "/":
+            score += BONUS_SEGMENT
+        elif before in _SEPARATORS:
+            score += BONUS_SEPARATOR
+        elif path[pos].isupper() and before.islower():
+            score += BONUS_CAMEL
+        if pos >= basename_start:
+            score += BONUS_BASENAME
+        previous = pos
+    # Prefer shorter paths among otherwise equal matches.
+    return score - len(path) * 0.01
+
+
+class QuickOpenIndex:
+    """Precomputed workspace path list with fuzzy, frecency-boosted ranking.
+
+    The list is built once per workspace by the shared crawler and then
+    maintained from watcher events through :meth:`apply_changes`, so queries
+    never touch the filesystem. A regex over a newline-joined blob of all
+    lowercase paths and file names picks a bounded, tiered candidate set in
+    C; only those candidates are scored in Python and the top ``limit`` are
+    selected with a heap.
+    """
+
+    def __init__(
+        self,
+        *,
+        crawler: WorkspaceCrawler | None = None,
+        workers: TaskLane | None = None,
+        max_scored: int = MAX_SCORED,
+    ) -> None:
+        self.crawler = crawler or shared_crawler()
+        self.workers = workers or shared_scheduler().lane(NORMAL, limit=1)
+        self._root: Path | None = None
+        self.max_scored = max_scored
+        self._paths: list[str] = []
+        self._lower: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._blob = ""
+        self._offsets = array("I")
+        self._name_blob = ""
+        self._name_offsets = array("I")
+        self._blob_dirty = False
+        self._opened: dict[str, tuple[int, float]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def root(self) -> Path | None:
+        return self._root
+
+    def set_workspace(self, root: Path | str | None) -> None:
+        with self._lock:
+            self._root = Path(root) if root else None
+            self._replace_paths([])
+            self._opened.clear()
+        if self._root:
+            self.workers.submit("quick-open", self.build, self._root)
+
+    def build(self, root: Path | str) -> None:
+        """Synchronously (re)collect every file under ``root``."""
+
+        root_path = Path(root)
+        relative = [path.relative_to(root_path).as_posix() for path in self.crawler.iter_files(root_path)]
+        with self._lock:
+            if self._root != root_path:
+                return
+            self._replace_paths(relative)
+        logger.debug("Quick open indexed %d paths under %s", len(relative), root_path)
+
+    def record_open(self, path: Path | str) -> None:
+        """Count an open of ``path`` towards its frecency boost."""
+
+        relative = self._relative(Path(path))
+        if relative is None:
+            return
+        with self._lock:
+            count, _ = self._opened.get(relative, (0, 0.0))
+            self._opened[relative] = (count + 1, time.time())
+
+    def apply_changes(self, changes: Mapping[Path, str]) -> None:
+        """Keep the path list in sync with coalesced watcher events.
+
+        A directory event crawls the whole tree beneath it, so files in
+        newly created subdirectories are picked up and vanished ones dropped.
+        """
+
+        root = self._root
+        if root is None:
+            return
+        added: list[str] = []
+        # Relative path -> files still present beneath it (None for deletions).
+        synced: dict[str, set[str] | None] = {}
+        for raw, event_type in changes.items():
+            path = Path(raw)
+            relative = self._relative(path)
+            if relative is None:
+                continue
+            if event_type == DELETED or not path.exists():
+                synced[relative] = None
+            elif path.is_dir():
+                if path != root and self.crawler.is_ignored(path, root):
+                    synced[relative] = None
+                    continue
+                present = {child.relative_to(root).as_posix() for child in self.crawler.iter_files(path)}
+                synced[relative] = present
+                added.extend(sorted(present))
+            elif not self.crawler.is_ignored(path, root):
+                added.append(relative)
+        with self._lock:
+            if self._root != root:
+                return
+            removed = [
+                known
+                for relative, present in synced.items()
+                for known in self._under(relative)
+                if present is None or known not in present
+            ]
+            for relative in removed:
+                self._remove_locked(relative)
+            for relative in added:
+                if relative not in self._positions:
+                    self._positions[relative] = len(self._paths)
+                    self._paths.append(relative)
+                    self._lower.append(relative.lower())
+            if added or removed:
+                self._blob_dirty = True
+
+    def search(self, query: str, limit: int = 20) -> list[Path]:
+        """Return up to ``limit`` paths best matching ``query``."""
+
+        needle = "".join(query.lower().split())
+        root = self._root
+        if not needle or root is None:
+            return []
+        with self._lock:
+            if self._blob_dirty:
+                self._rebuild_blobs()
+            candidates = self._candidates(needle)
+            paths = self._paths
+            lower = self._lower
+            now = time.time()
+            scored = []
+            for index in candidates:
+                path = paths[index]
+                score = fuzzy_score(needle, path, lower[index])
+                if score is not None:
+                    scored.append((score + self._frecency(path, now), path))
+        return [root / path for _score, path in heapq.nlargest(limit, scored)]
+
+    # Internal ---------------------------------------------------------
+    def _candidates(self, needle: str) -> list[int]:
+        """Collect at most :attr:`max_scored` candidates, most promising first.
+
+        Regexes run in C over the joined blobs, first against file names and
+        then against whole paths. When a subsequence scan overflows the
+        budget, the stricter prefix/substring scan runs first so the best
+        matches are not cut off arbitrarily. Python-level scoring cost thus
+        stays bounded however large the workspace is. Recently opened files
+        are always considered.
+        """
+
+        chars = [re.escape(char) for char in needle]
+        literal = "".join(chars)
+        # ``[^\nc]*c`` never backtracks, unlike ``.*?c``.
+        subsequence = chars[0] + "".join(f"[^\\n{char}]*{char}" for char in chars[1:])
+        passes = (
+            ((self._name_blob, subsequence, 0), (self._name_blob, "\n" + literal, 1)),
+            ((self._blob, subsequence, 0), (self._blob, literal, 0)),
+        )
+        candidates = [self._positions[path] for path in self._opened if path in self._positions]
+        seen = set(candidates)
+        for broad, strict in passes:
+            if len(candidates) >= self.max_scored:
+                break
+            mark = len(candidates)
+            if not self._collect(broad, seen, candidates):
+                continue
+            for line in candidates[mark:]:
+                seen.discard(line)
+            del candidates[mark:]
+            self._collect(strict, seen, candidates)
+            self._collect(broad, seen, candidates)
+        return candidates
+
+    def _collect(self, scan: tuple[str, str, int], seen: set[int], candidates: list[int]) -> bool:
+        """Append matching line numbers; return whether the budget ran out."""
+
+        blob, expression, shift = scan
+        offsets = self._name_offsets if blob is self._name_blob else self._offsets
+        for match in re.finditer(expression, blob):
+            line = bisect_right(offsets, match.start() - 1 + shift) - 1
+            if line not in seen:
+                seen.add(line)
+                candidates.append(line)
+                if len(candidates) >= self.max_scored:
+                    return True
+        return False
+
+    def _frecency(self, path: str, now: float) -> float:
+        entry = self._opened.get(path)
+        if not entry:
+            return 0.0
+        count, last_opened = entry
+        decay = 0.5 ** ((now - last_opened) / FRECENCY_HALF_LIFE)
+        return FRECENCY_WEIGHT * math.log2(1 + count) * decay
+
+    def _replace_paths(self, paths: Iterable[str]) -> None:
+        self._paths = list(paths)
+        self._rebuild_blobs()
+
+    def _rebuild_blobs(self) -> None:
+        # Removed slots hold ``None``; compact them away before joining.
+        self._paths = [path for path in self._paths if path is not None]
+        self._lower = [path.lower() for path in self._paths]
+        self._positions = {path: index for index, path in enumerate(self._paths)}
+        names = [path[path.rfind("/") + 1 :] for path in self._lower]
+        # Both blobs start with a newline so every line, including the first,
+        # is preceded by one; ``offsets[k]`` is the index of that newline.
+        self._blob = "\n" + "\n".join(self._lower)
+        self._offsets = array("I", accumulate((len(path) + 1 for path in self._lower[:-1]), initial=0))
+        self._name_blob = "\n" + "\n".join(names)
+        self._name_offsets = array("I", accumulate((len(name) + 1 for name in names[:-1]), initial=0))
+        self._blob_dirty = False
+
+    def _remove_locked(self, relative: str) -> None:
+        index = self._positions.pop(relative, None)
+        if index is not None:
+            self._paths[index] = None  # type: ignore[call-overload]
+            self._lower[index] = ""
+
+    def _under(self, relative: str) -> list[str]:
+        """Known paths at or beneath ``relative``; called with the lock held."""
+
+        if relative == ".":
+            return list(self._positions)
+        prefix = relative + "/"
+        return [path for path in self._positions if path == relative or path.startswith(prefix)]
+
+    def _relative(self, path: Path) -> str | None:
+        if self._root is None:
+            return None
+        try:
+            return path.relative_to(self._root).as_posix()
+        except ValueError:
+            return None
@@ -0,0 +1,91 @@
+"""List model for streamed workspace search results."""
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, Qt
+
+from ghostline.search.search_engine import GlobalSearchResult
+
+ResultRole = Qt.UserRole
+
+
+class SearchResultsModel(QAbstractListModel):
+    """Compact, append-only backing store for search results.
+
+    Paths are interned once and rows keep only an index into that table plus
+    the line number, so 100k matches cost a few arrays rather than 100k item
+    objects. Display strings are formatted lazily in :meth:`data`.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._root: Path | None = None
+        self._paths: list[Path] = []
+        self._path_ids: dict[Path, int] = {}
+        self._labels: list[str] = []
+        self._row_paths = array("I")
+        self._row_lines = array("I")
+        self._row_text: list[str] = []
+
+    def set_root(self, root: Path | str | None) -> None:
+        self._root = Path(root) if root else None
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._row_lines)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._row_lines):
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return f"{self._labels[self._row_paths[row]]}:{self._row_lines[row]}  {self._row_text[row]}"
+        if role == Qt.ToolTipRole:
+            return str(self._paths[self._row_paths[row]])
+        if role == ResultRole:
+            return self.result(row)
+        return None
+
+    def result(self, row: int) -> GlobalSearchResult:
+        return GlobalSearchResult(self._paths[self._row_paths[row]], self._row_lines[row], self._row_text[row])
+
+    def append_results(self, results: Iterable[GlobalSearchResult]) -> None:
+        batch = list(results)
+        if not batch:
+            return
+        first = len(self._row_lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        for result in batch:
+            self._row_paths.append(self._intern(result.path))
+            self._row_lines.append(result.line)
+            self._row_text.append(result.content)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._paths.clear()
+        self._path_ids.clear()
+        self._labels.clear()
+        self._row_paths = array("I")
+        self._row_lines = array("I")
+        self._row_text.clear()
+        self.endResetModel()
+
+    def _intern(self, path: Path) -> int:
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            path_id = len(self._paths)
+            self._path_ids[path] = path_id
+            self._paths.append(path)
+            self._labels.append(self._label(path))
+        return path_id
+
+    def _label(self, path: Path) -> str:
+        if self._root is not None:
+            try:
+                return str(path.relative_to(self._root))
+            except ValueError:
+                pass
+        return str(path)
@@ -0,0 +1,227 @@
+"""Background, streaming workspace text search."""
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from PySide6.QtCore import QObject, Signal
+
+from ghostline.core.logging import get_logger
+from ghostline.indexer.workspace_indexer import IndexedFile, WorkspaceIndexer
+from ghostline.workspace.crawler import WorkspaceCrawler, shared_crawler
+
+logger = get_logger(__name__)
+
+SNIFF_BYTES = 8192
+MAX_FILE_BYTES = 8 * 1024 * 1024
+MAX_RESULTS_PER_FILE = 100
+MAX_TOTAL_RESULTS = 5000
+BATCH_SIZE = 100
+
+
+@dataclass
+class GlobalSearchResult:
+    path: Path
+    line: int
+    content: str
+
+
+def compile_query(query: str, *, regex: bool = False, case_sensitive: bool = False) -> re.Pattern[str]:
+    """Compile a search box query; raises :class:`re.error` for bad regexes."""
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(query if regex else re.escape(query), flags)
+
+
+def is_binary(sample: bytes) -> bool:
+    """Treat data containing NUL bytes as binary, as git and grep do."""
+
+    return b"\0" in sample
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        if path.stat().st_size > MAX_FILE_BYTES:
+            return None
+        with path.open("rb") as handle:
+            head = handle.read(SNIFF_BYTES)
+            if is_binary(head):
+                return None
+            data = head + handle.read()
+    except OSError:
+        return None
+    return data.decode("utf-8", errors="ignore")
+
+
+def _candidate_texts(
+    root: Path,
+    query: str,
+    regex: bool,
+    indexer: WorkspaceIndexer | None,
+    crawler: WorkspaceCrawler,
+) -> Iterator[tuple[Path, str]]:
+    if indexer is not None and indexer.root != root:
+        indexer = None
+    indexed: set[Path] = set()
+    candidates: dict[Path, IndexedFile] = {}
+    if indexer is not None:
+        # Snapshot coverage before querying, so a file indexed in between is read from disk.
+        indexed = indexer.indexed_paths()
+        candidates = {file.path: file for file in indexer.candidate_files(query, regex=regex)}
+    for path in crawler.iter_files(root):
+        if path in indexed:
+            candidate = candidates.get(path)
+            if candidate is not None and indexer is not None:
+                text = candidate.text()
+                indexer.note_scanned(path, text)
+                yield path, text
+            continue
+        # Files the index skipped (too large, not UTF-8) or has not reached yet.
+        text = _read_text(path)
+        if text is not None:
+            yield path, text
+
+
+def iter_matches(
+    root: Path | str,
+    query: str,
+    *,
+    regex: bool = False,
+    case_sensitive: bool = False,
+    indexer: WorkspaceIndexer | None = None,
+    crawler: WorkspaceCrawler | None = None,
+    cancel: threading.Event | None = None,
+    max_per_file: int = MAX_RESULTS_PER_FILE,
+) -> Iterator[GlobalSearchResult]:
+    """Yield matching lines under ``root`` as they are found.
+
+    Files come from an ignore-aware crawl that skips oversized and binary
+    files. When ``indexer`` covers ``root`` its trigram index only rules
+    files out: indexed non-candidates are skipped, candidates are read from
+    the index and files it does not hold are read from disk. At most
+    ``max_per_file`` matches are reported per file; setting ``cancel``
+    stops the walk at the next file.
+    """
+
+    pattern = compile_query(query, regex=regex, case_sensitive=case_sensitive)
+    root_path = Path(root)
+    for path, text in _candidate_texts(root_path, query, regex, indexer, crawler or shared_crawler()):
+        if cancel is not None and cancel.is_set():
+            return
+        if not pattern.search(text):
+            continue
+        found = 0
+        for idx, line in enumerate(text.splitlines(), start=1):
+            if pattern.search(line):
+                yield GlobalSearchResult(path, idx, line.strip())
+                found += 1
+                if found >= max_per_file:
+                    break
+
+
+class SearchEngine(QObject):
+    """Runs workspace searches off the UI thread and streams results.
+
+    Each :meth:`start` supersedes the previous search, which is cancelled.
+    Results arrive in batches tagged with the search id so receivers can
+    ignore stragglers from a superseded query.
+    """
+
+    resultsFound = Signal(int, list)
+    searchFinished = Signal(int, int, bool)
+    searchFailed = Signal(int, str)
+
+    def __init__(
+        self,
+        indexer: WorkspaceIndexer | None = None,
+        parent: QObject | None = None,
+        *,
+        crawler: WorkspaceCrawler | None = None,
+        max_results: int = MAX_TOTAL_RESULTS,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        super().__init__(parent)
+        self.indexer = indexer
+        self.crawler = crawler
+        self.max_results = max_results
+        self.batch_size = batch_size
+        self._search_id = 0
+        self._cancel: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def current_search(self) -> int:
+        return self._search_id
+
+    def start(self, root: Path | str, query: str, *, regex: bool = False, case_sensitive: bool = False) -> int:
+        """Cancel any running search and start a new one; returns its id."""
+
+        self.cancel()
+        self._search_id += 1
+        search_id = self._search_id
+        try:
+            compile_query(query, regex=regex, case_sensitive=case_sensitive)
+        except re.error as exc:
+            self.searchFailed.emit(search_id, str(exc))
+            return search_id
+        cancel = threading.Event()
+        self._cancel = cancel
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(search_id, Path(root), query, regex, case_sensitive, cancel),
+            name="workspace-search",
+            daemon=True,
+        )
+        self._thread.start()
+        return search_id
+
+    def cancel(self) -> None:
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+
+    def wait(self, timeout: float | None = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(
+        self, search_id: int, root: Path, query: str, regex: bool, case_sensitive: bool, cancel: threading.Event
+    ) -> None:
+        total = 0
+        truncated = False
+        batch: list[GlobalSearchResult] = []
+        try:
+            for result in iter_matches(
+                root,
+                query,
+                regex=regex,
+                case_sensitive=case_sensitive,
+                indexer=self.indexer,
+                crawler=self.crawler,
+                cancel=cancel,
+            ):
+                batch.append(result)
+                total += 1
+                if len(batch) >= self.batch_size:
+                    self._emit_batch(search_id, batch, cancel)
+                    batch = []
+                if total >= self.max_results:
+                    truncated = True
+                    break
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Workspace search failed")
+            if not cancel.is_set():
+                self.searchFailed.emit(search_id, str(exc))
+            return
+        if cancel.is_set():
+            return
+        self._emit_batch(search_id, batch, cancel)
+        self.searchFinished.emit(search_id, total, truncated)
+
+    def _emit_batch(self, search_id: int, batch: Iterable[GlobalSearchResult], cancel: threading.Event) -> None:
+        batch = list(batch)
+        if batch and not cancel.is_set():
+            self.resultsFound.emit(search_id, batch)
@@ -0,0 +1,201 @@
+"""AST symbol extraction for the semantic index, safe to run in worker processes."""
+from __future__ import annotations
+
+import ast
+import logging
+from pathlib import Path
+from typing import Iterable
+
+from ghostline.indexer.workspace_indexer import content_digest
+from ghostline.semantic.graph import GraphEdge, GraphNode
+from ghostline.semantic.symbols import FileSymbols
+
+logger = logging.getLogger(__name__)
+
+# (name, kind, span start, span end) and (source index, target index, relation).
+CompactNode = tuple[str, str, int | None, int | None]
+CompactEdge = tuple[int, int, str]
+# (path, content digest, nodes, edges, symbols) as returned by :func:`extract_files`.
+ExtractedFile = tuple[str, str, list[CompactNode], list[CompactEdge], FileSymbols]
+
+_ENCODINGS = ("utf-8", "utf-8-sig", "latin-1", "cp1252")
+
+
+def parse_source(path: Path, data: bytes) -> ast.AST | None:
+    """Decode with fallback encoding support and parse."""
+
+    content = None
+    for encoding in _ENCODINGS:
+        try:
+            content = data.decode(encoding)
+            if encoding != "utf-8":
+                logger.info("Indexed %s using %s encoding", path, encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+
+    if content is None:
+        logger.warning("Failed to read %s with any supported encoding", path)
+        return None
+
+    try:
+        return ast.parse(content)
+    except SyntaxError:
+        logger.debug("Skipping non-parseable file %s", path)
+        return None
+
+
+def extract_source(path: Path, data: bytes) -> tuple[list[GraphNode], list[GraphEdge], FileSymbols] | None:
+    """Return the graph nodes and edges defined by one file's source, plus its symbols.
+
+    Calls are not edges yet: they are left in the :class:`FileSymbols` for
+    the symbol table to resolve against the whole workspace.
+    """
+
+    tree = parse_source(path, data)
+    if tree is None:
+        return None
+    visitor = _ASTVisitor(path)
+    visitor.visit(tree)
+    return visitor.nodes, visitor.edges, visitor.symbols
+
+
+def extract_files(paths: Iterable[str]) -> list[ExtractedFile]:
+    """Process-pool entry point: read, hash and extract several files.
+
+    Results are plain tuples so they pickle cheaply back to the parent;
+    files that cannot be read or parsed are left out.
+    """
+
+    results: list[ExtractedFile] = []
+    for raw in paths:
+        path = Path(raw)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        extracted = extract_source(path, data)
+        if extracted is not None:
+            nodes, edges, symbols = extracted
+            results.append((raw, content_digest(data), *compact(nodes, edges), symbols))
+    return results
+
+
+def compact(nodes: Iterable[GraphNode], edges: Iterable[GraphEdge]) -> tuple[list[CompactNode], list[CompactEdge]]:
+    """Flatten one file's nodes and edges; edges refer to nodes by index."""
+
+    index: dict[GraphNode, int] = {}
+    packed_nodes: list[CompactNode] = []
+
+    def _id(node: GraphNode) -> int:
+        node_id = index.get(node)
+        if node_id is None:
+            node_id = index[node] = len(packed_nodes)
+            start, end = node.span or (None, None)
+            packed_nodes.append((node.name, node.kind, start, end))
+        return node_id
+
+    for node in nodes:
+        _id(node)
+    packed_edges = [(_id(edge.source), _id(edge.target), edge.relation) for edge in edges]
+    return packed_nodes, packed_edges
+
+
+def expand(path: Path, nodes: Iterable[CompactNode], edges: Iterable[CompactEdge]) -> tuple[list[GraphNode], list[GraphEdge]]:
+    """Inverse of :func:`compact` for a file at ``path``."""
+
+    graph_nodes = [
+        GraphNode(name, kind, path, (start, end) if start is not None else None)
+        for name, kind, start, end in nodes
+    ]
+    graph_edges = [GraphEdge(graph_nodes[source], graph_nodes[target], relation) for source, target, relation in edges]
+    return graph_nodes, graph_edges
+
+
+class _ASTVisitor(ast.NodeVisitor):
+    """Collect a file's graph nodes, import edges and symbols from a Python AST."""
+
+    def __init__(self, file_path: Path) -> None:
+        self.file_path = file_path
+        self.nodes: list[GraphNode] = []
+        self.edges: list[GraphEdge] = []
+        self.symbols = FileSymbols()
+        # Enclosing (name, kind) definitions.
+        self._scope: list[tuple[str, str]] = []
+        self._calls: set[tuple[str, str]] = set()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:  # type: ignore[override]
+        self._visit_definition(node, "function")
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # type: ignore[override]
+        self._visit_definition(node, "class")
+
+    def visit_Import(self, node: ast.Import) -> None:  # type: ignore[override]
+        for alias in node.names:
+            target = GraphNode(alias.name, "module", self.file_path)
+            self.edges.append(GraphEdge(self._module_node(), target, "imports"))
+            if alias.asname:
+                self.symbols.imports[alias.asname] = alias.name
+            else:
+                # ``import a.b`` binds ``a``.
+                head = alias.name.partition(".")[0]
+                self.symbols.imports[head] = head
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # type: ignore[override]
+        module = node.module or ""
+        target = GraphNode(module, "module", self.file_path)
+        self.edges.append(GraphEdge(self._module_node(), target, "imports"))
+        base = "." * node.level + module
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            qualified = f"{base}.{alias.name}" if module else f"{base}{alias.name}"
+            self.symbols.imports[alias.asname or alias.name] = qualified
+
+    def visit_Call(self, node: ast.Call) -> None:  # type: ignore[override]
+        expression = _dotted(node.func)
+        if expression:
+            call = (".".join(name for name, _kind in self._scope), expression)
+            if call not in self._calls:
+                self._calls.add(call)
+                self.symbols.calls.append(call)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:  # type: ignore[override]
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                variable = GraphNode(target.id, "variable", self.file_path, (node.lineno, node.end_lineno))
+                self.nodes.append(variable)
+                # Only module and class attributes are reachable by name.
+                if all(kind == "class" for _name, kind in self._scope):
+                    self._define(target.id, variable)
+        self.generic_visit(node)
+
+    def _visit_definition(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef, kind: str) -> None:
+        graph_node = GraphNode(node.name, kind, self.file_path, (node.lineno, node.end_lineno))
+        self.nodes.append(graph_node)
+        self._define(node.name, graph_node)
+        self._scope.append((node.name, kind))
+        self.generic_visit(node)
+        self._scope.pop()
+
+    def _define(self, name: str, node: GraphNode) -> None:
+        qualname = ".".join([*(scope for scope, _kind in self._scope), name])
+        start, end = node.span or (None, None)
+        self.symbols.definitions[qualname] = (node.kind, start, end)
+
+    def _module_node(self) -> GraphNode:
+        return GraphNode(self.file_path.stem, "module", self.file_path)
+
+
+def _dotted(node: ast.expr) -> str | None:
+    """Return ``a.b.c`` for a name or attribute chain, else ``None``."""
+
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return f"{base}.{node.attr}" if base else None
+    return None
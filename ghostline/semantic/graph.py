@@ -1,124 +1,343 @@
 """Semantic graph representing workspace knowledge."""
 from __future__ import annotations
 
+import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, TypeVar
 
+from ghostline.semantic.symbol_index import SymbolIndex
 
-@dataclass(frozen=True)
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
 class GraphNode:
-    """Node inside the semantic graph."""
+    """Node inside the semantic graph.
+
+    Nodes are slotted and hash once on creation, since the graph's indexes
+    hash them on every insert and lookup.
+    """
 
     name: str
     kind: str
     file: Path
     span: Tuple[int, int] | None = None
-    metadata: dict = field(default_factory=dict, compare=False, hash=False)
+    metadata: dict | None = field(default=None, compare=False, hash=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.name, self.kind, self.file, self.span)))
+
+    def __hash__(self) -> int:
+        return self._hash
 
+    def __reduce__(self) -> tuple:
+        # String hashes differ between processes, so never pickle ``_hash``.
+        return GraphNode, (self.name, self.kind, self.file, self.span, self.metadata)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GraphEdge:
     """Edge connecting two nodes with a semantic relationship."""
 
     source: GraphNode
     target: GraphNode
     relation: str
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.source, self.target, self.relation)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        return GraphEdge, (self.source, self.target, self.relation)
 
 
 class SemanticGraph:
-    """Lightweight in-memory knowledge graph built from workspace symbols."""
+    """Lightweight in-memory knowledge graph built from workspace symbols.
+
+    Besides the node and edge sets the graph maintains outgoing/incoming
+    adjacency, per-kind, per-relation and per-file indexes, so traversal
+    costs O(degree) and removing a file touches only what that file owns.
+    Symbol names are kept in a :class:`SymbolIndex` for ranked prefix and
+    substring search. Query methods return copies taken under the graph
+    lock, sized by what they select rather than by the graph, so callers on
+    any thread can iterate them while indexing continues.
+
+    Every node is stored once: names, kinds and relations are interned,
+    each file path has a single instance, and edges are rebuilt to point at
+    the stored nodes, so equal nodes arriving from the parser, the store and
+    the symbol table do not each keep their own copy alive.
+    """
 
     def __init__(self) -> None:
-        self._nodes: Set[GraphNode] = set()
+        # Each node maps to itself, letting equal nodes find the stored instance.
+        self._nodes: Dict[GraphNode, GraphNode] = {}
+        self._paths: Dict[Path, Path] = {}
         self._edges: Set[GraphEdge] = set()
         self._by_name: Dict[str, Set[GraphNode]] = {}
+        self._by_kind: Dict[str, Set[GraphNode]] = {}
+        self._symbols = SymbolIndex()
+        self._outgoing: Dict[GraphNode, Set[GraphEdge]] = {}
+        self._incoming: Dict[GraphNode, Set[GraphEdge]] = {}
+        self._by_relation: Dict[str, Set[GraphEdge]] = {}
+        self._nodes_by_file: Dict[Path, Set[GraphNode]] = {}
+        self._edges_by_file: Dict[Path, Set[GraphEdge]] = {}
         self._pattern_tags: set[str] = set()
         self._runtime_hotspots: dict[str, int] = {}
+        self._import_generation = 0
+        self._module_cycles: tuple[int, list[list[GraphNode]]] | None = None
+        # File -> revision of its last change, kept in revision order.
+        self._revision = 0
+        self._file_revisions: Dict[Path, int] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock held while the graph mutates; hold it to read a consistent state."""
+
+        return self._lock
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def changed_files(self, since: int) -> tuple[int, list[Path]]:
+        """Return the current revision and the files changed after ``since``.
+
+        A file changes when a node it owns, or an edge touching it, is added
+        or removed. The cost is proportional to the number of changed files.
+        """
+
+        with self._lock:
+            changed: list[Path] = []
+            for file, revision in reversed(self._file_revisions.items()):
+                if revision <= since:
+                    break
+                changed.append(file)
+            return self._revision, changed
 
     def add_node(self, node: GraphNode) -> None:
-        self._nodes.add(node)
-        self._by_name.setdefault(node.name, set()).add(node)
+        with self._lock:
+            self._add_node(node)
 
     def add_edge(self, edge: GraphEdge) -> None:
-        if edge.source not in self._nodes:
-            self.add_node(edge.source)
-        if edge.target not in self._nodes:
-            self.add_node(edge.target)
-        self._edges.add(edge)
+        with self._lock:
+            self._add_edge(edge)
+
+    def remove_edge(self, edge: GraphEdge) -> None:
+        with self._lock:
+            self._remove_edge(edge)
+
+    def remove_node(self, node: GraphNode) -> None:
+        """Remove ``node`` together with every edge touching it."""
+
+        with self._lock:
+            self._remove_node(node)
+
+    def remove_files(self, files: Iterable[Path]) -> tuple[int, int]:
+        """Drop every node and edge owned by ``files``; returns the counts."""
+
+        removed_nodes = removed_edges = 0
+        with self._lock:
+            for file in set(files):
+                for edge in list(self._edges_by_file.get(file, ())):
+                    self._remove_edge(edge)
+                    removed_edges += 1
+                for node in list(self._nodes_by_file.get(file, ())):
+                    self._remove_node(node)
+                    removed_nodes += 1
+        return removed_nodes, removed_edges
+
+    def replace_file(self, file: Path, nodes: Iterable[GraphNode], edges: Iterable[GraphEdge]) -> tuple[int, int]:
+        """Swap everything ``file`` contributes for ``nodes`` and ``edges``.
+
+        Only the difference against the file's current contents is applied,
+        under the graph lock, so unchanged symbols keep their identity and the
+        cost is proportional to the file rather than the graph. Edges from
+        other files into surviving nodes are kept. Returns how many nodes
+        were added and removed.
+        """
+
+        new_edges = set(edges)
+        new_nodes = set(nodes)
+        for edge in new_edges:
+            new_nodes.add(edge.source)
+            new_nodes.add(edge.target)
+        with self._lock:
+            stale_edges = [
+                edge
+                for edge in self._edges_by_file.get(file, ())
+                if edge.source.file == file and edge not in new_edges
+            ]
+            for edge in stale_edges:
+                self._remove_edge(edge)
+            stale_nodes = [node for node in self._nodes_by_file.get(file, ()) if node not in new_nodes]
+            for node in stale_nodes:
+                self._remove_node(node)
+            added = sum(1 for node in new_nodes if node not in self._nodes)
+            for node in new_nodes:
+                self._add_node(node)
+            for edge in new_edges:
+                self._add_edge(edge)
+        return added, len(stale_nodes)
+
+    def replace_edges(self, file: Path, relation: str, edges: Iterable[GraphEdge]) -> None:
+        """Swap the ``relation`` edges sourced in ``file`` for ``edges``, leaving its nodes alone."""
+
+        new_edges = set(edges)
+        with self._lock:
+            stale = [
+                edge
+                for edge in self._edges_by_file.get(file, ())
+                if edge.source.file == file and edge.relation == relation and edge not in new_edges
+            ]
+            for edge in stale:
+                self._remove_edge(edge)
+            for edge in new_edges:
+                self._add_edge(edge)
 
     def nodes(self) -> Set[GraphNode]:
-        return set(self._nodes)
+        with self._lock:
+            return set(self._nodes)
 
     def edges(self) -> Set[GraphEdge]:
-        return set(self._edges)
+        with self._lock:
+            return set(self._edges)
+
+    def files(self) -> Set[Path]:
+        with self._lock:
+            return set(self._nodes_by_file)
+
+    def nodes_in_file(self, file: Path) -> Set[GraphNode]:
+        return self._copy(self._nodes_by_file, file)
+
+    def edges_for_file(self, file: Path) -> Set[GraphEdge]:
+        return self._copy(self._edges_by_file, file)
+
+    def symbol_names(self) -> Set[str]:
+        with self._lock:
+            return set(self._by_name)
+
+    def shared_names(self) -> Dict[str, List[Path]]:
+        """Map each name carried by several nodes to the files of those nodes.
+
+        Walks the name index, so only the duplicated names are copied.
+        """
+
+        with self._lock:
+            return {
+                name: [node.file for node in nodes] for name, nodes in self._by_name.items() if len(nodes) > 1
+            }
 
     def references(self, symbol: str) -> Set[GraphNode]:
-        return self._by_name.get(symbol, set())
+        return self._copy(self._by_name, symbol)
+
+    def nodes_of_kind(self, kind: str) -> Set[GraphNode]:
+        return self._copy(self._by_kind, kind)
+
+    def search_symbols(self, query: str, limit: int | None = 20, kind: str | None = None) -> list[str]:
+        """Return up to ``limit`` symbol names matching ``query``, best first.
+
+        Matching is case-insensitive: exact names rank first, then prefixes,
+        word-boundary and plain substring matches, shorter names first within
+        each. With ``kind`` only names with a node of that kind count.
+        """
+
+        if kind is None:
+            return self._symbols.search(query, limit)
+
+        def _has_kind(name: str) -> bool:
+            return any(node.kind == kind for node in self._by_name.get(name, ()))
+
+        with self._lock:
+            return self._symbols.search(query, limit, _has_kind)
+
+    def outgoing(self, node: GraphNode) -> Set[GraphEdge]:
+        return self._copy(self._outgoing, node)
+
+    def incoming(self, node: GraphNode) -> Set[GraphEdge]:
+        return self._copy(self._incoming, node)
+
+    def edges_by_relation(self, relation: str) -> Set[GraphEdge]:
+        return self._copy(self._by_relation, relation)
+
+    def iter_neighbours(self, node: GraphNode, relation: str | None = None) -> Iterator[GraphNode]:
+        """Iterate ``node``'s successors without copying; hold :attr:`lock` while iterating."""
+
+        for edge in self._outgoing.get(node, ()):
+            if relation is None or edge.relation == relation:
+                yield edge.target
 
     def neighbours(self, node: GraphNode, relation: str | None = None) -> List[GraphNode]:
-        neighbours: list[GraphNode] = []
-        for edge in self._edges:
-            if edge.source == node and (relation is None or edge.relation == relation):
-                neighbours.append(edge.target)
-        return neighbours
+        with self._lock:
+            return list(self.iter_neighbours(node, relation))
 
     def definition_edges(self) -> Iterable[GraphEdge]:
-        return [edge for edge in self._edges if edge.relation == "defines"]
+        return self.edges_by_relation("defines")
 
     def import_edges(self) -> Iterable[GraphEdge]:
-        return [edge for edge in self._edges if edge.relation == "imports"]
+        return self.edges_by_relation("imports")
 
     def call_edges(self) -> Iterable[GraphEdge]:
-        return [edge for edge in self._edges if edge.relation == "calls"]
+        return self.edges_by_relation("calls")
 
     def find_cycles(self) -> list[list[GraphNode]]:
-        """Return simple cycles using a depth-first traversal."""
-
-        visited: Set[GraphNode] = set()
-        stack: list[GraphNode] = []
-        cycles: list[list[GraphNode]] = []
-
-        def dfs(node: GraphNode) -> None:
-            visited.add(node)
-            stack.append(node)
-            for neighbor in self.neighbours(node):
-                if neighbor not in visited:
-                    dfs(neighbor)
-                elif neighbor in stack:
-                    index = stack.index(neighbor)
-                    cycles.append(stack[index:].copy())
-            stack.pop()
-
-        for node in list(self._nodes):
-            if node not in visited:
-                dfs(node)
+        """Return every cycle, one per strongly connected component, in O(V+E)."""
+
+        with self._lock:
+            return cyclic_components(list(self._outgoing), self.iter_neighbours)
+
+    def module_cycles(self) -> list[list[GraphNode]]:
+        """Return import cycles between workspace modules.
+
+        Computed with Tarjan's algorithm over the module import graph and
+        cached until import edges or the set of indexed files change.
+        """
+
+        with self._lock:
+            cached = self._module_cycles
+            if cached is not None and cached[0] == self._import_generation:
+                return cached[1]
+            generation = self._import_generation
+            imports = self._module_imports()
+        cycles = [
+            [GraphNode(file.stem, "module", file) for file in component]
+            for component in cyclic_components(sorted(imports), lambda file: sorted(imports.get(file, ())))
+        ]
+        with self._lock:
+            if self._import_generation == generation:
+                self._module_cycles = (generation, cycles)
         return cycles
 
     def module_map(self) -> dict[str, set[str]]:
         """Return adjacency map for modules and their imports."""
 
         modules: dict[str, set[str]] = {}
-        for edge in self.import_edges():
-            src = edge.source.file.stem
-            dst = edge.target.file.stem
-            modules.setdefault(src, set()).add(dst)
+        with self._lock:
+            for edge in self._by_relation.get("imports", ()):
+                modules.setdefault(edge.source.file.stem, set()).add(edge.target.file.stem)
         return modules
 
     def module_churn(self) -> dict[str, int]:
         """Estimate churn based on how many symbols a module defines."""
 
         churn: dict[str, int] = {}
-        for node in self._nodes:
-            if node.kind in {"function", "class"}:
-                churn[node.file.stem] = churn.get(node.file.stem, 0) + 1
+        with self._lock:
+            for kind in ("function", "class"):
+                for node in self._by_kind.get(kind, ()):
+                    churn[node.file.stem] = churn.get(node.file.stem, 0) + 1
         return churn
 
     def pattern_fingerprint(self) -> str:
         """Summarise the graph for long-horizon planners."""
 
         modules = sorted(self.module_map().keys())
-        cycles = ["->".join(node.name for node in cycle) for cycle in self.find_cycles()]
+        cycles = ["->".join(node.name for node in cycle) for cycle in self.module_cycles()]
         imports = sorted({edge.target.name for edge in self.import_edges()})
         patterns = ", ".join(sorted(self._pattern_tags)) or "none"
         hotspots = ", ".join(sorted(self._runtime_hotspots.keys())) or "none"
@@ -149,3 +368,179 @@ class SemanticGraph:
             node = GraphNode(call, "function", Path(path))
             self.add_node(node)
 
+    # Internal ---------------------------------------------------------
+    def _copy(self, index: Dict[Any, Set[T]], key: Any) -> Set[T]:
+        with self._lock:
+            return set(index.get(key, ()))
+
+    def _add_node(self, node: GraphNode) -> GraphNode:
+        """Store ``node`` unless present; returns the stored instance."""
+
+        stored = self._nodes.get(node)
+        if stored is not None:
+            return stored
+        file = self._paths.get(node.file)
+        if file is None:
+            # A new file can resolve imports that previously went nowhere.
+            self._import_generation += 1
+            file = self._paths[node.file] = node.file
+        name = sys.intern(node.name)
+        kind = sys.intern(node.kind)
+        if name is not node.name or kind is not node.kind or file is not node.file:
+            node = GraphNode(name, kind, file, node.span, node.metadata)
+        self._nodes[node] = node
+        if name not in self._by_name:
+            self._symbols.add(name)
+        self._by_name.setdefault(name, set()).add(node)
+        self._by_kind.setdefault(kind, set()).add(node)
+        self._nodes_by_file.setdefault(file, set()).add(node)
+        self._touch(file)
+        return node
+
+    def _add_edge(self, edge: GraphEdge) -> None:
+        if edge in self._edges:
+            return
+        source = self._add_node(edge.source)
+        target = self._add_node(edge.target)
+        relation = sys.intern(edge.relation)
+        if source is not edge.source or target is not edge.target or relation is not edge.relation:
+            edge = GraphEdge(source, target, relation)
+        self._edges.add(edge)
+        self._outgoing.setdefault(edge.source, set()).add(edge)
+        self._incoming.setdefault(edge.target, set()).add(edge)
+        self._by_relation.setdefault(edge.relation, set()).add(edge)
+        if edge.relation == "imports":
+            self._import_generation += 1
+        self._edges_by_file.setdefault(edge.source.file, set()).add(edge)
+        self._edges_by_file.setdefault(edge.target.file, set()).add(edge)
+        self._touch(edge.source.file, edge.target.file)
+
+    def _remove_edge(self, edge: GraphEdge) -> None:
+        if edge not in self._edges:
+            return
+        self._edges.discard(edge)
+        _discard(self._outgoing, edge.source, edge)
+        _discard(self._incoming, edge.target, edge)
+        _discard(self._by_relation, edge.relation, edge)
+        if edge.relation == "imports":
+            self._import_generation += 1
+        _discard(self._edges_by_file, edge.source.file, edge)
+        _discard(self._edges_by_file, edge.target.file, edge)
+        self._touch(edge.source.file, edge.target.file)
+
+    def _remove_node(self, node: GraphNode) -> None:
+        if node not in self._nodes:
+            return
+        for edge in list(self._outgoing.get(node, ())) + list(self._incoming.get(node, ())):
+            self._remove_edge(edge)
+        del self._nodes[node]
+        _discard(self._by_name, node.name, node)
+        if node.name not in self._by_name:
+            self._symbols.remove(node.name)
+        _discard(self._by_kind, node.kind, node)
+        _discard(self._nodes_by_file, node.file, node)
+        if node.file not in self._nodes_by_file:
+            del self._paths[node.file]
+            self._import_generation += 1
+        self._touch(node.file)
+
+    def _touch(self, *files: Path) -> None:
+        self._revision += 1
+        for file in files:
+            # Re-inserting moves the file to the end, keeping revision order.
+            self._file_revisions.pop(file, None)
+            self._file_revisions[file] = self._revision
+
+    def _module_imports(self) -> dict[Path, set[Path]]:
+        """Map each indexed file to the indexed files it imports.
+
+        Import targets are resolved by dotted-path suffix (``pkg.mod`` matches
+        ``.../pkg/mod.py`` and ``.../pkg/mod/__init__.py``); targets whose node
+        already lives in another file are taken as resolved.
+        """
+
+        by_name: dict[str, Path] = {}
+        for file in self._nodes_by_file:
+            parts = list(file.with_suffix("").parts)
+            if parts and parts[-1] == "__init__":
+                parts.pop()
+            for start in range(len(parts) - 1, -1, -1):
+                by_name.setdefault(".".join(parts[start:]), file)
+        imports: dict[Path, set[Path]] = {}
+        for edge in self._by_relation.get("imports", ()):
+            source = edge.source.file
+            if edge.target.file != source:
+                target: Path | None = edge.target.file
+            else:
+                target = by_name.get(edge.target.name)
+            if target is not None:
+                imports.setdefault(source, set()).add(target)
+        return imports
+
+
+def strongly_connected_components(nodes: Iterable[T], successors: Callable[[T], Iterable[T]]) -> list[list[T]]:
+    """Tarjan's algorithm without recursion, so deep graphs cannot overflow the stack.
+
+    Components are returned in reverse topological order, each listing its
+    nodes in discovery order.
+    """
+
+    index: dict[T, int] = {}
+    low: dict[T, int] = {}
+    stack: list[T] = []
+    on_stack: set[T] = set()
+    components: list[list[T]] = []
+
+    def _visit(node: T) -> Iterator[T]:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        return iter(successors(node))
+
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, _visit(root))]
+        while work:
+            node, pending = work[-1]
+            for successor in pending:
+                if successor not in index:
+                    work.append((successor, _visit(successor)))
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component: list[T] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+    return components
+
+
+def cyclic_components(nodes: Iterable[T], successors: Callable[[T], Iterable[T]]) -> list[list[T]]:
+    """Strongly connected components that contain a cycle, self-loops included."""
+
+    return [
+        component
+        for component in strongly_connected_components(nodes, successors)
+        if len(component) > 1 or component[0] in successors(component[0])
+    ]
+
+
+def _discard(index: Dict[Any, Set[T]], key: Any, item: T) -> None:
+    items = index.get(key)
+    if items is None:
+        return
+    items.discard(item)
+    if not items:
+        del index[key]
@@ -1,24 +1,79 @@
 """Semantic indexing orchestrator."""
 from __future__ import annotations
 
-import ast
 import logging
+import sqlite3
+import threading
+from concurrent.futures import Future, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Mapping
 
-from ghostline.core.threads import BackgroundWorkers
+from ghostline.core.processes import ProcessWorkers, shared_process_workers
+from ghostline.core.threads import BACKGROUND, TaskLane, shared_scheduler
+from ghostline.indexer.workspace_indexer import content_digest
+from ghostline.semantic.extract import ExtractedFile, expand, extract_files, extract_source
 from ghostline.semantic.graph import GraphEdge, GraphNode, SemanticGraph
+from ghostline.semantic.snapshot import GraphSnapshotFeed
+from ghostline.semantic.store import SemanticStore
+from ghostline.semantic.symbols import FileSymbols, SymbolTable, module_name
+from ghostline.workspace.crawler import WorkspaceCrawler, shared_crawler
 
 logger = logging.getLogger(__name__)
 
+# Files needing a parse before the process pool is worth starting, and how
+# many files each worker task handles.
+PROCESS_POOL_THRESHOLD = 64
+PARSE_CHUNK_SIZE = 32
+
+
+@dataclass
+class _ParsedFile:
+    path: Path
+    digest: str
+    nodes: list[GraphNode]
+    edges: list[GraphEdge]
+    symbols: FileSymbols
+    cached: bool = False
 
-class SemanticIndexManager:
-    """Builds and updates a semantic graph of the workspace."""
 
-    def __init__(self, workspace_provider: Callable[[], str | None], workers: BackgroundWorkers | None = None) -> None:
+class SemanticIndexManager:
+    """Builds and updates a semantic graph of the workspace.
+
+    Each file's nodes and edges are persisted in a :class:`SemanticStore`
+    keyed by content digest, so a relaunch restores unchanged files from
+    SQLite instead of parsing them again. Call edges come from the
+    :class:`SymbolTable`, which links them to the definitions they reach
+    across modules and re-resolves callers when those definitions change.
+    """
+
+    def __init__(
+        self,
+        workspace_provider: Callable[[], str | None],
+        workers: TaskLane | None = None,
+        crawler: WorkspaceCrawler | None = None,
+        persist: bool = True,
+        process_threshold: int = PROCESS_POOL_THRESHOLD,
+        process_workers: int | None = None,
+        processes: ProcessWorkers | None = None,
+    ) -> None:
         self.workspace_provider = workspace_provider
-        self.workers = workers or BackgroundWorkers()
+        self.workers = workers or shared_scheduler().lane(BACKGROUND)
+        self.crawler = crawler or shared_crawler()
+        self.persist = persist
         self.graph = SemanticGraph()
+        self.snapshots = GraphSnapshotFeed(self.graph, workspace_provider)
+        self.symbol_table = SymbolTable()
+        # Serializes graph and symbol table updates between indexing threads.
+        self._apply_lock = threading.RLock()
+        self._store: SemanticStore | None = None
+        self._store_lock = threading.Lock()
+        self.process_threshold = process_threshold
+        # A private pool only when a size is asked for; shut down with the manager.
+        self._owns_processes = processes is None and process_workers is not None
+        self.processes = processes or (
+            ProcessWorkers(process_workers) if process_workers is not None else shared_process_workers()
+        )
         self._observers: list[Callable[[Path], None]] = []
         self._recent_paths: list[Path] = []
 
@@ -26,10 +81,15 @@ class SemanticIndexManager:
         self._observers.append(callback)
 
     def _notify(self, path: Path) -> None:
-        self._recent_paths.append(path)
+        self._notify_many([path])
+
+    def _notify_many(self, paths: list[Path]) -> None:
+        """Record ``paths`` as recent and notify observers once for the batch."""
+
+        self._recent_paths.extend(paths)
         self._recent_paths = self._recent_paths[-20:]
         for cb in self._observers:
-            cb(path)
+            cb(paths[-1])
 
     def reindex(self, paths: Iterable[str] | None = None) -> None:
         workspace = self.workspace_provider()
@@ -47,65 +107,241 @@ class SemanticIndexManager:
         elif event_type == "deleted":
             self._remove_file(Path(path))
 
+    def apply_changes(self, changes: Mapping[Path, str]) -> None:
+        """Apply a coalesced batch of file events to the graph in one pass.
+
+        Modified files have their nodes swapped in via
+        :meth:`SemanticGraph.replace_file` rather than merged, and a file
+        that no longer parses keeps its last good version; directory events
+        crawl the whole tree beneath the directory for new and vanished
+        modules.
+        Observers are notified once for the whole batch.
+        """
+
+        workspace = self.workspace_provider()
+        root = Path(workspace) if workspace else None
+        known = set(self.graph.files())
+        removed: set[Path] = set()
+        to_index: list[Path] = []
+        for raw, event_type in changes.items():
+            path = Path(raw)
+            if event_type == "deleted" or not path.exists():
+                removed.update(file for file in known if file == path or path in file.parents)
+            elif path.is_dir():
+                under = {file for file in known if file == path or path in file.parents}
+                if root and path != root and self.crawler.is_ignored(path, root):
+                    removed.update(under)
+                    continue
+                present = set(self.crawler.iter_files(path, suffixes=(".py",)))
+                removed.update(under - present)
+                to_index.extend(sorted(present - known))
+            elif path.suffix == ".py" and not (root and self.crawler.is_ignored(path, root)):
+                to_index.append(path)
+
+        parsed = [result for result in map(self._prepare_file, to_index) if result]
+        self._remove_files(removed)
+        self._apply(parsed)
+        touched = removed | set(to_index)
+        if touched:
+            self._notify_many(sorted(touched))
+
     def _index_path(self, path: Path) -> None:
         if path.is_dir():
-            for child in path.rglob("*.py"):
-                self._index_file(child)
+            self._index_directory(path)
         else:
             self._index_file(path)
         self._notify(path)
 
-    def _index_file(self, path: Path) -> None:
-        """Index a file with fallback encoding support."""
-        content = None
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-
-        for encoding in encodings:
-            try:
-                content = path.read_text(encoding=encoding)
-                if encoding != 'utf-8':
-                    logger.info("Indexed %s using %s encoding", path, encoding)
-                break
-            except (OSError, UnicodeDecodeError):
-                continue
-
-        if content is None:
-            logger.warning("Failed to read %s with any supported encoding", path)
-            return
+    def _index_directory(self, path: Path) -> None:
+        """Index a tree, restoring unchanged files and extracting the rest.
+
+        The crawler threads read and hash files and restore the unchanged
+        ones from the store. Files that need parsing go to the shared worker
+        processes in chunks once there are enough of them to pay for it,
+        because ``ast.parse`` holds the GIL. Results are merged on this
+        thread, so graph mutation stays single-writer.
+        """
+
+        seen: list[Path] = []
+        pending: list[str] = []
+        futures: dict[Future, list[str]] = {}
+        offload = False
+
+        def _merge(results: list[ExtractedFile]) -> None:
+            batch = [
+                _ParsedFile(Path(raw), digest, *expand(Path(raw), nodes, edges), symbols)
+                for raw, digest, nodes, edges, symbols in results
+            ]
+            self._apply(batch)
+            seen.extend(parsed.path for parsed in batch)
+
+        def _dispatch(final: bool) -> None:
+            nonlocal offload
+            if not offload and len(pending) >= self.process_threshold:
+                offload = self.processes.available
+            if not offload:
+                if final and pending:
+                    _merge(extract_files(pending))
+                    pending.clear()
+                return
+            while len(pending) >= PARSE_CHUNK_SIZE or (final and pending):
+                chunk = pending[:PARSE_CHUNK_SIZE]
+                del pending[:PARSE_CHUNK_SIZE]
+                future = self.processes.submit(f"semantic-parse:{chunk[0]}", extract_files, chunk)
+                if future is None:
+                    _merge(extract_files(chunk))
+                else:
+                    futures[future] = chunk
+
+        for batch in self.crawler.crawl(path, self._check_store, suffixes=(".py",)):
+            restored = [item for item in batch if isinstance(item, _ParsedFile)]
+            self._apply(restored)
+            seen.extend(parsed.path for parsed in restored)
+            pending.extend(str(item) for item in batch if isinstance(item, Path))
+            _dispatch(final=False)
+            for future in [future for future in futures if future.done()]:
+                _merge(self._chunk_result(future, futures.pop(future)))
+        _dispatch(final=True)
+        for future in as_completed(list(futures)):
+            _merge(self._chunk_result(future, futures.pop(future)))
+
+        store = self.store
+        workspace = self.workspace_provider()
+        if store is not None and workspace and path == Path(workspace):
+            self._guard_store(store.retain, seen)
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            logger.debug("Skipping non-parseable file %s", path)
-            return
+    def _index_file(self, path: Path) -> None:
+        parsed = self._prepare_file(path)
+        if parsed:
+            self._apply([parsed])
 
-        visitor = _ASTVisitor(path, self.graph)
-        visitor.visit(tree)
+    def _apply(self, batch: list[_ParsedFile]) -> None:
+        """Swap each file's nodes into the graph and persist fresh parses.
 
-    def _remove_file(self, path: Path) -> None:
-        """Remove all nodes and edges associated with a file."""
-        nodes_to_remove = [node for node in self.graph.nodes() if node.file == path]
+        The whole batch is registered in the symbol table before any calls
+        are resolved, so calls between files of one batch link up; files
+        elsewhere whose calls reach a changed definition are re-resolved.
+        """
 
-        if not nodes_to_remove:
+        if not batch:
             return
+        workspace = self.workspace_provider()
+        root = Path(workspace) if workspace else None
+        fresh = []
+        with self._apply_lock:
+            changed: set[str] = set()
+            for parsed in batch:
+                changed |= self.symbol_table.update_file(parsed.path, *module_name(parsed.path, root), parsed.symbols)
+            for parsed in batch:
+                calls = self.symbol_table.resolve_calls(parsed.path)
+                self.graph.replace_file(parsed.path, parsed.nodes, [*parsed.edges, *calls])
+                if not parsed.cached:
+                    fresh.append((parsed.path, parsed.digest, parsed.nodes, [*parsed.edges, *calls], parsed.symbols))
+            self._resolve_dependents(changed, {parsed.path for parsed in batch})
+        store = self.store
+        if fresh and store is not None:
+            self._guard_store(store.save_files, fresh)
+
+    def _resolve_dependents(self, changed: set[str], skip: set[Path]) -> None:
+        for file in self.symbol_table.dependents(changed) - skip:
+            self.graph.replace_edges(file, "calls", self.symbol_table.resolve_calls(file))
+
+    def _restore(self, store: SemanticStore, path: Path, digest: str) -> _ParsedFile:
+        nodes, edges, symbols = store.load_file(path)
+        # Stored call edges may point at definitions elsewhere that have
+        # since moved; calls are resolved again from the symbols.
+        local = [edge for edge in edges if edge.relation != "calls"]
+        nodes = [node for node in nodes if node.file == path]
+        return _ParsedFile(path, digest, nodes, local, symbols, cached=True)
+
+    def _check_store(self, path: Path) -> _ParsedFile | Path | None:
+        """Restore ``path`` from the store if unchanged; otherwise return it for parsing."""
+
+        store = self.store
+        if store is None:
+            return path
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        digest = content_digest(data)
+        if store.digest(path) == digest:
+            return self._restore(store, path, digest)
+        return path
 
-        # Remove nodes (accessing private attribute, but necessary for cleanup)
-        for node in nodes_to_remove:
-            self.graph._nodes.discard(node)
+    def _prepare_file(self, path: Path) -> _ParsedFile | None:
+        """Restore ``path`` from the store if its content is unchanged, else parse it."""
 
-        # Remove edges associated with this file
-        edges_to_remove = [
-            edge for edge in self.graph.edges()
-            if edge.source.file == path or edge.target.file == path
-        ]
-        for edge in edges_to_remove:
-            self.graph._edges.discard(edge)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            logger.warning("Failed to read %s", path)
+            return None
+        digest = content_digest(data)
+        store = self.store
+        if store is not None and store.digest(path) == digest:
+            return self._restore(store, path, digest)
+        extracted = extract_source(path, data)
+        if extracted is None:
+            return None
+        return _ParsedFile(path, digest, *extracted)
+
+    def _chunk_result(self, future: Future, chunk: list[str]) -> list[ExtractedFile]:
+        """Return a worker's results, redoing the chunk in-process if it failed."""
 
-        logger.info("Removed %d nodes and %d edges for %s",
-                    len(nodes_to_remove), len(edges_to_remove), path)
+        try:
+            return future.result()
+        except Exception:  # noqa: BLE001 - includes crashed workers and cancellation
+            logger.warning("Semantic extraction worker failed; parsing in-process", exc_info=True)
+        return extract_files(chunk)
 
-        # Notify observers about removal
-        self._notify(path)
+    def _remove_file(self, path: Path) -> None:
+        """Remove all nodes and edges associated with a file."""
+        if self._remove_files({path}):
+            # Notify observers about removal
+            self._notify(path)
+
+    def _remove_files(self, paths: set[Path]) -> bool:
+        """Remove nodes and edges for every file in ``paths`` in a single pass."""
+        if not paths:
+            return False
+        store = self.store
+        if store is not None:
+            self._guard_store(store.remove_files, paths)
+        with self._apply_lock:
+            changed = self.symbol_table.remove_files(paths)
+            removed_nodes, removed_edges = self.graph.remove_files(paths)
+            self._resolve_dependents(changed, paths)
+        if not removed_nodes:
+            return False
+        logger.info("Removed %d nodes and %d edges for %d file(s)", removed_nodes, removed_edges, len(paths))
+        return True
+
+    @property
+    def store(self) -> SemanticStore | None:
+        """The persistent store for the current workspace, opened lazily."""
+
+        if not self.persist:
+            return None
+        workspace = self.workspace_provider()
+        root = Path(workspace) if workspace else None
+        with self._store_lock:
+            if self._store is not None and self._store.root != root:
+                self._store.close()
+                self._store = None
+            if self._store is None and root is not None:
+                try:
+                    self._store = SemanticStore(root)
+                except (OSError, sqlite3.Error):
+                    logger.warning("Semantic store unavailable for %s", root, exc_info=True)
+                    self.persist = False
+            return self._store
+
+    def _guard_store(self, operation: Callable[..., None], *args: Any) -> None:
+        try:
+            operation(*args)
+        except sqlite3.Error:
+            logger.warning("Semantic store update failed", exc_info=True)
 
     def recent_paths(self) -> list[Path]:
         """Return recently indexed paths for UI and AI consumers."""
@@ -114,6 +350,12 @@ class SemanticIndexManager:
 
     def shutdown(self) -> None:
         self.workers.shutdown()
+        if self._owns_processes:
+            self.processes.shutdown()
+        with self._store_lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
 
     def record_runtime_event(self, observation: Any) -> None:
         """Merge runtime observations into the semantic graph."""
@@ -127,124 +369,15 @@ class SemanticIndexManager:
             logger.exception("Failed to merge runtime observation")
 
     def get_graph_snapshot(self) -> dict:
-        """Return a lightweight, serializable snapshot of the semantic graph."""
+        """Return a lightweight, serializable snapshot of the semantic graph.
 
-        workspace = self.workspace_provider()
-        root = Path(workspace) if workspace else None
+        The snapshot carries a ``version`` that can later be passed to
+        :meth:`get_graph_delta`.
+        """
 
-        def _format_path(path: Path) -> str:
-            if root:
-                try:
-                    return str(path.relative_to(root))
-                except ValueError:
-                    pass
-            return str(path)
-
-        def _add_node(
-            collection: dict[str, dict], node_id: str, node_type: str, label: str, file_path: Path | None, span: tuple[int, int] | None
-        ) -> dict[str, dict]:
-            if node_id in collection:
-                return collection
-            collection[node_id] = {
-                "id": node_id,
-                "type": node_type,
-                "label": label,
-                "file": str(file_path) if file_path else None,
-                "line": span[0] - 1 if span else None,
-            }
-            return collection
-
-        nodes: dict[str, dict] = {}
-        edges: list[dict] = []
-        edge_keys: set[tuple[str, str, str]] = set()
-        files_seen: set[Path] = set()
-
-        for node in self.graph.nodes():
-            formatted_path = _format_path(node.file)
-            file_id = f"file:{formatted_path}"
-            if node.file not in files_seen:
-                files_seen.add(node.file)
-                _add_node(nodes, file_id, "file", node.file.name, node.file, None)
-
-            module_id = f"module:{formatted_path}"
-            _add_node(nodes, module_id, "module", node.file.stem, node.file, None)
-            edge_key = (module_id, file_id, "contains")
-            if edge_key not in edge_keys:
-                edge_keys.add(edge_key)
-                edges.append({"source": module_id, "target": file_id, "type": "contains"})
-
-            if node.kind != "module":
-                symbol_prefix = "func" if node.kind == "function" else node.kind
-                symbol_id = f"{symbol_prefix}:{formatted_path}:{node.name}"
-                _add_node(nodes, symbol_id, node.kind, node.name, node.file, node.span)
-                symbol_edge_key = (file_id, symbol_id, "contains")
-                if symbol_edge_key not in edge_keys:
-                    edge_keys.add(symbol_edge_key)
-                    edges.append({"source": file_id, "target": symbol_id, "type": "contains"})
-
-        def _node_id_for(graph_node: GraphNode) -> str:
-            formatted_path = _format_path(graph_node.file)
-            if graph_node.kind == "module":
-                return f"module:{formatted_path}"
-            prefix = "func" if graph_node.kind == "function" else graph_node.kind
-            return f"{prefix}:{formatted_path}:{graph_node.name}"
-
-        for edge in self.graph.edges():
-            src_id = _node_id_for(edge.source)
-            tgt_id = _node_id_for(edge.target)
-            if src_id not in nodes:
-                _add_node(nodes, src_id, edge.source.kind, edge.source.name, edge.source.file, edge.source.span)
-            if tgt_id not in nodes:
-                _add_node(nodes, tgt_id, edge.target.kind, edge.target.name, edge.target.file, edge.target.span)
-            edge_key = (src_id, tgt_id, edge.relation)
-            if edge_key not in edge_keys:
-                edge_keys.add(edge_key)
-                edges.append({"source": src_id, "target": tgt_id, "type": edge.relation})
-
-        return {"nodes": list(nodes.values()), "edges": edges}
-
-
-class _ASTVisitor(ast.NodeVisitor):
-    """Populate the semantic graph using a Python AST."""
-
-    def __init__(self, file_path: Path, graph: SemanticGraph) -> None:
-        self.file_path = file_path
-        self.graph = graph
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # type: ignore[override]
-        func_node = GraphNode(node.name, "function", self.file_path, (node.lineno, node.end_lineno))
-        self.graph.add_node(func_node)
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # type: ignore[override]
-        class_node = GraphNode(node.name, "class", self.file_path, (node.lineno, node.end_lineno))
-        self.graph.add_node(class_node)
-        self.generic_visit(node)
-
-    def visit_Import(self, node: ast.Import) -> None:  # type: ignore[override]
-        for alias in node.names:
-            target = GraphNode(alias.name, "module", self.file_path)
-            self.graph.add_edge(GraphEdge(self._module_node(), target, "imports"))
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # type: ignore[override]
-        module = node.module or ""
-        target = GraphNode(module, "module", self.file_path)
-        self.graph.add_edge(GraphEdge(self._module_node(), target, "imports"))
-
-    def visit_Call(self, node: ast.Call) -> None:  # type: ignore[override]
-        if isinstance(node.func, ast.Name):
-            source = self._module_node()
-            target = GraphNode(node.func.id, "function", self.file_path)
-            self.graph.add_edge(GraphEdge(source, target, "calls"))
-        self.generic_visit(node)
-
-    def visit_Assign(self, node: ast.Assign) -> None:  # type: ignore[override]
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                variable = GraphNode(target.id, "variable", self.file_path, (node.lineno, node.end_lineno))
-                self.graph.add_node(variable)
-        self.generic_visit(node)
-
-    def _module_node(self) -> GraphNode:
-        return GraphNode(self.file_path.stem, "module", self.file_path)
+        return self.snapshots.snapshot()
+
+    def get_graph_delta(self, since: int | None) -> dict:
+        """Return the snapshot changes after version ``since``; see :class:`GraphSnapshotFeed`."""
 
+        return self.snapshots.delta(since)
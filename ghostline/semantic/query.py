@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Callable, Iterable
 
 from ghostline.semantic.graph import GraphNode, SemanticGraph
+from ghostline.semantic.store import SemanticStore
+from ghostline.semantic.symbols import SymbolTable
 
 
 @dataclass
@@ -16,13 +18,36 @@ class NavigationResult:
 
 
 class SemanticQueryEngine:
-    """Runs higher-level graph queries."""
+    """Runs higher-level graph queries.
 
-    def __init__(self, graph: SemanticGraph) -> None:
+    Dotted names are resolved through the :class:`SymbolTable`, plain names
+    through the graph's name index; callers and callees are then read off
+    its call-edge adjacency. Lookups by name and kind fall back to the
+    persistent store while the in-memory graph has no answer, e.g. before
+    the first reindex finishes.
+    """
+
+    def __init__(
+        self,
+        graph: SemanticGraph,
+        store: Callable[[], SemanticStore | None] | None = None,
+        symbols: SymbolTable | None = None,
+    ) -> None:
         self.graph = graph
+        self.store_provider = store
+        self.symbols = symbols
 
     def find_usages(self, symbol: str) -> list[GraphNode]:
-        return list(self.graph.references(symbol))
+        """Return the definitions of ``symbol`` followed by the nodes calling them."""
+
+        definitions = list(self._definitions(symbol))
+        return _unique([*definitions, *self._call_neighbours(definitions, incoming=True)])
+
+    def callers(self, symbol: str) -> list[GraphNode]:
+        return self._call_neighbours(self._definitions(symbol), incoming=True)
+
+    def callees(self, symbol: str) -> list[GraphNode]:
+        return self._call_neighbours(self._definitions(symbol), incoming=False)
 
     def architecture_map(self) -> dict[str, set[str]]:
         return self.graph.module_map()
@@ -31,12 +56,53 @@ class SemanticQueryEngine:
         return self.graph.find_cycles()
 
     def find_related_functions(self, target: str) -> list[NavigationResult]:
-        results: list[NavigationResult] = []
-        for node in self.graph.references(target):
-            if node.kind == "function":
-                results.append(NavigationResult(f"Function {node.name}", node))
-        return results
+        """Return ``target``'s function definitions and the functions they call."""
+
+        definitions = list(self._definitions(target))
+        related = _unique([*definitions, *self._call_neighbours(definitions, incoming=False)])
+        return [NavigationResult(f"Function {node.name}", node) for node in related if node.kind == "function"]
+
+    def search(self, query: str, kind: str | None = None, limit: int | None = 20) -> list[GraphNode]:
+        """Return nodes whose name matches ``query``, best matching names first."""
+
+        nodes = []
+        for name in self.graph.search_symbols(query, limit, kind):
+            nodes.extend(node for node in self.graph.references(name) if kind is None or node.kind == kind)
+        return nodes
 
     def search_by_kind(self, kind: str) -> Iterable[GraphNode]:
-        return [node for node in self.graph.nodes() if node.kind == kind]
+        nodes = self.graph.nodes_of_kind(kind)
+        store = self._store()
+        if not nodes and store is not None:
+            return store.find_nodes(kind=kind)
+        return nodes
+
+    def _definitions(self, symbol: str) -> Iterable[GraphNode]:
+        if "." in symbol and self.symbols is not None:
+            node = self.symbols.lookup(symbol)
+            if node is not None:
+                return [node]
+        return self._references(symbol)
+
+    def _call_neighbours(self, nodes: Iterable[GraphNode], incoming: bool) -> list[GraphNode]:
+        neighbours = []
+        for node in nodes:
+            for edge in self.graph.incoming(node) if incoming else self.graph.outgoing(node):
+                if edge.relation == "calls":
+                    neighbours.append(edge.source if incoming else edge.target)
+        return _unique(neighbours)
+
+    def _references(self, symbol: str) -> Iterable[GraphNode]:
+        nodes = self.graph.references(symbol)
+        store = self._store()
+        if not nodes and store is not None:
+            return store.find_nodes(name=symbol)
+        return nodes
+
+    def _store(self) -> SemanticStore | None:
+        return self.store_provider() if self.store_provider else None
+
+
 
+def _unique(nodes: Iterable[GraphNode]) -> list[GraphNode]:
+    return list(dict.fromkeys(nodes))
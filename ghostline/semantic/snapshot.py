@@ -0,0 +1,204 @@
+"""Versioned, incremental snapshots of the semantic graph for views."""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+from ghostline.semantic.graph import GraphNode, SemanticGraph
+
+# Versions of changes kept for delta requests; older consumers get a full snapshot.
+MAX_HISTORY = 256
+
+EdgeKey = tuple[str, str, str]
+
+
+class GraphSnapshotFeed:
+    """Serializable node and edge dicts for the graph, maintained per file.
+
+    Every id embeds the owning file, so each file contributes a disjoint part
+    of the snapshot. A refresh rebuilds only the parts of files the graph
+    reports as changed and records the net difference under a new version;
+    a consumer holding version ``N`` asks :meth:`delta` for what was added or
+    removed since instead of re-reading the whole graph.
+    """
+
+    def __init__(
+        self,
+        graph: SemanticGraph,
+        workspace_provider: Callable[[], str | None],
+        max_history: int = MAX_HISTORY,
+    ) -> None:
+        self.graph = graph
+        self.workspace_provider = workspace_provider
+        self.max_history = max_history
+        self._lock = threading.Lock()
+        self._root: Path | None = None
+        self._graph_revision = 0
+        self._version = 0
+        # Deltas from versions before this one need a full snapshot.
+        self._base_version = 0
+        self._parts: dict[Path, tuple[dict[str, dict], dict[EdgeKey, dict]]] = {}
+        self._nodes: dict[str, dict] = {}
+        self._edges: dict[EdgeKey, dict] = {}
+        # (version, node id -> present, edge key -> present)
+        self._history: deque[tuple[int, dict[str, bool], dict[EdgeKey, bool]]] = deque()
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def snapshot(self) -> dict:
+        """Return every node and edge along with the current version."""
+
+        with self._lock:
+            self._refresh()
+            return self._full()
+
+    def delta(self, since: int | None) -> dict:
+        """Return what changed after version ``since``.
+
+        Added entries are full dicts (a changed node is reported as added
+        again); removed nodes are ids and removed edges carry only
+        ``source``, ``target`` and ``type``. When ``since`` is unknown or too
+        old the result has ``full`` set and holds a complete snapshot instead.
+        """
+
+        with self._lock:
+            self._refresh()
+            if since is None or not self._base_version <= since <= self._version:
+                return self._full()
+            nodes: dict[str, bool] = {}
+            edges: dict[EdgeKey, bool] = {}
+            for version, node_changes, edge_changes in self._history:
+                if version > since:
+                    nodes.update(node_changes)
+                    edges.update(edge_changes)
+            return {
+                "version": self._version,
+                "full": False,
+                "added_nodes": [self._nodes[key] for key, present in nodes.items() if present and key in self._nodes],
+                "removed_nodes": [key for key, present in nodes.items() if not present and key not in self._nodes],
+                "added_edges": [self._edges[key] for key, present in edges.items() if present and key in self._edges],
+                "removed_edges": [
+                    {"source": key[0], "target": key[1], "type": key[2]}
+                    for key, present in edges.items()
+                    if not present and key not in self._edges
+                ],
+            }
+
+    # Internal ---------------------------------------------------------
+    def _full(self) -> dict:
+        return {
+            "version": self._version,
+            "full": True,
+            "nodes": list(self._nodes.values()),
+            "edges": list(self._edges.values()),
+        }
+
+    def _refresh(self) -> None:
+        workspace = self.workspace_provider()
+        root = Path(workspace) if workspace else None
+        if root != self._root:
+            self._reset(root)
+        node_changes: dict[str, bool] = {}
+        edge_changes: dict[EdgeKey, bool] = {}
+        with self.graph.lock:
+            self._graph_revision, changed = self.graph.changed_files(self._graph_revision)
+            for file in changed:
+                self._refresh_file(file, node_changes, edge_changes)
+        if not node_changes and not edge_changes:
+            return
+        self._version += 1
+        self._history.append((self._version, node_changes, edge_changes))
+        while len(self._history) > self.max_history:
+            self._base_version = self._history.popleft()[0]
+
+    def _reset(self, root: Path | None) -> None:
+        self._root = root
+        self._graph_revision = 0
+        self._parts.clear()
+        self._nodes.clear()
+        self._edges.clear()
+        self._history.clear()
+        self._version += 1
+        self._base_version = self._version
+
+    def _refresh_file(self, file: Path, node_changes: dict[str, bool], edge_changes: dict[EdgeKey, bool]) -> None:
+        old_nodes, old_edges = self._parts.pop(file, ({}, {}))
+        new_nodes, new_edges = self._file_part(file)
+        if new_nodes or new_edges:
+            self._parts[file] = (new_nodes, new_edges)
+        _diff(self._nodes, old_nodes, new_nodes, node_changes)
+        _diff(self._edges, old_edges, new_edges, edge_changes)
+
+    def _file_part(self, file: Path) -> tuple[dict[str, dict], dict[EdgeKey, dict]]:
+        """Build the node and edge dicts ``file`` contributes to the snapshot."""
+
+        nodes: dict[str, dict] = {}
+        edges: dict[EdgeKey, dict] = {}
+        owned = self.graph.nodes_in_file(file)
+        if owned:
+            path = self._format_path(file)
+            file_id = f"file:{path}"
+            module_id = f"module:{path}"
+            nodes[file_id] = _node_dict(file_id, "file", file.name, file, None)
+            nodes[module_id] = _node_dict(module_id, "module", file.stem, file, None)
+            _add_edge(edges, module_id, file_id, "contains")
+            for node in owned:
+                if node.kind == "module":
+                    continue
+                symbol_id = self._node_id(node)
+                if symbol_id not in nodes:
+                    nodes[symbol_id] = _node_dict(symbol_id, node.kind, node.name, node.file, node.span)
+                _add_edge(edges, file_id, symbol_id, "contains")
+        # An edge belongs to its source's file; its endpoints are always
+        # graph nodes, so their own files contribute the node dicts.
+        for edge in self.graph.edges_for_file(file):
+            if edge.source.file == file:
+                _add_edge(edges, self._node_id(edge.source), self._node_id(edge.target), edge.relation)
+        return nodes, edges
+
+    def _node_id(self, node: GraphNode) -> str:
+        path = self._format_path(node.file)
+        if node.kind == "module":
+            return f"module:{path}"
+        prefix = "func" if node.kind == "function" else node.kind
+        return f"{prefix}:{path}:{node.name}"
+
+    def _format_path(self, path: Path) -> str:
+        if self._root:
+            try:
+                return str(path.relative_to(self._root))
+            except ValueError:
+                pass
+        return str(path)
+
+
+def _node_dict(node_id: str, node_type: str, label: str, file: Path, span: tuple[int, int] | None) -> dict:
+    return {
+        "id": node_id,
+        "type": node_type,
+        "label": label,
+        "file": str(file),
+        "line": span[0] - 1 if span else None,
+    }
+
+
+def _add_edge(edges: dict[EdgeKey, dict], source: str, target: str, relation: str) -> None:
+    key = (source, target, relation)
+    if key not in edges:
+        edges[key] = {"source": source, "target": target, "type": relation}
+
+
+def _diff(current: dict, old: dict, new: dict, changes: dict) -> None:
+    for key in old.keys() - new.keys():
+        del current[key]
+        changes[key] = False
+    for key, value in new.items():
+        if old.get(key) != value:
+            current[key] = value
+            changes[key] = True
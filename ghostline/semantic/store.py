@@ -0,0 +1,237 @@
+"""SQLite persistence for the semantic graph."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ghostline.core.logging import get_logger
+from ghostline.semantic.graph import GraphEdge, GraphNode
+from ghostline.semantic.symbols import FileSymbols
+
+logger = get_logger(__name__)
+
+STORE_DIR = ".ghostline/index"
+STORE_FILENAME = "semantic.sqlite3"
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    symbols TEXT
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    file TEXT NOT NULL,
+    span_start INTEGER,
+    span_end INTEGER
+);
+CREATE TABLE IF NOT EXISTS edges (
+    owner TEXT NOT NULL,
+    source INTEGER NOT NULL,
+    target INTEGER NOT NULL,
+    relation TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nodes_owner ON nodes(owner);
+CREATE INDEX IF NOT EXISTS nodes_name ON nodes(name);
+CREATE INDEX IF NOT EXISTS nodes_kind ON nodes(kind);
+CREATE INDEX IF NOT EXISTS edges_owner ON edges(owner);
+CREATE INDEX IF NOT EXISTS edges_relation ON edges(relation);
+CREATE INDEX IF NOT EXISTS edges_target ON edges(target);
+"""
+
+_NODE_COLUMNS = "nodes.name, nodes.kind, nodes.file, nodes.span_start, nodes.span_end"
+
+
+class SemanticStore:
+    """Per-workspace SQLite store of each file's graph nodes and edges.
+
+    Rows are keyed by the file's path relative to the workspace root and
+    tagged with its content digest, so an unchanged file can be restored
+    without parsing it again; its :class:`FileSymbols` are kept alongside so
+    calls can be resolved afresh. Name, kind and relation lookups run as indexed
+    queries, letting consumers answer them without the in-memory graph.
+    One connection is shared between threads behind a lock.
+    """
+
+    def __init__(self, root: Path, path: Path | None = None) -> None:
+        self.root = root
+        self.path = path or root / STORE_DIR / STORE_FILENAME
+        self._lock = threading.RLock()
+        self._connection = self._open()
+
+    # Files ------------------------------------------------------------
+    def digest(self, file: Path) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT digest FROM files WHERE path = ?", (self._relative(file),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def files(self) -> dict[Path, str]:
+        with self._lock:
+            rows = self._connection.execute("SELECT path, digest FROM files").fetchall()
+        return {self.root / path: digest for path, digest in rows}
+
+    def load_file(self, file: Path) -> tuple[list[GraphNode], list[GraphEdge], FileSymbols]:
+        """Return the nodes, edges and symbols stored for ``file``."""
+
+        owner = self._relative(file)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT nodes.id, {_NODE_COLUMNS} FROM nodes WHERE owner = ?", (owner,)
+            ).fetchall()
+            edge_rows = self._connection.execute(
+                "SELECT source, target, relation FROM edges WHERE owner = ?", (owner,)
+            ).fetchall()
+            symbols = self._connection.execute("SELECT symbols FROM files WHERE path = ?", (owner,)).fetchone()
+        paths: dict[str, Path] = {}
+        by_id = {row[0]: self._node(row[1:], paths) for row in rows}
+        edges = [
+            GraphEdge(by_id[source], by_id[target], relation)
+            for source, target, relation in edge_rows
+            if source in by_id and target in by_id
+        ]
+        return list(by_id.values()), edges, FileSymbols.from_json(symbols[0] if symbols else None)
+
+    def save_files(
+        self, entries: Iterable[tuple[Path, str, Iterable[GraphNode], Iterable[GraphEdge], FileSymbols]]
+    ) -> None:
+        """Replace the stored contents of several files in one transaction."""
+
+        with self._lock, self._connection:
+            for file, digest, nodes, edges, symbols in entries:
+                owner = self._relative(file)
+                self._delete_locked(owner)
+                self._connection.execute(
+                    "INSERT INTO files(path, digest, symbols) VALUES (?, ?, ?)", (owner, digest, symbols.to_json())
+                )
+                ids: dict[GraphNode, int] = {}
+                edge_list = list(edges)
+                all_nodes = list(nodes)
+                for edge in edge_list:
+                    all_nodes.extend((edge.source, edge.target))
+                for node in all_nodes:
+                    if node in ids:
+                        continue
+                    span = node.span or (None, None)
+                    cursor = self._connection.execute(
+                        "INSERT INTO nodes(owner, name, kind, file, span_start, span_end) VALUES (?, ?, ?, ?, ?, ?)",
+                        (owner, node.name, node.kind, self._relative(node.file), span[0], span[1]),
+                    )
+                    ids[node] = cursor.lastrowid
+                self._connection.executemany(
+                    "INSERT INTO edges(owner, source, target, relation) VALUES (?, ?, ?, ?)",
+                    [(owner, ids[edge.source], ids[edge.target], edge.relation) for edge in edge_list],
+                )
+
+    def remove_files(self, files: Iterable[Path]) -> None:
+        with self._lock, self._connection:
+            for file in files:
+                self._delete_locked(self._relative(file))
+
+    def retain(self, files: Iterable[Path]) -> None:
+        """Drop every stored file not in ``files``."""
+
+        keep = {self._relative(file) for file in files}
+        with self._lock, self._connection:
+            stale = [path for (path,) in self._connection.execute("SELECT path FROM files") if path not in keep]
+            for owner in stale:
+                self._delete_locked(owner)
+
+    # Queries ----------------------------------------------------------
+    def find_nodes(self, name: str | None = None, kind: str | None = None, limit: int | None = None) -> list[GraphNode]:
+        clauses, params = _where(name=name, kind=kind)
+        sql = f"SELECT DISTINCT {_NODE_COLUMNS} FROM nodes{clauses}"
+        return list(self._select_nodes(sql, params, limit))
+
+    def find_edges(
+        self,
+        relation: str | None = None,
+        source_name: str | None = None,
+        target_name: str | None = None,
+        limit: int | None = None,
+    ) -> list[GraphEdge]:
+        clauses, params = _where(
+            **{"edges.relation": relation, "source.name": source_name, "target.name": target_name}
+        )
+        sql = (
+            "SELECT source.name, source.kind, source.file, source.span_start, source.span_end, "
+            "target.name, target.kind, target.file, target.span_start, target.span_end, edges.relation "
+            "FROM edges JOIN nodes AS source ON source.id = edges.source "
+            f"JOIN nodes AS target ON target.id = edges.target{clauses}"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [GraphEdge(self._node(row[:5]), self._node(row[5:10]), row[10]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # Internal ---------------------------------------------------------
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                logger.info("Semantic store schema changed; rebuilding %s", self.path)
+                connection.executescript(
+                    "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS nodes; DROP TABLE IF EXISTS edges;"
+                )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.DatabaseError:
+            logger.warning("Discarding unreadable semantic store at %s", self.path)
+            connection.close()
+            self.path.unlink(missing_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return connection
+
+    def _delete_locked(self, owner: str) -> None:
+        self._connection.execute("DELETE FROM edges WHERE owner = ?", (owner,))
+        self._connection.execute("DELETE FROM nodes WHERE owner = ?", (owner,))
+        self._connection.execute("DELETE FROM files WHERE path = ?", (owner,))
+
+    def _select_nodes(self, sql: str, params: list, limit: int | None) -> Iterator[GraphNode]:
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        for row in rows:
+            yield self._node(row)
+
+    def _node(self, row: tuple, paths: dict[str, Path] | None = None) -> GraphNode:
+        name, kind, file, start, end = row
+        span = (start, end) if start is not None else None
+        if paths is None:
+            return GraphNode(name, kind, self.root / file, span)
+        # Rows of one file share a path instead of each building its own.
+        path = paths.get(file)
+        if path is None:
+            path = paths[file] = self.root / file
+        return GraphNode(name, kind, path, span)
+
+    def _relative(self, file: Path) -> str:
+        try:
+            return Path(file).relative_to(self.root).as_posix()
+        except ValueError:
+            return str(file)
+
+
+def _where(**filters: str | None) -> tuple[str, list]:
+    clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+    params = [value for value in filters.values() if value is not None]
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
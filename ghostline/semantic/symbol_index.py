@@ -0,0 +1,139 @@
+"""Prefix and substring lookup over symbol names."""
+from __future__ import annotations
+
+import heapq
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator
+
+from ghostline.indexer.trigram_index import TrigramIndex, literal_trigrams, trigrams
+
+RANK_EXACT = 3
+RANK_PREFIX = 2
+RANK_BOUNDARY = 1
+RANK_SUBSTRING = 0
+
+
+def match_rank(query: str, name: str) -> int | None:
+    """Rank how well the lowercase ``query`` matches ``name``, or ``None``.
+
+    Exact matches rank above prefixes, which rank above matches starting at
+    a word boundary (after ``_`` or on a camel-case hump), then anywhere.
+    """
+
+    lowered = name.lower()
+    position = lowered.find(query)
+    if position < 0:
+        return None
+    if position == 0:
+        return RANK_EXACT if len(lowered) == len(query) else RANK_PREFIX
+    while position >= 0:
+        before = name[position - 1]
+        if before in "_." or (name[position].isupper() and before.islower()):
+            return RANK_BOUNDARY
+        position = lowered.find(query, position + 1)
+    return RANK_SUBSTRING
+
+
+class SymbolIndex:
+    """Case-insensitive name lookup that stays sublinear in the number of names.
+
+    Prefix queries bisect a sorted array of lowercase names, rebuilt lazily
+    after changes. Substring queries intersect trigram postings and verify
+    only the candidates. :meth:`search` ranks with :func:`match_rank` and
+    keeps the top ``limit`` with a heap.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names: set[str] = set()
+        self._trigrams: TrigramIndex[str] = TrigramIndex()
+        self._sorted: list[tuple[str, str]] = []
+        self._sorted_dirty = False
+        self._lock = threading.RLock()
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            if name in self._names:
+                return
+            self._names.add(name)
+            self._trigrams.add(name, trigrams(name.encode("utf-8", "surrogatepass")))
+            self._sorted_dirty = True
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            if name not in self._names:
+                return
+            self._names.discard(name)
+            self._trigrams.remove(name)
+            self._sorted_dirty = True
+
+    def prefixed(self, prefix: str) -> Iterator[str]:
+        """Yield names starting with ``prefix``, case-insensitively, in order."""
+
+        lowered = prefix.lower()
+        with self._lock:
+            entries = self._sorted_names()
+        index = bisect_left(entries, (lowered,))
+        while index < len(entries) and entries[index][0].startswith(lowered):
+            yield entries[index][1]
+            index += 1
+
+    def containing(self, fragment: str) -> Iterator[str]:
+        """Yield names containing ``fragment``, case-insensitively, in no particular order."""
+
+        lowered = fragment.lower()
+        if not lowered:
+            return
+        with self._lock:
+            grams = literal_trigrams(lowered)
+            if grams:
+                candidates: Iterable[str] = self._trigrams.candidates(grams)
+            elif lowered.isascii() and len(lowered) < 3:
+                # Too short for a trigram; only prefixes are cheap to find.
+                candidates = list(self.prefixed(lowered))
+            else:
+                candidates = list(self._names)
+        for name in candidates:
+            if lowered in name.lower():
+                yield name
+
+    def search(
+        self,
+        query: str,
+        limit: int | None = 20,
+        accept: Callable[[str], bool] | None = None,
+    ) -> list[str]:
+        """Return the best ``limit`` names matching ``query``, best first.
+
+        ``accept`` filters candidates before ranking, e.g. by symbol kind.
+        Queries shorter than three characters match name prefixes only.
+        """
+
+        lowered = query.lower()
+        if not lowered:
+            return []
+        scored = []
+        for name in self.containing(lowered):
+            if accept is not None and not accept(name):
+                continue
+            rank = match_rank(lowered, name)
+            if rank is not None:
+                scored.append(((rank, -len(name)), name))
+        if limit is None:
+            scored.sort(reverse=True)
+            return [name for _score, name in scored]
+        return [name for _score, name in heapq.nlargest(limit, scored)]
+
+    def _sorted_names(self) -> list[tuple[str, str]]:
+        if self._sorted_dirty:
+            self._sorted = sorted((name.lower(), name) for name in self._names)
+            self._sorted_dirty = False
+        return self._sorted
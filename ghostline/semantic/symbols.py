@@ -0,0 +1,248 @@
+"""Fully qualified symbol table with cross-module call resolution."""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from ghostline.semantic.graph import GraphEdge, GraphNode
+
+# Re-export hops followed before a name is given up as unresolved.
+MAX_REEXPORT_DEPTH = 4
+
+
+@dataclass
+class FileSymbols:
+    """What one module defines, imports and calls, as read from its AST.
+
+    All names are local to the module: ``definitions`` maps qualified names
+    such as ``Widget.build`` to their kind and line span, ``imports`` maps
+    each bound alias to the dotted name it stands for (relative imports keep
+    their leading dots) and ``calls`` holds ``(caller, callee expression)``
+    pairs, with an empty caller for module-level code.
+    """
+
+    definitions: dict[str, tuple[str, int | None, int | None]] = field(default_factory=dict)
+    imports: dict[str, str] = field(default_factory=dict)
+    calls: list[tuple[str, str]] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps([self.definitions, self.imports, self.calls], separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str | None) -> FileSymbols:
+        if not text:
+            return cls()
+        definitions, imports, calls = json.loads(text)
+        # Kinds, import targets and call expressions repeat across files.
+        intern = sys.intern
+        return cls(
+            {name: (intern(kind), start, end) for name, (kind, start, end) in definitions.items()},
+            {alias: intern(target) for alias, target in imports.items()},
+            [(intern(caller), intern(expression)) for caller, expression in calls],
+        )
+
+
+def module_name(path: Path, root: Path | None) -> tuple[str, bool]:
+    """Return the dotted module name of ``path`` and whether it is a package."""
+
+    try:
+        parts = list(path.relative_to(root).with_suffix("").parts) if root else [path.stem]
+    except ValueError:
+        parts = [path.stem]
+    if len(parts) > 1 and parts[-1] == "__init__":
+        return ".".join(parts[:-1]), True
+    return ".".join(parts), False
+
+
+@dataclass
+class _Module:
+    name: str
+    package: bool
+    symbols: FileSymbols
+    definitions: dict[str, GraphNode]
+
+
+class SymbolTable:
+    """Every indexed definition keyed by fully qualified name.
+
+    Call expressions are resolved per module through its local scopes and
+    import aliases, following re-exports, so call edges link to the actual
+    definition in whichever file holds it. The table remembers which names
+    each file's resolution consulted; when a definition appears, moves or
+    disappears, :meth:`dependents` names the files to resolve again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._modules: dict[Path, _Module] = {}
+        self._files_by_module: dict[str, Path] = {}
+        self._definitions: dict[str, GraphNode] = {}
+        self._qualnames: dict[GraphNode, str] = {}
+        self._dependents: dict[str, set[Path]] = {}
+        self._dependencies: dict[Path, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def update_file(self, file: Path, name: str, package: bool, symbols: FileSymbols) -> set[str]:
+        """Register ``file`` as module ``name``; returns the qualified names that changed."""
+
+        definitions = {
+            f"{name}.{local}": GraphNode(
+                sys.intern(local.rpartition(".")[2]), kind, file, (start, end) if start is not None else None
+            )
+            for local, (kind, start, end) in symbols.definitions.items()
+        }
+        module = _Module(name, package, symbols, definitions)
+        with self._lock:
+            old = self._unregister(file)
+            self._modules[file] = module
+            self._files_by_module[name] = file
+            for qualname, node in definitions.items():
+                self._definitions[qualname] = node
+                self._qualnames[node] = qualname
+            return _changed_names(old, module)
+
+    def remove_files(self, files: Iterable[Path]) -> set[str]:
+        """Forget ``files``; returns the qualified names they defined or re-exported."""
+
+        changed: set[str] = set()
+        with self._lock:
+            for file in files:
+                changed |= _changed_names(self._unregister(file), None)
+                self._set_dependencies(file, set())
+        return changed
+
+    def dependents(self, names: Iterable[str]) -> set[Path]:
+        """Return the files whose call resolution consulted any of ``names``."""
+
+        with self._lock:
+            files: set[Path] = set()
+            for name in names:
+                files |= self._dependents.get(name, set())
+            return files
+
+    def resolve_calls(self, file: Path) -> list[GraphEdge]:
+        """Return ``file``'s call edges, each linked to the definition it reaches.
+
+        Calls that resolve to nothing indexed, such as builtins, get no edge.
+        """
+
+        with self._lock:
+            module = self._modules.get(file)
+            if module is None:
+                return []
+            consulted: set[str] = set()
+            edges: dict[GraphEdge, None] = {}
+            module_node = GraphNode(file.stem, "module", file)
+            for caller, expression in module.symbols.calls:
+                target = self._resolve(module, caller, expression, consulted)
+                if target is None:
+                    continue
+                source = module.definitions.get(f"{module.name}.{caller}", module_node) if caller else module_node
+                edges[GraphEdge(source, target, "calls")] = None
+            self._set_dependencies(file, consulted)
+            return list(edges)
+
+    def lookup(self, qualname: str) -> GraphNode | None:
+        """Return the definition ``qualname`` names, following re-exports."""
+
+        with self._lock:
+            return self._find(qualname, set())
+
+    def qualname(self, node: GraphNode) -> str | None:
+        return self._qualnames.get(node)
+
+    # Internal ---------------------------------------------------------
+    def _resolve(self, module: _Module, scope: str, expression: str, consulted: set[str]) -> GraphNode | None:
+        head, _, rest = expression.partition(".")
+        suffix = f".{rest}" if rest else ""
+        local = module.symbols.definitions
+        parts = scope.split(".") if scope else []
+        if head in ("self", "cls") and rest:
+            for depth in range(len(parts), 0, -1):
+                enclosing = ".".join(parts[:depth])
+                if local.get(enclosing, ("",))[0] == "class":
+                    return self._find(f"{module.name}.{enclosing}{suffix}", consulted)
+            return None
+        # Innermost enclosing scope first, the module itself last.
+        for depth in range(len(parts), -1, -1):
+            candidate = ".".join([*parts[:depth], head])
+            if candidate in local:
+                return self._find(f"{module.name}.{candidate}{suffix}", consulted)
+        target = module.symbols.imports.get(head)
+        if target is not None:
+            return self._find(f"{self._absolute(target, module)}{suffix}", consulted)
+        return None
+
+    def _find(self, qualname: str, consulted: set[str], depth: int = MAX_REEXPORT_DEPTH) -> GraphNode | None:
+        consulted.add(qualname)
+        node = self._definitions.get(qualname)
+        if node is not None or depth == 0:
+            return node
+        # ``pkg.helper`` may be re-exported by ``pkg`` importing it from elsewhere.
+        parts = qualname.split(".")
+        for split in range(len(parts) - 1, 0, -1):
+            owner = self._files_by_module.get(".".join(parts[:split]))
+            if owner is None:
+                continue
+            module = self._modules[owner]
+            target = module.symbols.imports.get(parts[split])
+            if target is None:
+                return None
+            return self._find(".".join([self._absolute(target, module), *parts[split + 1 :]]), consulted, depth - 1)
+        return None
+
+    @staticmethod
+    def _absolute(target: str, module: _Module) -> str:
+        if not target.startswith("."):
+            return target
+        remainder = target.lstrip(".")
+        level = len(target) - len(remainder)
+        package = module.name.split(".") if module.package else module.name.split(".")[:-1]
+        package = package[: max(len(package) - (level - 1), 0)]
+        return ".".join([*package, remainder] if remainder else package)
+
+    def _unregister(self, file: Path) -> _Module | None:
+        module = self._modules.pop(file, None)
+        if module is None:
+            return None
+        if self._files_by_module.get(module.name) == file:
+            del self._files_by_module[module.name]
+        for qualname, node in module.definitions.items():
+            # Another file may have claimed the same module name since.
+            if self._definitions.get(qualname) == node:
+                del self._definitions[qualname]
+            self._qualnames.pop(node, None)
+        return module
+
+    def _set_dependencies(self, file: Path, names: set[str]) -> None:
+        previous = self._dependencies.pop(file, set())
+        for name in previous - names:
+            dependents = self._dependents.get(name)
+            if dependents is not None:
+                dependents.discard(file)
+                if not dependents:
+                    del self._dependents[name]
+        for name in names - previous:
+            self._dependents.setdefault(name, set()).add(file)
+        if names:
+            self._dependencies[file] = names
+
+
+def _changed_names(old: _Module | None, new: _Module | None) -> set[str]:
+    """Qualified names whose definition or re-export differs between versions."""
+
+    old_defs = old.definitions if old else {}
+    new_defs = new.definitions if new else {}
+    changed = {name for name in old_defs.keys() | new_defs.keys() if old_defs.get(name) != new_defs.get(name)}
+    old_exports = {f"{old.name}.{alias}": target for alias, target in old.symbols.imports.items()} if old else {}
+    new_exports = {f"{new.name}.{alias}": target for alias, target in new.symbols.imports.items()} if new else {}
+    changed.update(
+        name for name in old_exports.keys() | new_exports.keys() if old_exports.get(name) != new_exports.get(name)
+    )
+    return changed
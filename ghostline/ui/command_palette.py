@@ -22,6 +22,7 @@ from ghostline.ui.dialogs.credits_dialog import CreditsDialog
 
 
 EASTER_EGG_QUERY = "about:ghosts"
+MAX_COMMAND_RESULTS = 50
 
 
 class CommandPalette(QDialog):
@@ -101,7 +102,11 @@ class CommandPalette(QDialog):
 
     def _refresh_list(self) -> None:
         self.list_widget.clear()
-        commands = self.registry.list_commands(self.input.text()) if self.registry else []
+        commands = (
+            self.registry.list_commands(self.input.text(), limit=MAX_COMMAND_RESULTS)
+            if self.registry
+            else []
+        )
         for command in commands:
             label = f"{command.label} ({command.category})"
             item = QListWidgetItem(label)
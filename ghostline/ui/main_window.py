@@ -44,6 +44,7 @@ from PySide6.QtWidgets import (
     QPlainTextEdit,
 )
 
+from ghostline.core.cache import shared_cache
 from ghostline.core.config import CONFIG_DIR, USER_SETTINGS_PATH, ConfigManager
 from ghostline.core.events import CommandDescriptor, CommandRegistry
 from ghostline.core.logging import LOG_DIR, LOG_FILE
@@ -82,8 +83,10 @@ from ghostline.editor.code_editor import CodeEditor
 from ghostline.formatter.formatter_manager import FormatterManager
 from ghostline.runtime.inspector import RuntimeInspector
 from ghostline.indexer.index_manager import IndexManager
+from ghostline.indexer.pipeline import IndexingPipeline
 from ghostline.indexer.workspace_indexer import WorkspaceIndexer
 from ghostline.search.global_search import GlobalSearchDialog
+from ghostline.search.quick_open import QuickOpenIndex
 from ghostline.search.symbol_search import SymbolSearcher
 from ghostline.plugins.loader import PluginLoader
 from ghostline.ui.dialogs.settings_dialog import SettingsDialog
@@ -554,7 +557,18 @@ class MainWindow(MenuActionsMixin, QMainWindow):
         self.symbols = SymbolSearcher(self.lsp_manager)
         self.index_manager = IndexManager(lambda: self.workspace_manager.current_workspace)
         self.semantic_index = SemanticIndexManager(lambda: self.workspace_manager.current_workspace)
-        self.semantic_query = SemanticQueryEngine(self.semantic_index.graph)
+        self.semantic_query = SemanticQueryEngine(
+            self.semantic_index.graph,
+            store=lambda: self.semantic_index.store,
+            symbols=self.semantic_index.symbol_table,
+        )
+        self.quick_open = QuickOpenIndex()
+        self.workspace_manager.workspaceChanged.connect(self.quick_open.set_workspace)
+        self.indexing_pipeline = IndexingPipeline([self.workspace_indexer, self.semantic_index, self.quick_open])
+        self.workspace_manager.fileChanged.connect(self.indexing_pipeline.file_modified)
+        self.workspace_manager.fileAdded.connect(self.indexing_pipeline.file_modified)
+        self.workspace_manager.fileRemoved.connect(self.indexing_pipeline.file_deleted)
+        self.workspace_manager.workspaceChanged.connect(lambda _=None: self.indexing_pipeline.cancel())
         self.workspace_memory = WorkspaceMemory(self.config.workspace_memory_path)
         self.context_engine = ContextEngine(
             self.workspace_indexer,
@@ -563,8 +577,11 @@ class MainWindow(MenuActionsMixin, QMainWindow):
             self.workspace_memory,
             max_snippet_chars=self.config.get("ai", {}).get("max_context_chars", 800),
             max_results=self.config.get("ai", {}).get("context_results", 5),
+            cache=shared_cache().namespace("ai.context", max_entries=32),
         )
         self.agent_manager = AgentManager(self.workspace_memory, self.semantic_index.graph)
+        # Snapshot version the architecture map last applied.
+        self._architecture_version: int | None = None
         self.semantic_index.register_observer(self._on_semantic_graph_changed)
         pipeline_config = Path(__file__).resolve().parent.parent / "workflows" / "pipeline.yaml"
         self.pipeline_manager = PipelineManager(pipeline_config, self.agent_manager)
@@ -761,7 +778,7 @@ class MainWindow(MenuActionsMixin, QMainWindow):
         self.command_palette.set_registry(self.command_registry)
         self.command_palette.set_navigation_assistant(self.navigation_assistant)
         self.command_palette.set_autoflow_mode("passive")
-        self.command_palette.set_file_provider(self._search_workspace_files)
+        self.command_palette.set_file_provider(self.quick_open.search)
         self.command_palette.set_open_file_handler(self.open_file)
         self.command_palette.set_theme_manager(self.theme)
         self.ai_command_adapter = AICommandAdapter(self.command_registry, self.command_palette)
@@ -786,7 +803,7 @@ class MainWindow(MenuActionsMixin, QMainWindow):
         self._create_runtime_dock()
         self._connect_activity_bar()
 
-        self.lsp_manager.subscribe_diagnostics(self._handle_diagnostics)
+        self.lsp_manager.subscribe_file_diagnostics(self._handle_diagnostics)
         self.lsp_manager.lsp_error.connect(lambda msg: self.status.show_message(msg))
         self.lsp_manager.lsp_notice.connect(lambda msg: self.status.show_message(msg))
         self.plugin_loader.load_all()
@@ -1346,19 +1363,6 @@ class MainWindow(MenuActionsMixin, QMainWindow):
             help_menu.aboutToShow.connect(self._on_help_menu_about_to_show)
             help_menu.addAction(self.action_ghost_terminal)
 
-    def _search_workspace_files(self, query: str):
-        workspace = self.workspace_manager.current_workspace
-        if not workspace or not query:
-            return []
-        lowered = query.lower()
-        results = []
-        for path in workspace.rglob("*"):
-            if len(results) >= 20:
-                break
-            if path.is_file() and lowered in path.name.lower():
-                results.append(path)
-        return results
-
     def _create_terminal_dock(self) -> None:
         """Create all bottom panels (Windsurf-style)."""
         # Create all panel widgets
@@ -1605,6 +1609,7 @@ class MainWindow(MenuActionsMixin, QMainWindow):
         self.plugin_loader.emit_event("file.opened", path=path)
         self.workspace_indexer.rebuild([path])
         self.semantic_index.reindex([path])
+        self.quick_open.record_open(path)
         if hasattr(self, "doc_dock"):
             self.doc_dock.set_current_file(Path(path))
         ai_client = getattr(self, "ai_client", None)
@@ -1833,6 +1838,7 @@ class MainWindow(MenuActionsMixin, QMainWindow):
 
     def _close_folder(self) -> None:
         self.workspace_manager.clear_workspace()
+        self.quick_open.set_workspace(None)
         self._restored_workspace = None
         if hasattr(self, "project_model"):
             self.project_model.set_workspace_root(None)
@@ -1884,6 +1890,20 @@ class MainWindow(MenuActionsMixin, QMainWindow):
 
         _threads.SHUTTING_DOWN = True
 
+        from ghostline.core.processes import shared_process_workers
+
+        shared_process_workers().shutdown()
+        _threads.shared_scheduler().shutdown()
+
+        if hasattr(self, "indexing_pipeline"):
+            self.indexing_pipeline.cancel()
+
+        if hasattr(self, "workspace_indexer"):
+            try:
+                self.workspace_indexer.shutdown()
+            except Exception:
+                logger.debug("Workspace index flush failed during close", exc_info=True)
+
         self.workspace_manager.save_recents()
         window_cfg = self.config.settings.setdefault("window", {})
         window_cfg["maximized"] = self.isMaximized()
@@ -2165,7 +2185,11 @@ class MainWindow(MenuActionsMixin, QMainWindow):
         dock = getattr(self, "architecture_dock", None)
         if not dock:
             return
-        dock.set_graph(self.semantic_index.get_graph_snapshot())
+        delta = self.semantic_index.get_graph_delta(self._architecture_version)
+        self._architecture_version = delta["version"]
+        changed = ("added_nodes", "removed_nodes", "added_edges", "removed_edges")
+        if delta["full"] or any(delta[key] for key in changed):
+            dock.apply_delta(delta)
 
     def _on_semantic_graph_changed(self, _path: Path) -> None:
         QTimer.singleShot(0, self._refresh_architecture_graph)
@@ -2218,6 +2242,7 @@ class MainWindow(MenuActionsMixin, QMainWindow):
                 lambda: str(self.workspace_manager.current_workspace) if self.workspace_manager.current_workspace else None,
                 lambda path, line: self.open_file_at(path, line),
                 self,
+                indexer=self.workspace_indexer,
             )
 
         if initial_query:
@@ -2531,7 +2556,9 @@ class MainWindow(MenuActionsMixin, QMainWindow):
             dock.show()
             dock.raise_()
 
-    def _handle_diagnostics(self, diagnostics) -> None:
+    def _handle_diagnostics(self, file: str, diagnostics) -> None:
+        """Replace the diagnostics of ``file``, as each LSP publish covers one document."""
+
         app = QApplication.instance()
         if app is None:
             return
@@ -2544,22 +2571,23 @@ class MainWindow(MenuActionsMixin, QMainWindow):
             pass
         try:
             if hasattr(self, "diagnostics_model") and self.diagnostics_model:
-                self.diagnostics_model.set_diagnostics(diagnostics)
+                self.diagnostics_model.set_file_diagnostics(file, diagnostics)
         except RuntimeError:
             return
         except Exception:
             return
         if hasattr(self, "diagnostics_empty"):
-            has_items = bool(diagnostics)
+            has_items = self.diagnostics_model.rowCount() > 0
             self.diagnostics_empty.setVisible(not has_items)
             self.diagnostics_view.setVisible(has_items)
         for editor in self.editor_tabs.iter_editors():
-            file_diags = [d for d in diagnostics if d.file == str(editor.path)]
-            editor.apply_diagnostics(file_diags)
+            if str(editor.path) == file:
+                editor.apply_diagnostics(diagnostics)
 
     def _jump_to_diagnostic(self, index) -> None:
-        file_path = self.diagnostics_model.item(index.row(), 0).text()
-        line = int(self.diagnostics_model.item(index.row(), 1).text()) - 1
+        diagnostic = self.diagnostics_model.diagnostic(index.row())
+        file_path = diagnostic.file
+        line = diagnostic.line
         self.open_file(file_path)
         editor = self.get_current_editor()
         if editor:
@@ -30,7 +30,7 @@ from PySide6.QtWidgets import (
 
 from ghostline.visual3d.architecture_scene import ArchitectureScene
 from ghostline.visual3d.layout_algorithms import LayoutType
-from ghostline.visual3d.focus_mode import FilterCriteria, FocusLevel
+from ghostline.visual3d.focus_mode import FilterCriteria, FocusLevel, merge_graph_delta
 
 
 class ArchitectureDock(QDockWidget):
@@ -243,9 +243,31 @@ class ArchitectureDock(QDockWidget):
         }
         self._update_status()
         self._apply_current_filter()
+        self._update_controls()
 
-        # Enable/disable controls based on data
-        has_data = bool(self._graph.get("nodes"))
+    def apply_delta(self, delta: dict) -> None:
+        """Apply a snapshot delta from ``SemanticIndexManager.get_graph_delta``.
+
+        Full deltas replace the graph; incremental ones only touch the nodes
+        and edges they list.
+        """
+        if delta.get("full") or self._graph is None:
+            self.set_graph(delta if delta.get("full") else merge_graph_delta(None, delta))
+            return
+
+        self._graph = merge_graph_delta(self._graph, delta)
+        for node_id in delta.get("removed_nodes", []):
+            self._node_lookup.pop(node_id, None)
+        for node in delta.get("added_nodes", []):
+            if node.get("id"):
+                self._node_lookup[node["id"]] = node
+        self._update_status()
+        self.scene.apply_delta(self._graph, delta)
+        self._update_controls()
+
+    def _update_controls(self) -> None:
+        """Enable or disable controls based on data."""
+        has_data = bool(self._graph and self._graph.get("nodes"))
         self.reset_btn.setEnabled(has_data and self.scene.render_available)
         self.fit_btn.setEnabled(has_data and self.scene.render_available)
         self.export_btn.setEnabled(has_data)
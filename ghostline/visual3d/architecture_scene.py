@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import cos, sin, pi
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QColor, QQuaternion, QVector3D
@@ -26,6 +26,7 @@ from ghostline.visual3d.layout_algorithms import (
     LayoutConfig,
     LayoutType,
     compute_graph_layout,
+    place_new_nodes,
 )
 from ghostline.visual3d.animation import (
     AnimationController,
@@ -37,6 +38,7 @@ from ghostline.visual3d.focus_mode import (
     FocusLevel,
     FocusModeManager,
     NodeVisibility,
+    edge_key,
     filter_graph_by_visibility,
 )
 from ghostline.visual3d.export import ExportManager, ExportConfig, quick_export_png
@@ -87,7 +89,7 @@ class ArchitectureScene(QWidget):
         self._graph: dict | None = None
         self._node_lookup: Dict[str, _GraphNode] = {}
         self._node_entities: Dict[str, "Qt3DCore.QEntity"] = {}
-        self._edge_entities: list["Qt3DCore.QEntity"] = []
+        self._edge_entities: Dict[Tuple[str, str, str], "Qt3DCore.QEntity"] = {}
         self._positions: Dict[str, QVector3D] = {}
         self._render_available = False
 
@@ -112,7 +114,6 @@ class ArchitectureScene(QWidget):
 
         # Material references for opacity control
         self._node_materials: Dict[str, "Qt3DExtras.QPhongAlphaMaterial"] = {}
-        self._edge_materials: List["Qt3DExtras.QPhongMaterial"] = []
 
         self._stack = QStackedLayout(self)
         self._stack.setContentsMargins(0, 0, 0, 0)
@@ -151,6 +152,43 @@ class ArchitectureScene(QWidget):
         else:
             self._stack.setCurrentIndex(0)
 
+    def apply_delta(self, graph: dict, delta: dict) -> None:
+        """Apply an incremental snapshot delta without re-laying out the scene.
+
+        ``graph`` is the snapshot with ``delta`` already merged in (see
+        ``merge_graph_delta``). Only entities of added or removed nodes and
+        edges are touched, and new nodes are placed beside their neighbours.
+        """
+        if not self._render_available or not graph.get("nodes"):
+            self.set_graph(graph)
+            return
+
+        self._graph = graph
+        if not QT3D_AVAILABLE:
+            visibility = self._focus_manager.apply_delta(graph, delta)
+            # With a focus active the visibility handler already refreshed it.
+            if self._fallback_renderer and visibility is not None:
+                hidden = [node_id for node_id, vis in visibility.items() if not vis.visible]
+                self._fallback_renderer.apply_delta(
+                    filter_graph_by_visibility(graph, self._focus_manager.get_all_visibility()),
+                    {
+                        **delta,
+                        "added_nodes": [
+                            node for node in delta.get("added_nodes", [])
+                            if node.get("id") not in hidden
+                        ],
+                        "removed_nodes": [*delta.get("removed_nodes", []), *hidden],
+                    },
+                )
+            return
+
+        self._remove_entities(delta)
+        self._add_entities(delta)
+        self._transition_manager.set_current_positions(self._positions)
+        visibility = self._focus_manager.apply_delta(graph, delta)
+        if visibility:
+            self._on_visibility_changed(visibility)
+
     def set_layout(self, layout_type: LayoutType, animate: bool = True) -> None:
         """Change the layout algorithm.
 
@@ -384,14 +422,78 @@ class ArchitectureScene(QWidget):
         """Remove all nodes and edges from the scene."""
         for entity in self._node_entities.values():
             entity.setParent(None)
-        for entity in self._edge_entities:
+        for entity in self._edge_entities.values():
             entity.setParent(None)
         self._node_entities.clear()
         self._edge_entities.clear()
         self._node_materials.clear()
-        self._edge_materials.clear()
         self._positions.clear()
 
+    def _remove_entities(self, delta: dict) -> None:
+        """Drop the entities of removed nodes and edges."""
+        removed = set(delta.get("removed_nodes", []))
+        for node_id in removed:
+            entity = self._node_entities.pop(node_id, None)
+            if entity:
+                entity.setParent(None)
+            self._node_materials.pop(node_id, None)
+            self._node_lookup.pop(node_id, None)
+            self._positions.pop(node_id, None)
+
+        stale = [edge_key(edge) for edge in delta.get("removed_edges", [])]
+        if removed:
+            stale.extend(key for key in self._edge_entities if key[0] in removed or key[1] in removed)
+        for key in stale:
+            entity = self._edge_entities.pop(key, None)
+            if entity:
+                entity.setParent(None)
+
+    def _add_entities(self, delta: dict) -> None:
+        """Create entities for added nodes and edges, recreating changed nodes."""
+        nodes = [self._graph_node(node) for node in delta.get("added_nodes", [])]
+        added_edges = delta.get("added_edges", [])
+        self._positions.update(
+            place_new_nodes(
+                (node.node_id for node in nodes if node.node_id not in self._positions),
+                added_edges,
+                self._positions,
+                self._layout_config,
+            )
+        )
+
+        for node in nodes:
+            previous = self._node_lookup.get(node.node_id)
+            self._node_lookup[node.node_id] = node
+            entity = self._node_entities.get(node.node_id)
+            if entity and previous and previous.node_type == node.node_type:
+                continue
+            if entity:
+                entity.setParent(None)
+            position = self._positions.get(node.node_id, QVector3D(0, 0, 0))
+            self._node_entities[node.node_id] = self._create_node_entity(node, position)
+
+        for edge in added_edges:
+            self._add_edge_entity(edge)
+
+    def _add_edge_entity(self, edge: dict) -> None:
+        """Create the entity for an edge whose endpoints are both placed."""
+        key = edge_key(edge)
+        source_pos = self._positions.get(edge.get("source"))
+        target_pos = self._positions.get(edge.get("target"))
+        if key in self._edge_entities or not source_pos or not target_pos:
+            return
+        self._edge_entities[key] = self._create_edge_entity(source_pos, target_pos, edge.get("type", ""))
+
+    @staticmethod
+    def _graph_node(node: dict) -> _GraphNode:
+        return _GraphNode(
+            node_id=node.get("id", node.get("label", "")),
+            node_type=node.get("type", "unknown"),
+            label=node.get("label", ""),
+            file=node.get("file"),
+            line=node.get("line"),
+        )
+
     def _update_placeholder(self, has_nodes: bool) -> None:
         """Update placeholder message based on state."""
         if not QT3D_AVAILABLE and not self._fallback_renderer:
@@ -423,16 +525,7 @@ class ArchitectureScene(QWidget):
 
         self._clear_scene()
 
-        nodes = [
-            _GraphNode(
-                node_id=node.get("id", node.get("label", "")),
-                node_type=node.get("type", "unknown"),
-                label=node.get("label", ""),
-                file=node.get("file"),
-                line=node.get("line"),
-            )
-            for node in self._graph.get("nodes", [])
-        ]
+        nodes = [self._graph_node(node) for node in self._graph.get("nodes", [])]
         self._node_lookup = {node.node_id: node for node in nodes}
 
         # Compute positions using selected layout
@@ -451,12 +544,7 @@ class ArchitectureScene(QWidget):
 
         # Create edge entities
         for edge in self._graph.get("edges", []):
-            source_pos = self._positions.get(edge.get("source"))
-            target_pos = self._positions.get(edge.get("target"))
-            if source_pos and target_pos:
-                self._edge_entities.append(
-                    self._create_edge_entity(source_pos, target_pos, edge.get("type", ""))
-                )
+            self._add_edge_entity(edge)
 
         # Update transition manager with current positions
         self._transition_manager.set_current_positions(self._positions)
@@ -541,8 +629,6 @@ class ArchitectureScene(QWidget):
         else:
             material.setDiffuse(QColor(200, 200, 200))
 
-        self._edge_materials.append(material)
-
         entity.addComponent(mesh)
         entity.addComponent(transform)
         entity.addComponent(material)
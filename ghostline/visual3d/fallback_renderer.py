@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from PySide6.QtCore import QPoint, QPointF, QRectF, Qt, Signal
 from PySide6.QtGui import (
@@ -22,11 +22,18 @@ from PySide6.QtGui import (
     QPainterPath,
     QPen,
     QTransform,
+    QVector3D,
     QWheelEvent,
 )
 from PySide6.QtWidgets import QWidget
 
-from ghostline.visual3d.layout_algorithms import LayoutConfig, LayoutType, compute_graph_layout
+from ghostline.visual3d.focus_mode import edge_key
+from ghostline.visual3d.layout_algorithms import (
+    LayoutConfig,
+    LayoutType,
+    compute_graph_layout,
+    place_new_nodes,
+)
 
 
 @dataclass
@@ -94,6 +101,9 @@ class FallbackRenderer(QWidget):
         "defines": QColor(100, 180, 100, 180),
     }
 
+    # Layout units to pixels
+    LAYOUT_SCALE = 10.0
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setMouseTracking(True)
@@ -101,7 +111,7 @@ class FallbackRenderer(QWidget):
         self.setMinimumSize(400, 300)
 
         self._nodes: Dict[str, FallbackNode] = {}
-        self._edges: List[FallbackEdge] = []
+        self._edges: Dict[Tuple[str, str, str], FallbackEdge] = {}
         self._graph: dict | None = None
 
         # View transform state
@@ -130,6 +140,54 @@ class FallbackRenderer(QWidget):
         self._build_scene()
         self.update()
 
+    def apply_delta(self, graph: dict, delta: dict) -> None:
+        """Add and remove individual nodes and edges, keeping existing positions.
+
+        ``graph`` is the graph with ``delta`` already merged in. New nodes are
+        placed beside their neighbours; nothing else moves.
+        """
+        self._graph = graph
+        removed = set(delta.get("removed_nodes", []))
+        for node_id in removed:
+            self._nodes.pop(node_id, None)
+        for edge_dict in delta.get("removed_edges", []):
+            self._edges.pop(edge_key(edge_dict), None)
+        if removed:
+            self._edges = {
+                key: edge for key, edge in self._edges.items()
+                if edge.source_id not in removed and edge.target_id not in removed
+            }
+
+        added_edges = delta.get("added_edges", [])
+        scale = self.LAYOUT_SCALE
+        anchors = {
+            endpoint: QVector3D(node.x / scale, 0, node.y / scale)
+            for edge_dict in added_edges
+            for endpoint in (edge_dict.get("source", ""), edge_dict.get("target", ""))
+            if (node := self._nodes.get(endpoint)) is not None
+        }
+        added = delta.get("added_nodes", [])
+        positions = place_new_nodes(
+            (node_dict.get("id", "") for node_dict in added if node_dict.get("id") not in self._nodes),
+            added_edges,
+            anchors,
+            self._layout_config,
+        )
+        for node_dict in added:
+            node_id = node_dict.get("id", "")
+            existing = self._nodes.get(node_id)
+            if existing is not None:
+                self._nodes[node_id] = self._make_node(node_dict, existing.x, existing.y)
+            elif node_id in positions:
+                pos = positions[node_id]
+                self._nodes[node_id] = self._make_node(node_dict, pos.x() * scale, pos.z() * scale)
+
+        for edge_dict in added_edges:
+            edge = self._make_edge(edge_dict)
+            if edge is not None:
+                self._edges[edge_key(edge_dict)] = edge
+        self.update()
+
     def set_layout(self, layout_type: LayoutType) -> None:
         """Change the layout algorithm and recompute positions."""
         self._layout_type = layout_type
@@ -188,49 +246,53 @@ class FallbackRenderer(QWidget):
         )
 
         # Create renderable nodes
+        scale = self.LAYOUT_SCALE
         for node_dict in nodes_data:
-            node_id = node_dict.get("id", "")
-            node_type = node_dict.get("type", "unknown")
-            pos = positions.get(node_id)
+            pos = positions.get(node_dict.get("id", ""))
             if not pos:
                 continue
-
-            width, height = self.NODE_SIZES.get(node_type, (40, 20))
-            color = self.NODE_COLORS.get(node_type, QColor(128, 128, 128))
-
-            # Scale position for screen coordinates
-            scale = 10.0  # Convert from layout units to pixels
-            self._nodes[node_id] = FallbackNode(
-                node_id=node_id,
-                node_type=node_type,
-                label=node_dict.get("label", ""),
-                file=node_dict.get("file"),
-                line=node_dict.get("line"),
-                x=pos.x() * scale,
-                y=pos.z() * scale,  # Use Z as Y for 2D
-                width=width,
-                height=height,
-                color=color,
-            )
+            # Use Z as Y for 2D
+            self._nodes[node_dict.get("id", "")] = self._make_node(node_dict, pos.x() * scale, pos.z() * scale)
 
         # Create renderable edges
         for edge_dict in edges_data:
-            source_id = edge_dict.get("source", "")
-            target_id = edge_dict.get("target", "")
-            edge_type = edge_dict.get("type", "")
+            edge = self._make_edge(edge_dict)
+            if edge is not None:
+                self._edges[edge_key(edge_dict)] = edge
 
-            if source_id not in self._nodes or target_id not in self._nodes:
-                continue
+        self._fit_to_view()
 
-            color = self.EDGE_COLORS.get(edge_type, QColor(128, 128, 128, 150))
-            self._edges.append(FallbackEdge(
-                source_id=source_id,
-                target_id=target_id,
-                edge_type=edge_type,
-                color=color,
-            ))
+    def _make_node(self, node_dict: dict, x: float, y: float) -> FallbackNode:
+        """Create a renderable node at screen coordinates."""
+        node_type = node_dict.get("type", "unknown")
+        width, height = self.NODE_SIZES.get(node_type, (40, 20))
+        return FallbackNode(
+            node_id=node_dict.get("id", ""),
+            node_type=node_type,
+            label=node_dict.get("label", ""),
+            file=node_dict.get("file"),
+            line=node_dict.get("line"),
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            color=self.NODE_COLORS.get(node_type, QColor(128, 128, 128)),
+        )
 
-        self._fit_to_view()
+    def _make_edge(self, edge_dict: dict) -> Optional[FallbackEdge]:
+        """Create a renderable edge, or None if an endpoint is not shown."""
+        source_id = edge_dict.get("source", "")
+        target_id = edge_dict.get("target", "")
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return None
+
+        edge_type = edge_dict.get("type", "")
+        return FallbackEdge(
+            source_id=source_id,
+            target_id=target_id,
+            edge_type=edge_type,
+            color=self.EDGE_COLORS.get(edge_type, QColor(128, 128, 128, 150)),
+        )
 
     def _fit_to_view(self) -> None:
         """Adjust zoom and pan to fit all nodes."""
@@ -294,7 +356,7 @@ class FallbackRenderer(QWidget):
         self._draw_grid(painter)
 
         # Draw edges first (behind nodes)
-        for edge in self._edges:
+        for edge in self._edges.values():
             self._draw_edge(painter, edge)
 
         # Draw nodes on top
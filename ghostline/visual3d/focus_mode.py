@@ -88,6 +88,7 @@ class FocusModeManager(QObject):
         # Adjacency cache for neighbor lookups
         self._adjacency: Dict[str, Set[str]] = {}
         self._reverse_adjacency: Dict[str, Set[str]] = {}
+        self._link_counts: Dict[tuple[str, str], int] = {}
 
     # --- Graph data ---
 
@@ -101,15 +102,60 @@ class FocusModeManager(QObject):
         """Build adjacency maps for fast neighbor lookups."""
         self._adjacency.clear()
         self._reverse_adjacency.clear()
+        self._link_counts.clear()
 
         if not self._graph:
             return
 
         for edge in self._graph.get("edges", []):
-            source = edge.get("source", "")
-            target = edge.get("target", "")
-            self._adjacency.setdefault(source, set()).add(target)
-            self._reverse_adjacency.setdefault(target, set()).add(source)
+            self._link(edge.get("source", ""), edge.get("target", ""))
+
+    def apply_delta(self, graph: dict, delta: dict) -> Optional[Dict[str, NodeVisibility]]:
+        """Fold an incremental graph update into adjacency and visibility.
+
+        Without a focus a node's visibility depends only on the node itself,
+        so just the added nodes are evaluated and their entries returned
+        without emitting ``visibility_changed``. With a focus, neighbour sets
+        may shift: visibility is recomputed and emitted as usual and ``None``
+        is returned.
+        """
+        self._graph = graph
+        for edge in delta.get("removed_edges", []):
+            self._unlink(edge.get("source", ""), edge.get("target", ""))
+        for edge in delta.get("added_edges", []):
+            self._link(edge.get("source", ""), edge.get("target", ""))
+        for node_id in delta.get("removed_nodes", []):
+            self._visibility.pop(node_id, None)
+
+        if self._filter_state.focus_level != FocusLevel.NONE:
+            self._update_visibility()
+            return None
+
+        changed: Dict[str, NodeVisibility] = {}
+        for node in delta.get("added_nodes", []):
+            node_id = node.get("id", "")
+            if node_id:
+                visible = self._passes_filters(node)
+                changed[node_id] = NodeVisibility(node_id=node_id, visible=visible, opacity=1.0 if visible else 0.0)
+        self._visibility.update(changed)
+        return changed
+
+    def _link(self, source: str, target: str) -> None:
+        # Count parallel edges so removing one relation keeps the others' link.
+        key = (source, target)
+        self._link_counts[key] = self._link_counts.get(key, 0) + 1
+        self._adjacency.setdefault(source, set()).add(target)
+        self._reverse_adjacency.setdefault(target, set()).add(source)
+
+    def _unlink(self, source: str, target: str) -> None:
+        key = (source, target)
+        count = self._link_counts.get(key, 0) - 1
+        if count > 0:
+            self._link_counts[key] = count
+            return
+        self._link_counts.pop(key, None)
+        self._adjacency.get(source, set()).discard(target)
+        self._reverse_adjacency.get(target, set()).discard(source)
 
     # --- Filter configuration ---
 
@@ -315,30 +361,29 @@ class FocusModeManager(QObject):
         if not self._graph:
             return set()
 
-        visible: Set[str] = set()
-
-        for node in self._graph.get("nodes", []):
-            node_id = node.get("id", "")
-            node_type = node.get("type", "")
-            node_file = node.get("file", "")
-
-            # Type filter
-            if node_type not in self._filter_state.visible_types:
-                continue
+        return {
+            node.get("id", "")
+            for node in self._graph.get("nodes", [])
+            if self._passes_filters(node)
+        }
 
-            # File filter
-            if self._filter_state.file_filter:
-                if self._filter_state.file_filter not in (node_file or ""):
-                    continue
+    def _passes_filters(self, node: dict) -> bool:
+        """Check a node against the type, file and custom filters."""
+        # Type filter
+        if node.get("type", "") not in self._filter_state.visible_types:
+            return False
 
-            # Custom predicate
-            if self._filter_state.custom_predicate:
-                if not self._filter_state.custom_predicate(node):
-                    continue
+        # File filter
+        if self._filter_state.file_filter:
+            if self._filter_state.file_filter not in (node.get("file", "") or ""):
+                return False
 
-            visible.add(node_id)
+        # Custom predicate
+        if self._filter_state.custom_predicate:
+            if not self._filter_state.custom_predicate(node):
+                return False
 
-        return visible
+        return True
 
     def _apply_focus_mode(self, filtered_nodes: Set[str]) -> tuple[Set[str], Set[str]]:
         """Apply focus mode to determine visible and highlighted nodes.
@@ -440,3 +485,44 @@ def filter_graph_by_visibility(
     ]
 
     return {"nodes": filtered_nodes, "edges": filtered_edges}
+
+
+def merge_graph_delta(graph: dict | None, delta: dict) -> dict:
+    """Return a copy of ``graph`` with an incremental snapshot delta applied.
+
+    Added nodes and edges replace existing entries with the same identity;
+    edges left dangling by removed nodes are dropped.
+
+    Args:
+        graph: Graph with nodes and edges, or None for an empty graph
+        delta: Delta as produced by ``SemanticIndexManager.get_graph_delta``
+
+    Returns:
+        New graph dict carrying the delta's version
+    """
+    graph = graph or {"nodes": [], "edges": []}
+    removed_nodes = set(delta.get("removed_nodes", []))
+    added_nodes = {node.get("id"): node for node in delta.get("added_nodes", [])}
+    added_edges = {edge_key(edge): edge for edge in delta.get("added_edges", [])}
+    dropped_edges = {edge_key(edge) for edge in delta.get("removed_edges", [])} | added_edges.keys()
+
+    nodes = [
+        node for node in graph.get("nodes", [])
+        if node.get("id") not in removed_nodes and node.get("id") not in added_nodes
+    ]
+    nodes.extend(added_nodes.values())
+
+    edges = [
+        edge for edge in graph.get("edges", [])
+        if edge_key(edge) not in dropped_edges
+        and edge.get("source") not in removed_nodes
+        and edge.get("target") not in removed_nodes
+    ]
+    edges.extend(added_edges.values())
+
+    return {**graph, "nodes": nodes, "edges": edges, "version": delta.get("version")}
+
+
+def edge_key(edge: dict) -> tuple[str, str, str]:
+    """Identity of an edge dict: source, target and type."""
+    return edge.get("source", ""), edge.get("target", ""), edge.get("type", "")
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import math
 import random
+import zlib
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -430,3 +431,74 @@ def compute_graph_layout(
         engine.add_edge(edge)
 
     return engine.compute_layout(layout_type)
+
+
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+
+def place_new_nodes(
+    node_ids: Iterable[str],
+    edges: Iterable[dict],
+    positions: Dict[str, QVector3D],
+    config: Optional[LayoutConfig] = None,
+) -> Dict[str, QVector3D]:
+    """Position new nodes beside their placed neighbours without a relayout.
+
+    Each node goes on a spiral around the centroid of its neighbours (per
+    ``edges``) that already have a position, so an incremental update moves
+    nothing that is on screen. Nodes with no placed neighbour are lined up
+    past the current extent.
+
+    Args:
+        node_ids: IDs of the nodes to place; already positioned IDs are skipped
+        edges: Edge dictionaries linking the new nodes to their neighbours
+        positions: Existing positions; not modified
+        config: Optional layout configuration for spacing
+
+    Returns:
+        Dictionary mapping each newly placed node ID to its position
+    """
+    config = config or LayoutConfig()
+    neighbours: Dict[str, List[str]] = {}
+    for edge in edges:
+        source = edge.get("source", "")
+        target = edge.get("target", "")
+        neighbours.setdefault(source, []).append(target)
+        neighbours.setdefault(target, []).append(source)
+
+    placed: Dict[str, QVector3D] = {}
+    ring_slots: Dict[str, int] = {}
+    pending = [node_id for node_id in dict.fromkeys(node_ids) if node_id not in positions]
+    # Repeat so chains of new nodes hang off one another.
+    while pending:
+        remaining: List[str] = []
+        for node_id in pending:
+            anchors = [
+                (neighbour, placed.get(neighbour) or positions.get(neighbour))
+                for neighbour in neighbours.get(node_id, ())
+            ]
+            anchors = [(neighbour, pos) for neighbour, pos in anchors if pos is not None]
+            if not anchors:
+                remaining.append(node_id)
+                continue
+            center = QVector3D(0, 0, 0)
+            for _neighbour, pos in anchors:
+                center += pos
+            center /= len(anchors)
+            ring = anchors[0][0]
+            slot = ring_slots.get(ring, 0)
+            ring_slots[ring] = slot + 1
+            # Seed the angle from the ID so separate updates around the same
+            # anchor do not stack their nodes on one spot.
+            angle = (zlib.crc32(node_id.encode()) % 360) * math.pi / 180 + slot * GOLDEN_ANGLE
+            radius = config.sibling_spacing * math.sqrt(slot + 1)
+            placed[node_id] = center + QVector3D(radius * math.cos(angle), 0, radius * math.sin(angle))
+        if len(remaining) == len(pending):
+            break
+        pending = remaining
+
+    if pending:
+        start = max((pos.x() for pos in (*positions.values(), *placed.values())), default=0.0)
+        for index, node_id in enumerate(pending, start=1):
+            placed[node_id] = QVector3D(start + index * config.grid_spacing, 0, 0)
+    return placed
@@ -0,0 +1,362 @@
+"""Ignore-aware workspace crawler shared by the indexers and scanners."""
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
+
+from ghostline.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+IGNORE_FILENAMES = (".gitignore", ".ghostlineignore")
+DEFAULT_IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".ghostline",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression body."""
+
+    out: list[str] = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if char == "*":
+            if pattern.startswith("**", i):
+                i += 2
+                if i < length and pattern[i] == "/":
+                    out.append("(?:.*/)?")
+                    i += 1
+                else:
+                    out.append(".*")
+                continue
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+                continue
+        elif char == "\\" and i + 1 < length:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """A single compiled ``.gitignore`` line."""
+
+    regex: re.Pattern[str]
+    negated: bool
+    directory_only: bool
+    anchored: bool
+
+    @classmethod
+    def parse(cls, line: str) -> "IgnoreRule | None":
+        pattern = line.rstrip("\n").rstrip()
+        if not pattern or pattern.startswith("#"):
+            return None
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            return None
+        return cls(re.compile(f"^{_translate_glob(pattern)}$"), negated, directory_only, anchored)
+
+    def matches(self, relative: str, name: str, is_dir: bool) -> bool:
+        if self.directory_only and not is_dir:
+            return False
+        return bool(self.regex.match(relative if self.anchored else name))
+
+
+class IgnoreRules:
+    """Layered ignore rules: each directory's rules extend its parent's.
+
+    Only the subset of gitignore semantics needed to prune walks is
+    implemented: globs, ``**``, anchoring, directory-only rules and negation.
+    """
+
+    def __init__(self, base: str, rules: Sequence[IgnoreRule], parent: "IgnoreRules | None" = None) -> None:
+        self.base = base
+        self.rules = tuple(rules)
+        self.parent = parent
+
+    @classmethod
+    def for_directory(
+        cls, directory: str, parent: "IgnoreRules | None", names: Iterable[str] | None = None
+    ) -> "IgnoreRules | None":
+        """Return ``parent`` extended with ignore files found in ``directory``."""
+
+        present = set(names) if names is not None else None
+        rules: list[IgnoreRule] = []
+        for filename in IGNORE_FILENAMES:
+            if present is not None and filename not in present:
+                continue
+            try:
+                with open(os.path.join(directory, filename), encoding="utf-8", errors="ignore") as handle:
+                    for line in handle:
+                        rule = IgnoreRule.parse(line)
+                        if rule:
+                            rules.append(rule)
+            except OSError:
+                continue
+        if not rules:
+            return parent
+        return cls(directory, rules, parent)
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        layers: list[IgnoreRules] = []
+        layer: IgnoreRules | None = self
+        while layer is not None:
+            layers.append(layer)
+            layer = layer.parent
+
+        name = os.path.basename(path)
+        ignored = False
+        for layer in reversed(layers):
+            relative = path[len(layer.base) :].lstrip(os.sep).replace(os.sep, "/")
+            for rule in layer.rules:
+                if rule.matches(relative, name, is_dir):
+                    ignored = not rule.negated
+        return ignored
+
+
+class WorkspaceCrawler:
+    """Walks a workspace once, pruning ignored directories as it descends.
+
+    Directories matched by ``.gitignore``/``.ghostlineignore`` rules, the
+    built-in ignore list (VCS metadata, virtualenvs, ``node_modules``, caches)
+    and, unless ``include_hidden`` is set, dot-prefixed entries are never
+    entered. :meth:`crawl` fans per-file work out across a bounded thread pool
+    and yields results in batches.
+    """
+
+    def __init__(
+        self,
+        *,
+        include_hidden: bool = False,
+        ignored_dirs: Iterable[str] = DEFAULT_IGNORED_DIRS,
+        batch_size: int = 256,
+        max_workers: int | None = None,
+    ) -> None:
+        self.include_hidden = include_hidden
+        self.ignored_dirs = frozenset(ignored_dirs)
+        self.batch_size = batch_size
+        self.max_workers = max_workers or min(16, (os.cpu_count() or 1) + 4)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    # Walking ------------------------------------------------------------
+    def iter_files(self, root: Path | str, *, suffixes: Sequence[str] | None = None) -> Iterator[Path]:
+        """Yield files under ``root`` that survive the ignore rules."""
+
+        for batch in self.iter_batches(root, suffixes=suffixes):
+            yield from batch
+
+    def iter_batches(self, root: Path | str, *, suffixes: Sequence[str] | None = None) -> Iterator[list[Path]]:
+        """Yield discovered files in batches of :attr:`batch_size`."""
+
+        batch: list[Path] = []
+        for path in self._walk(Path(root), tuple(suffixes) if suffixes else None):
+            batch.append(path)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def iter_directories(self, root: Path | str) -> Iterator[Path]:
+        """Yield ``root`` and every non-ignored directory beneath it."""
+
+        root_path = Path(root)
+        yield root_path
+        for directory, _files in self._walk_directories(root_path):
+            if directory != str(root_path):
+                yield Path(directory)
+
+    def crawl(
+        self,
+        root: Path | str,
+        handler: Callable[[Path], T | None],
+        *,
+        suffixes: Sequence[str] | None = None,
+    ) -> Iterator[list[T]]:
+        """Run ``handler`` for every discovered file on the shared pool.
+
+        At most a few batches are in flight at once, so reading a huge tree
+        never queues every file up front. ``None`` results are dropped.
+        Results arrive in completion order.
+        """
+
+        executor = self._pool()
+        window = self.max_workers * 4
+        pending: deque[Future] = deque()
+        results: list[T] = []
+
+        def _drain(block: bool) -> Iterator[list[T]]:
+            nonlocal results
+            if not pending:
+                return
+            if block:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            else:
+                done = {future for future in pending if future.done()}
+            for future in done:
+                pending.remove(future)
+                try:
+                    value = future.result()
+                except Exception:  # noqa: BLE001
+                    logger.debug("Crawler handler failed", exc_info=True)
+                    continue
+                if value is not None:
+                    results.append(value)
+            if len(results) >= self.batch_size:
+                yield results
+                results = []
+
+        for batch in self.iter_batches(root, suffixes=suffixes):
+            for path in batch:
+                pending.append(executor.submit(handler, path))
+                while len(pending) >= window:
+                    yield from _drain(block=True)
+            yield from _drain(block=False)
+        while pending:
+            yield from _drain(block=True)
+        if results:
+            yield results
+
+    def is_ignored(self, path: Path | str, root: Path | str) -> bool:
+        """Return whether ``path`` (inside ``root``) would be skipped by a walk."""
+
+        root_str = str(root)
+        target = Path(path)
+        try:
+            parts = target.relative_to(root_str).parts
+        except ValueError:
+            return False
+        rules = IgnoreRules.for_directory(root_str, None)
+        current = root_str
+        for index, part in enumerate(parts):
+            is_dir = index < len(parts) - 1 or target.is_dir()
+            if not self.include_hidden and part.startswith("."):
+                return True
+            if is_dir and part in self.ignored_dirs:
+                return True
+            candidate = os.path.join(current, part)
+            if rules and rules.is_ignored(candidate, is_dir):
+                return True
+            if is_dir:
+                rules = IgnoreRules.for_directory(candidate, rules)
+            current = candidate
+        return False
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # Internal ---------------------------------------------------------
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawler")
+            return self._executor
+
+    def _walk_directories(self, root: Path) -> Iterator[tuple[str, list[os.DirEntry]]]:
+        stack: list[tuple[str, IgnoreRules | None]] = [(str(root), None)]
+        while stack:
+            directory, parent_rules = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            rules = IgnoreRules.for_directory(directory, parent_rules, (entry.name for entry in entries))
+            files: list[os.DirEntry] = []
+            subdirs: list[str] = []
+            for entry in entries:
+                name = entry.name
+                if not self.include_hidden and name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if name in self.ignored_dirs or (rules and rules.is_ignored(entry.path, True)):
+                        continue
+                    subdirs.append(entry.path)
+                elif not (rules and rules.is_ignored(entry.path, False)):
+                    files.append(entry)
+            yield directory, files
+            stack.extend((subdir, rules) for subdir in sorted(subdirs, reverse=True))
+
+    def _walk(self, root: Path, suffixes: tuple[str, ...] | None) -> Iterator[Path]:
+        if root.is_file():
+            if not suffixes or root.name.endswith(suffixes):
+                yield root
+            return
+        for _directory, files in self._walk_directories(root):
+            for entry in files:
+                if suffixes and not entry.name.endswith(suffixes):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                yield Path(entry.path)
+
+
+_shared_crawler: WorkspaceCrawler | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_crawler() -> WorkspaceCrawler:
+    """Return the process-wide crawler used by default by every consumer."""
+
+    global _shared_crawler
+    with _shared_lock:
+        if _shared_crawler is None:
+            _shared_crawler = WorkspaceCrawler()
+        return _shared_crawler
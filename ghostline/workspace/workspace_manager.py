@@ -7,6 +7,7 @@ from typing import Iterable, Optional
 
 from PySide6.QtCore import QObject, QFileSystemWatcher, Signal
 
+from ghostline.workspace.crawler import WorkspaceCrawler, shared_crawler
 from ghostline.workspace.templates import WorkspaceTemplateManager
 
 RECENTS_PATH = Path.home() / ".config" / "ghostline" / "recents.json"
@@ -21,8 +22,9 @@ class WorkspaceManager(QObject):
     fileAdded = Signal(str)
     fileRemoved = Signal(str)
 
-    def __init__(self) -> None:
+    def __init__(self, crawler: WorkspaceCrawler | None = None) -> None:
         super().__init__()
+        self.crawler = crawler or shared_crawler()
         self.current_workspace: Optional[Path] = None
         self.recent_items: list[str] = self._load_recents()
         self._metadata: dict[str, dict] = {}
@@ -120,9 +122,11 @@ class WorkspaceManager(QObject):
 
     # Workspace helpers --------------------------------------------------
     def iter_workspace_files(self) -> Iterable[Path]:
+        """Yield workspace files, skipping ignored and hidden paths."""
+
         if not self.current_workspace:
             return []
-        return self.current_workspace.rglob("*")
+        return self.crawler.iter_files(self.current_workspace)
 
     def last_recent_workspace(self) -> Optional[Path]:
         for item in self.recent_items:
@@ -134,7 +138,7 @@ class WorkspaceManager(QObject):
     # File watching ------------------------------------------------------
     def _start_watching(self, workspace: Path) -> None:
         self._stop_watching()
-        paths = [str(workspace)] + [str(p) for p in workspace.rglob("*") if p.is_dir()]
+        paths = [str(p) for p in self.crawler.iter_directories(workspace)]
         if paths:
             self._watcher.addPaths(paths)
 
@@ -15,3 +15,18 @@ def qt_app():
     """Provide a shared QApplication instance (or ``None`` when stubbed)."""
 
     return _qt_app
+
+
+class ImmediateWorkers:
+    """Worker stand-in that runs submitted work inline, so indexing is synchronous."""
+
+    def submit(self, key, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def shutdown(self, wait: bool = False) -> None:  # pragma: no cover - API compatibility
+        return None
+
+
+@pytest.fixture
+def immediate_workers() -> ImmediateWorkers:
+    return ImmediateWorkers()
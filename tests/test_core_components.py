@@ -15,6 +15,8 @@ from ghostline.ai.ai_client import AIResponse
 from ghostline.ai.analysis_service import AnalysisService
 from ghostline.build.build_manager import BuildManager
 from ghostline.core.cache import CacheManager, FileSignatureCache
+from ghostline.core.dependency_installer import IMPORTS_CACHE_VERSION, collect_dependencies
+from ghostline.core.disk_cache import DiskCache
 from ghostline.core.events import CommandDescriptor, CommandRegistry
 from ghostline.core.self_healing import SelfHealingService
 from ghostline.ui.status_bar import StudioStatusBar
@@ -43,6 +45,148 @@ def test_cache_manager_refreshes_and_expires(monkeypatch) -> None:
     assert refreshed == "fresh"
 
 
+
+def test_cache_manager_bounds_partitions_and_loads_once() -> None:
+    cache = CacheManager(auto_cleanup=False, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    lsp = cache.namespace("lsp", max_bytes=8)
+    lsp.set("hover", "12345")
+    lsp.set("signature", "67890")
+    assert "hover" not in lsp and "a" not in lsp
+
+    calls: list[int] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_factory() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "loaded"
+
+    results: list[str] = []
+    leader = threading.Thread(target=lambda: results.append(cache.get("slow", slow_factory)))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(cache.get("slow", slow_factory)))
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == ["loaded", "loaded"]
+    assert calls == [1]
+    stats = cache.all_stats()
+    assert stats[""].evictions == 2
+    assert stats[""].hits == 3
+    assert stats["lsp"].evictions == 1
+    assert stats["lsp"].bytes == 5
+
+
+def test_cache_joiners_with_a_factory_do_not_inherit_a_miss(tmp_path: Path) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowDisk(DiskCache):
+        def get(self, *args, **kwargs):  # noqa: ANN002,ANN003
+            started.set()
+            release.wait(5)
+            return super().get(*args, **kwargs)
+
+    cache = CacheManager(auto_cleanup=False).namespace("ast", disk=SlowDisk(tmp_path / "cache"))
+    results: dict[str, object] = {}
+    leader = threading.Thread(target=lambda: results.setdefault("lookup", cache.get("module.py")))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: results.setdefault("load", cache.get("module.py", lambda: "parsed")))
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == {"lookup": None, "load": "parsed"}
+    assert cache.get("module.py") == "parsed"
+
+
+def test_cache_namespaces_reject_conflicting_settings(tmp_path: Path) -> None:
+    cache = CacheManager(auto_cleanup=False)
+    disk = DiskCache(tmp_path / "cache")
+    ast = cache.namespace("ast", max_entries=8, disk=disk, disk_version=2)
+
+    assert cache.namespace("ast") is ast
+    assert cache.namespace("ast", max_entries=8, disk=disk, disk_version=2) is ast
+    for conflicting in ({"max_entries": 16}, {"max_bytes": 1024}, {"disk": DiskCache(tmp_path)}, {"disk_version": 3}):
+        with pytest.raises(ValueError):
+            cache.namespace("ast", **conflicting)
+
+
+def test_disk_cache_tier_survives_restarts_and_stays_bounded(tmp_path: Path) -> None:
+    disk = DiskCache(tmp_path / "cache", max_bytes=4096)
+    first = CacheManager(auto_cleanup=False).namespace("ast", disk=disk, disk_version=1)
+    first.set("module.py", {"symbols": ["Widget"]})
+
+    # A new session starts with an empty memory tier.
+    second = CacheManager(auto_cleanup=False).namespace("ast", disk=disk, disk_version=1)
+    assert second.get("module.py", factory=lambda: pytest.fail("disk tier missed")) == {"symbols": ["Widget"]}
+    assert second.stats().disk_hits == 1
+    assert CacheManager(auto_cleanup=False).namespace("ast", disk=disk, disk_version=2).get("module.py") is None
+
+    corrupt = disk._path("ast", disk.digest("ast", "broken"))
+    corrupt.parent.mkdir(parents=True, exist_ok=True)
+    corrupt.write_bytes(b"not a pickle")
+    assert disk.get("ast", "broken", default="missing") == "missing"
+    assert not corrupt.exists()
+
+    for index in range(8):
+        disk.set("blobs", f"blob-{index}", b"x" * 1024)
+        os.utime(disk._path("blobs", disk.digest("blobs", f"blob-{index}")), (index, index))
+    assert disk.size() <= 4096
+    assert disk.get("blobs", "blob-7") == b"x" * 1024
+    assert disk.get("blobs", "blob-0") is None
+    assert not list((tmp_path / "cache").rglob(".tmp-*"))
+
+
+def test_disk_cache_rejects_namespaces_outside_its_root(tmp_path: Path) -> None:
+    disk = DiskCache(tmp_path / "cache")
+
+    for namespace in ("..", "../escape", "ai/nested", "ai\\nested", ""):
+        with pytest.raises(ValueError):
+            disk.set(namespace, "key", "value")
+    with pytest.raises(ValueError):
+        disk.clear("..")
+    assert not (tmp_path / "escape").exists()
+    assert disk.set("ai.responses", "key", "value")
+
+
+def test_dependency_scan_reuses_imports_from_the_disk_tier(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "app.py").write_text("import requests\nfrom yaml import safe_load\n", encoding="utf-8")
+    (project / "util.py").write_text("import numpy as np\n", encoding="utf-8")
+    disk = DiskCache(tmp_path / "cache")
+
+    def session() -> CacheManager:
+        return CacheManager(auto_cleanup=False).namespace(
+            "dependency-imports", disk=disk, disk_version=IMPORTS_CACHE_VERSION
+        )
+
+    assert collect_dependencies(project, session()) == {"requests", "yaml", "numpy"}
+    restarted = session()
+    assert collect_dependencies(project, restarted) == {"requests", "yaml", "numpy"}
+    assert restarted.stats().disk_hits == 2
+
+    (project / "util.py").write_text("import pandas\n", encoding="utf-8")
+    assert collect_dependencies(project, restarted) == {"requests", "yaml", "pandas"}
+
+
 def test_file_signature_cache_tracks_changes(tmp_path: Path) -> None:
     file_path = tmp_path / "demo.txt"
     file_path.write_text("one", encoding="utf-8")
@@ -112,6 +256,20 @@ def test_command_registry_filters_commands() -> None:
     assert {cmd.id for cmd in filtered} == {"test"}
 
 
+def test_command_registry_ranks_acronyms_and_frecency() -> None:
+    registry = CommandRegistry()
+    registry.register_command(CommandDescriptor("view.toggleTerminal", "Toggle Terminal", "view", lambda: None))
+    registry.register_command(CommandDescriptor("file.save", "Save File", "file", lambda: None))
+    registry.register_command(CommandDescriptor("file.saveAll", "Save All Files", "file", lambda: None))
+
+    assert registry.list_commands("vtt")[0].id == "view.toggleTerminal"
+    assert [cmd.id for cmd in registry.list_commands("save")][:2] == ["file.save", "file.saveAll"]
+    assert len(registry.list_commands("save", limit=1)) == 1
+
+    registry.execute(registry.get("file.saveAll"))
+    assert registry.list_commands("save")[0].id == "file.saveAll"
+
+
 def test_build_manager_runs_tasks(monkeypatch, tmp_path: Path) -> None:
     workspace = tmp_path / "workspace"
     workspace.mkdir()
@@ -197,7 +355,7 @@ def test_status_bar_updates_labels(ensure_qt_app) -> None:
     assert bar.git_label.text() == "main*"
 
 
-def test_analysis_service_accumulates_suggestions(ensure_qt_app) -> None:
+def test_analysis_service_accumulates_suggestions(ensure_qt_app, immediate_workers) -> None:
     class DummyClient:
         def __init__(self) -> None:
             self.prompts: list[tuple[str, str]] = []
@@ -206,19 +364,11 @@ def test_analysis_service_accumulates_suggestions(ensure_qt_app) -> None:
             self.prompts.append((prompt, context or ""))
             return AIResponse(text="ok")
 
-    class ImmediateWorkers:
-        def __init__(self) -> None:
-            self.calls: list[str] = []
-
-        def submit(self, key: str, func, *args, **kwargs):  # noqa: ANN001,ANN002,ANN003
-            self.calls.append(key)
-            return func(*args, **kwargs)
-
     class Emitter(QObject):
         state_changed = Signal(str)
 
     client = DummyClient()
-    service = AnalysisService(client, workers=ImmediateWorkers())
+    service = AnalysisService(client, workers=immediate_workers)
     emissions: list[list] = []
     service.suggestions_changed.connect(emissions.append)
 
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
 import concurrent.futures
+import math
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
 
 import pytest
 
-from ghostline.core.threads import BackgroundWorkers
+from ghostline.core.processes import ProcessWorkers
+from ghostline.core.threads import (
+    BACKGROUND,
+    INTERACTIVE,
+    BackgroundWorkers,
+    CancellationToken,
+    TaskScheduler,
+    current_token,
+)
 
 
 class ImmediateExecutor:
@@ -57,3 +70,90 @@ def test_cancel_handles_missing_tasks(monkeypatch, key: str) -> None:
     workers = BackgroundWorkers()
     workers.cancel(key)
     workers.shutdown()
+
+
+def test_scheduler_lanes_coalesce_and_expire() -> None:
+    scheduler = TaskScheduler({BACKGROUND: 1})
+    release = threading.Event()
+    started = threading.Event()
+    tokens: list[CancellationToken | None] = []
+
+    def blocking() -> str:
+        tokens.append(current_token())
+        started.set()
+        release.wait(5)
+        return "bulk"
+
+    indexing = scheduler.lane(BACKGROUND)
+    running = indexing.submit("index", blocking)
+    assert started.wait(5)
+    queued = indexing.submit("other", lambda: "queued")
+    expiring = indexing.submit("late", lambda: "never", timeout=0.01)
+
+    # The background lane is saturated; interactive work still runs.
+    assert scheduler.lane(INTERACTIVE).submit("hover", lambda: "hover").result(timeout=5) == "hover"
+    # Handles have their own key space.
+    assert scheduler.lane(BACKGROUND).submit("index", lambda: "separate") is not None
+    assert not tokens[0].cancelled
+
+    replacement = indexing.submit("other", lambda: "latest")
+    restarted = indexing.submit("index", lambda: "restarted")
+    assert queued.cancelled()
+    assert tokens[0].cancelled
+
+    time.sleep(0.05)
+    release.set()
+    assert running.result(timeout=5) == "bulk"
+    assert replacement.result(timeout=5) == "latest"
+    assert restarted.result(timeout=5) == "restarted"
+    with pytest.raises(TimeoutError):
+        expiring.result(timeout=5)
+    scheduler.shutdown(wait=True)
+
+
+def test_queued_tasks_expire_while_their_lane_is_full() -> None:
+    scheduler = TaskScheduler({INTERACTIVE: 1})
+    release = threading.Event()
+    started = threading.Event()
+    lane = scheduler.lane(INTERACTIVE)
+    lane.submit("busy", lambda: (started.set(), release.wait(5)))
+    assert started.wait(5)
+
+    expiring = lane.submit("hover", lambda: "never", timeout=0.05)
+
+    # ``exception()`` raises rather than returns if the future is still pending.
+    assert isinstance(expiring.exception(timeout=2), TimeoutError)
+    assert not release.is_set()
+    release.set()
+    scheduler.shutdown(wait=True)
+
+
+def test_submit_after_shutdown_returns_a_cancelled_future() -> None:
+    scheduler = TaskScheduler()
+    scheduler.shutdown()
+    calls: list[str] = []
+
+    future = scheduler.lane(BACKGROUND).submit("late", calls.append, "ran")
+
+    assert future.cancelled()
+    future.add_done_callback(lambda done: calls.append("callback"))
+    assert calls == ["callback"]
+
+
+def test_process_workers_stream_and_survive_crashes() -> None:
+    workers = ProcessWorkers(max_workers=1, max_restarts=1)
+    try:
+        assert dict(workers.stream(math.factorial, [(5,), (6,)])) == {(5,): 120, (6,): 720}
+
+        with pytest.raises(BrokenProcessPool):
+            workers.submit("crash", os._exit, 1).result(timeout=120)
+        # The crash only failed its own job; a fresh pool takes the next one.
+        assert workers.submit("pid", os.getpid).result(timeout=120) != os.getpid()
+
+        with pytest.raises(BrokenProcessPool):
+            workers.submit("crash", os._exit, 1).result(timeout=120)
+        # Past max_restarts the service stops and work runs in-process.
+        assert workers.submit("pid", os.getpid) is None
+        assert dict(workers.stream(math.factorial, [(4,)])) == {(4,): 24}
+    finally:
+        workers.shutdown()
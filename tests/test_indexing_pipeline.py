@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from ghostline.indexer.pipeline import CREATED, DELETED, MODIFIED, IndexingPipeline, merge_event
+from ghostline.indexer.workspace_indexer import WorkspaceIndexer
+from ghostline.semantic.index_manager import SemanticIndexManager
+
+
+def test_merge_event_folds_bursts() -> None:
+    assert merge_event(None, MODIFIED) == MODIFIED
+    assert merge_event(CREATED, MODIFIED) == CREATED
+    assert merge_event(CREATED, DELETED) is None
+    assert merge_event(DELETED, CREATED) == MODIFIED
+    assert merge_event(MODIFIED, DELETED) == DELETED
+
+
+@pytest.fixture
+def indexes(tmp_path: Path, immediate_workers):
+    (tmp_path / "old.py").write_text("def old_name():\n    pass\n", encoding="utf-8")
+    indexer = WorkspaceIndexer(lambda: tmp_path, workers=immediate_workers)
+    indexer.set_workspace(tmp_path)
+    semantic = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
+    semantic.reindex()
+    yield indexer, semantic
+    semantic.shutdown()
+
+
+@pytest.fixture
+def pipeline(indexes, immediate_workers) -> IndexingPipeline:
+    return IndexingPipeline(list(indexes), workers=immediate_workers, debounce=60)
+
+
+def _rename_burst(root: Path, pipeline: IndexingPipeline) -> Path:
+    """Delete old.py, write new.py twice and create and delete a scratch file."""
+
+    (root / "old.py").unlink()
+    new_file = root / "new.py"
+    for text in ("def draft():\n    pass\n", "def fresh_name():\n    pass\n"):
+        new_file.write_text(text, encoding="utf-8")
+        pipeline.file_modified(new_file)
+    pipeline.file_deleted(root / "old.py")
+    pipeline.file_created(root / "scratch.py")
+    pipeline.file_deleted(root / "scratch.py")
+    pipeline.flush()
+    return new_file
+
+
+def test_pipeline_coalesces_a_burst_into_one_batch(tmp_path: Path, pipeline) -> None:
+    batches: list[dict[Path, str]] = []
+    pipeline.subscribe(batches.append)
+
+    new_file = _rename_burst(tmp_path, pipeline)
+
+    assert batches == [{new_file: MODIFIED, tmp_path / "old.py": DELETED}]
+
+
+def test_pipeline_updates_the_workspace_index(tmp_path: Path, indexes, pipeline) -> None:
+    indexer, _semantic = indexes
+
+    new_file = _rename_burst(tmp_path, pipeline)
+
+    assert [file.path for file in indexer.symbols_for("fresh_name")] == [new_file]
+    assert indexer.get(tmp_path / "old.py") is None
+
+
+def test_pipeline_updates_the_semantic_graph_once(tmp_path: Path, indexes, pipeline) -> None:
+    _indexer, semantic = indexes
+    notifications: list[Path] = []
+    semantic.register_observer(notifications.append)
+
+    _rename_burst(tmp_path, pipeline)
+
+    names = {node.name for node in semantic.graph.nodes()}
+    assert "fresh_name" in names and "draft" not in names and "old_name" not in names
+    assert len(notifications) == 1
+
+
+def test_directory_event_indexes_nested_packages(tmp_path: Path, indexes) -> None:
+    _indexer, semantic = indexes
+    package = tmp_path / "pkg"
+    (package / "sub" / "deep").mkdir(parents=True)
+    (package / "top.py").write_text("def top_level():\n    pass\n", encoding="utf-8")
+    (package / "sub" / "deep" / "leaf.py").write_text("def nested_leaf():\n    pass\n", encoding="utf-8")
+
+    semantic.apply_changes({package: CREATED})
+
+    names = {node.name for node in semantic.graph.nodes()}
+    assert {"top_level", "nested_leaf"} <= names
+
+
+def test_directory_event_drops_vanished_nested_modules(tmp_path: Path, indexes) -> None:
+    _indexer, semantic = indexes
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (nested / "gone.py").write_text("def vanished():\n    pass\n", encoding="utf-8")
+    semantic.apply_changes({nested / "gone.py": CREATED})
+    assert semantic.graph.references("vanished")
+
+    (nested / "gone.py").unlink()
+    semantic.apply_changes({tmp_path / "pkg": MODIFIED})
+
+    assert not semantic.graph.references("vanished")
+
+
+def test_coalescer_fires_once_after_burst(tmp_path: Path, immediate_workers) -> None:
+    applied: list[dict[Path, str]] = []
+    done = threading.Event()
+
+    class Target:
+        def apply_changes(self, changes):
+            applied.append(dict(changes))
+            done.set()
+
+    pipeline = IndexingPipeline([Target()], workers=immediate_workers, debounce=0.05)
+    for index in range(50):
+        pipeline.file_modified(tmp_path / f"file{index % 5}.py")
+
+    assert done.wait(2)
+    assert len(applied) == 1 and len(applied[0]) == 5
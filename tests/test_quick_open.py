@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ghostline.indexer.pipeline import CREATED, DELETED
+from ghostline.search.quick_open import QuickOpenIndex, fuzzy_score
+
+
+def _touch(root: Path, relative: str) -> Path:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+    return path
+
+
+def test_fuzzy_score_prefers_boundaries() -> None:
+    boundary = fuzzy_score("mw", "ui/main_window.py", "ui/main_window.py")
+    buried = fuzzy_score("mw", "ui/homework.py", "ui/homework.py")
+    assert boundary is not None and buried is not None
+    assert boundary > buried
+
+
+def test_fuzzy_score_rejects_non_subsequences() -> None:
+    assert fuzzy_score("xyz", "ui/main_window.py", "ui/main_window.py") is None
+
+
+def test_fuzzy_score_rewards_camel_humps() -> None:
+    camel = fuzzy_score("mw", "ui/MainWindow.py", "ui/mainwindow.py")
+    flat = fuzzy_score("mw", "ui/Mainwindow.py", "ui/mainwindow.py")
+    assert camel is not None and flat is not None
+    assert camel > flat
+
+
+@pytest.fixture
+def make_index(tmp_path: Path, immediate_workers):
+    def _make(*relatives: str) -> QuickOpenIndex:
+        for relative in relatives:
+            _touch(tmp_path, relative)
+        index = QuickOpenIndex(workers=immediate_workers)
+        index.set_workspace(tmp_path)
+        return index
+
+    return _make
+
+
+def test_quick_open_ranks_file_names(tmp_path: Path, make_index) -> None:
+    index = make_index("ghostline/ui/main_window.py", "ghostline/ui/menus.py", "docs/maintenance_window.md", "README.md")
+
+    assert len(index) == 4
+    results = index.search("mainwin")
+    assert results[0] == tmp_path / "ghostline/ui/main_window.py"
+    assert tmp_path / "README.md" not in results
+
+
+def test_quick_open_ignores_empty_queries(make_index) -> None:
+    assert make_index("README.md").search("") == []
+
+
+def test_quick_open_boosts_recently_opened_files(tmp_path: Path, make_index) -> None:
+    index = make_index("a/config_loader.py", "b/config_loader.py")
+
+    index.record_open(tmp_path / "b/config_loader.py")
+
+    assert index.search("config")[0] == tmp_path / "b/config_loader.py"
+
+
+def test_quick_open_applies_file_events(tmp_path: Path, make_index) -> None:
+    index = make_index("a/config_loader.py", "b/config_loader.py")
+    first = tmp_path / "a/config_loader.py"
+    third = _touch(tmp_path, "c/conf.py")
+    first.unlink()
+
+    index.apply_changes({third: CREATED, first: DELETED})
+
+    results = index.search("conf")
+    assert third in results
+    assert first not in results
+    assert len(index) == 2
+
+
+def test_quick_open_directory_events_recurse(tmp_path: Path, make_index) -> None:
+    index = make_index("pkg/old/stale.py", "README.md")
+    (tmp_path / "pkg/old/stale.py").unlink()
+    nested = _touch(tmp_path, "pkg/new/deep/nested_module.py")
+
+    index.apply_changes({tmp_path / "pkg": CREATED})
+
+    assert index.search("nested_module") == [nested]
+    assert index.search("stale") == []
+    assert len(index) == 2
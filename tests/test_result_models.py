@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+
+from ghostline.lang.diagnostics import Diagnostic, DiagnosticsModel
+from ghostline.search.results_model import ResultRole, SearchResultsModel
+from ghostline.search.search_engine import GlobalSearchResult
+
+
+def test_search_results_model_appends_incrementally(tmp_path: Path, qt_app) -> None:
+    model = SearchResultsModel()
+    model.set_root(tmp_path)
+    inserted: list[tuple[int, int]] = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+
+    model.append_results([GlobalSearchResult(tmp_path / "pkg" / "a.py", line, "x") for line in (1, 2)])
+    model.append_results([GlobalSearchResult(tmp_path / "b.py", 7, "needle")])
+
+    assert inserted == [(0, 1), (2, 2)]
+    assert model.data(model.index(2), Qt.DisplayRole) == "b.py:7  needle"
+    assert model.data(model.index(0), ResultRole) == GlobalSearchResult(tmp_path / "pkg" / "a.py", 1, "x")
+    model.clear()
+    assert model.rowCount() == 0
+
+
+def test_diagnostics_model_replaces_rows_per_file(qt_app) -> None:
+    model = DiagnosticsModel()
+    model.set_diagnostics(
+        [
+            Diagnostic("a.py", 0, 4, "Error", "bad"),
+            Diagnostic("b.py", 2, 0, "Warning", "meh"),
+            Diagnostic("a.py", 9, 1, "Error", "worse"),
+        ]
+    )
+    removed: list[tuple[int, int]] = []
+    model.rowsRemoved.connect(lambda _parent, first, last: removed.append((first, last)))
+
+    assert model.columnCount() == 5
+    assert model.headerData(4, Qt.Horizontal) == "Message"
+    assert [model.data(model.index(0, column)) for column in range(5)] == ["a.py", "1", "5", "Error", "bad"]
+
+    model.set_file_diagnostics("a.py", [Diagnostic("a.py", 3, 0, "Info", "ok")])
+
+    assert removed == [(2, 2), (0, 0)]
+    assert model.diagnostics() == [Diagnostic("b.py", 2, 0, "Warning", "meh"), Diagnostic("a.py", 3, 0, "Info", "ok")]
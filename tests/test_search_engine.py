@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication
+
+from ghostline.indexer.workspace_indexer import WorkspaceIndexer
+from ghostline.search.search_engine import SearchEngine, iter_matches
+
+
+def _workspace(root: Path) -> None:
+    (root / "src").mkdir()
+    (root / "src" / "app.py").write_text("needle = 1\n" * 10, encoding="utf-8")
+    (root / "notes.txt").write_text("no match\nNEEDLE here\n", encoding="utf-8")
+    (root / "blob.bin").write_bytes(b"\0\1needle\0")
+    (root / ".git").mkdir()
+    (root / ".git" / "packed").write_text("needle\n", encoding="utf-8")
+
+
+def test_iter_matches_skips_binaries_and_caps_per_file(tmp_path: Path) -> None:
+    _workspace(tmp_path)
+
+    results = list(iter_matches(tmp_path, "needle", max_per_file=3))
+
+    assert sorted((result.path.name, result.line) for result in results) == [
+        ("app.py", 1),
+        ("app.py", 2),
+        ("app.py", 3),
+        ("notes.txt", 2),
+    ]
+
+
+def _indexed(root: Path, workers) -> WorkspaceIndexer:
+    (root / "indexed.py").write_text("needle = 1\n", encoding="utf-8")
+    (root / "other.py").write_text("nothing here\n", encoding="utf-8")
+    indexer = WorkspaceIndexer(lambda: root, workers=workers, persist=False)
+    indexer.set_workspace(root)
+    return indexer
+
+
+def _matched_names(root: Path, indexer: WorkspaceIndexer) -> list[str]:
+    return sorted(result.path.name for result in iter_matches(root, "needle", indexer=indexer))
+
+
+def test_indexed_search_reads_files_the_index_rejects(tmp_path: Path, immediate_workers) -> None:
+    (tmp_path / "large.txt").write_text("filler line\n" * 40_000 + "needle\n", encoding="utf-8")
+    (tmp_path / "latin1.txt").write_bytes("caf\xe9 needle\n".encode("latin-1"))
+    indexer = _indexed(tmp_path, immediate_workers)
+    assert indexer.get(tmp_path / "large.txt") is None
+    assert indexer.get(tmp_path / "latin1.txt") is None
+
+    assert _matched_names(tmp_path, indexer) == ["indexed.py", "large.txt", "latin1.txt"]
+
+
+def test_indexed_search_reads_files_not_indexed_yet(tmp_path: Path, immediate_workers) -> None:
+    indexer = _indexed(tmp_path, immediate_workers)
+    (tmp_path / "fresh.py").write_text("needle = 2\n", encoding="utf-8")
+
+    assert _matched_names(tmp_path, indexer) == ["fresh.py", "indexed.py"]
+
+
+def test_indexed_search_skips_ruled_out_files(tmp_path: Path, immediate_workers, monkeypatch) -> None:
+    indexer = _indexed(tmp_path, immediate_workers)
+    opened: list[str] = []
+    original = Path.open
+
+    def _tracking_open(self: Path, *args, **kwargs):
+        opened.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", _tracking_open)
+
+    assert _matched_names(tmp_path, indexer) == ["indexed.py"]
+    assert "other.py" not in opened
+
+
+def test_engine_streams_batches_and_truncates(tmp_path: Path, qt_app) -> None:
+    _workspace(tmp_path)
+    engine = SearchEngine(batch_size=2, max_results=4)
+    batches: list[tuple[int, int]] = []
+    finished: list[tuple[int, int, bool]] = []
+    failed: list[int] = []
+    engine.resultsFound.connect(lambda search_id, batch: batches.append((search_id, len(batch))))
+    engine.searchFinished.connect(lambda *args: finished.append(args))
+    engine.searchFailed.connect(lambda search_id, _message: failed.append(search_id))
+
+    search_id = engine.start(tmp_path, "needle")
+    engine.wait(5)
+    QCoreApplication.processEvents()
+
+    assert finished == [(search_id, 4, True)]
+    assert sum(size for _, size in batches) == 4 and all(size <= 2 for _, size in batches)
+
+    bad = engine.start(tmp_path, "(", regex=True)
+    assert failed == [bad]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+import threading
 from pathlib import Path
 
 from ghostline.semantic.graph import GraphEdge, GraphNode, SemanticGraph
@@ -28,6 +30,33 @@ def test_cycle_detection_and_fingerprint() -> None:
     assert "Runtime hotspots" in fingerprint
 
 
+def test_cycles_scale_and_module_cycles_are_cached() -> None:
+    graph = SemanticGraph()
+    chain = [GraphNode(f"f{index}", "function", Path("/tmp/deep.py")) for index in range(5000)]
+    for source, target in zip(chain, chain[1:]):
+        graph.add_edge(GraphEdge(source, target, "calls"))
+    graph.add_edge(GraphEdge(chain[-1], chain[0], "calls"))
+    cycles = graph.find_cycles()
+    assert len(cycles) == 1 and len(cycles[0]) == 5000
+
+    root = Path("/tmp/pkg")
+    alpha = GraphNode("alpha", "module", root / "alpha.py")
+    beta = GraphNode("beta", "module", root / "beta.py")
+    graph.add_edge(GraphEdge(alpha, GraphNode("pkg.beta", "module", alpha.file), "imports"))
+    graph.add_edge(GraphEdge(beta, GraphNode("pkg.alpha", "module", beta.file), "imports"))
+    graph.add_edge(GraphEdge(beta, GraphNode("os", "module", beta.file), "imports"))
+
+    module_cycles = graph.module_cycles()
+    assert [sorted(node.name for node in cycle) for cycle in module_cycles] == [["alpha", "beta"]]
+    assert graph.module_cycles() is module_cycles
+    graph.add_edge(GraphEdge(chain[1], chain[0], "calls"))
+    assert graph.module_cycles() is module_cycles
+    assert "Cycles: alpha->beta" in graph.pattern_fingerprint()
+
+    graph.remove_files([beta.file])
+    assert graph.module_cycles() == []
+
+
 def test_module_map_churn_and_references() -> None:
     graph = SemanticGraph()
     file_one = Path("/tmp/one.py")
@@ -49,6 +78,73 @@ def test_module_map_churn_and_references() -> None:
     assert graph.references("do_work") == {func}
 
 
+def test_shared_names_come_from_the_name_index() -> None:
+    graph = SemanticGraph()
+    first, second = Path("/tmp/first.py"), Path("/tmp/second.py")
+    graph.add_node(GraphNode("helper", "function", first))
+    graph.add_node(GraphNode("helper", "function", second))
+    graph.add_node(GraphNode("unique", "function", first))
+
+    shared = graph.shared_names()
+    assert list(shared) == ["helper"] and sorted(shared["helper"]) == [first, second]
+
+    graph.remove_files([second])
+    assert graph.shared_names() == {}
+
+
+def test_adjacency_indexes_follow_removals() -> None:
+    graph = SemanticGraph()
+    file_one = Path("/tmp/one.py")
+    file_two = Path("/tmp/two.py")
+    module_one = GraphNode("one", "module", file_one)
+    helper = GraphNode("helper", "function", file_one)
+    remote = GraphNode("remote", "function", file_two)
+
+    graph.add_edge(GraphEdge(module_one, helper, "calls"))
+    graph.add_edge(GraphEdge(module_one, remote, "calls"))
+    graph.add_edge(GraphEdge(module_one, GraphNode("os", "module", file_one), "imports"))
+
+    assert set(graph.neighbours(module_one, "calls")) == {helper, remote}
+    assert {edge.source for edge in graph.incoming(remote)} == {module_one}
+    assert len(graph.call_edges()) == 2
+    nodes = graph.nodes()
+    assert remote in nodes
+
+    assert graph.remove_files([file_two]) == (1, 1)
+    assert remote in nodes
+    assert remote not in graph.nodes()
+    assert graph.references("remote") == set()
+    assert graph.neighbours(module_one, "calls") == [helper]
+    assert set(graph.files()) == {file_one}
+    assert len(graph.edges_for_file(file_one)) == 2
+
+
+def test_readers_iterate_while_files_are_replaced() -> None:
+    graph = SemanticGraph()
+    file = Path("/tmp/churn.py")
+    module = GraphNode("churn", "module", file)
+    stop = threading.Event()
+
+    def _reindex() -> None:
+        generation = 0
+        while not stop.is_set():
+            generation += 1
+            functions = [GraphNode(f"f{generation}_{index}", "function", file) for index in range(20)]
+            graph.replace_file(file, functions, [GraphEdge(module, node, "defines") for node in functions])
+
+    writer = threading.Thread(target=_reindex)
+    writer.start()
+    try:
+        for _ in range(2000):
+            assert all(node.file == file for node in graph.nodes())
+            sum(1 for _edge in graph.edges_by_relation("defines"))
+            graph.module_churn()
+            graph.find_cycles()
+    finally:
+        stop.set()
+        writer.join()
+
+
 def test_query_engine_finds_related_functions() -> None:
     graph = SemanticGraph()
     file_path = Path("/tmp/app.py")
@@ -67,3 +163,54 @@ def test_query_engine_finds_related_functions() -> None:
 
     assert list(query.search_by_kind("class")) == [class_node]
     assert query.architecture_map() == {}
+
+
+def test_symbol_search_ranks_matches_and_tracks_removals() -> None:
+    graph = SemanticGraph()
+    file_one = Path("/tmp/one.py")
+    file_two = Path("/tmp/two.py")
+    for name, kind, file in [
+        ("render", "function", file_one),
+        ("render_frame", "function", file_one),
+        ("prerender", "function", file_one),
+        ("RenderError", "class", file_two),
+        ("draw", "function", file_two),
+    ]:
+        graph.add_node(GraphNode(name, kind, file))
+
+    assert graph.search_symbols("render") == ["render", "RenderError", "render_frame", "prerender"]
+    assert graph.search_symbols("RENDER", limit=2) == ["render", "RenderError"]
+    assert graph.search_symbols("re", kind="class") == ["RenderError"]
+    assert graph.search_symbols("frame") == ["render_frame"]
+    assert len(graph.nodes_of_kind("function")) == 4
+
+    query = SemanticQueryEngine(graph)
+    assert [node.name for node in query.search("error", kind="class")] == ["RenderError"]
+
+    graph.remove_files([file_two])
+    assert graph.search_symbols("render") == ["render", "render_frame", "prerender"]
+    assert graph.nodes_of_kind("class") == set()
+
+
+def test_graph_stores_one_instance_per_node() -> None:
+    graph = SemanticGraph()
+    caller = GraphNode("main", "function", Path("/tmp/app.py"), (1, 4))
+    callee = GraphNode("helper", "function", Path("/tmp/lib.py"), (1, 2))
+    graph.add_node(caller)
+    graph.add_node(callee)
+
+    # Equal nodes rebuilt elsewhere, e.g. by the store, with their own paths.
+    graph.add_edge(
+        GraphEdge(
+            GraphNode("main", "function", Path("/tmp/app.py"), (1, 4)),
+            GraphNode("".join(["hel", "per"]), "function", Path("/tmp/lib.py"), (1, 2)),
+            "calls",
+        )
+    )
+
+    (edge,) = graph.edges()
+    assert edge.source is caller
+    assert edge.target is callee
+    assert len(graph.nodes()) == 2
+    assert [node.file for node in graph.references("helper")][0] is callee.file
+    assert pickle.loads(pickle.dumps(edge)) == edge
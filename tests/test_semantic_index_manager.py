@@ -29,3 +29,35 @@ def test_get_graph_snapshot_shapes(tmp_path: Path) -> None:
 
     call_edges = {(edge["source"], edge["target"]) for edge in snapshot["edges"] if edge["type"] == "calls"}
     assert (f"module:{file_path.name}", f"func:{file_path.name}:foo") in call_edges
+
+
+def test_graph_delta_reports_changed_file_only(tmp_path: Path) -> None:
+    manager = SemanticIndexManager(lambda: str(tmp_path), persist=False)
+    graph = manager.graph
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    foo = GraphNode("foo", "function", first, (1, 2))
+    graph.replace_file(first, [GraphNode("first", "module", first), foo], [])
+    graph.replace_file(second, [GraphNode("bar", "function", second, (1, 2))], [])
+
+    snapshot = manager.get_graph_snapshot()
+    version = snapshot["version"]
+    assert manager.get_graph_delta(version)["added_nodes"] == []
+
+    baz = GraphNode("baz", "function", first, (4, 5))
+    graph.replace_file(first, [GraphNode("first", "module", first), baz], [])
+    delta = manager.get_graph_delta(version)
+
+    assert delta["full"] is False
+    assert delta["version"] > version
+    assert [node["id"] for node in delta["added_nodes"]] == ["func:first.py:baz"]
+    assert delta["removed_nodes"] == ["func:first.py:foo"]
+    assert {(edge["source"], edge["target"]) for edge in delta["added_edges"]} == {
+        ("file:first.py", "func:first.py:baz")
+    }
+    assert delta["removed_edges"] == [{"source": "file:first.py", "target": "func:first.py:foo", "type": "contains"}]
+
+    assert manager.get_graph_delta(None)["full"] is True
+    manager.snapshots.max_history = 1
+    graph.remove_files([second])
+    assert manager.get_graph_delta(version)["full"] is True
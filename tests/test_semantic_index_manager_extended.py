@@ -4,18 +4,7 @@ from pathlib import Path
 
 from ghostline.semantic.graph import GraphNode
 from ghostline.semantic.index_manager import SemanticIndexManager
-
-
-class ImmediateWorkers:
-    def __init__(self) -> None:
-        self.jobs: dict[str, tuple[callable, Path]] = {}
-
-    def submit(self, key: str, func, *args, **kwargs):
-        self.jobs[key] = (func, args[0] if args else None)
-        return func(*args, **kwargs)
-
-    def shutdown(self) -> None:  # pragma: no cover - API compatibility
-        self.jobs.clear()
+from ghostline.semantic.query import SemanticQueryEngine
 
 
 def _write_sample_file(path: Path) -> None:
@@ -34,11 +23,11 @@ def helper(x):
     )
 
 
-def test_reindex_and_recent_paths(tmp_path: Path) -> None:
+def test_reindex_and_recent_paths(tmp_path: Path, immediate_workers) -> None:
     _write_sample_file(tmp_path / "module.py")
     notifications: list[Path] = []
 
-    manager = SemanticIndexManager(lambda: str(tmp_path), workers=ImmediateWorkers())
+    manager = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
     manager.register_observer(lambda path: notifications.append(path))
     manager.reindex()
 
@@ -50,22 +39,22 @@ def test_reindex_and_recent_paths(tmp_path: Path) -> None:
     assert any(entry["type"] == "class" for entry in snapshot["nodes"])
 
 
-def test_remove_file_prunes_nodes(tmp_path: Path) -> None:
+def test_remove_file_prunes_nodes(tmp_path: Path, immediate_workers) -> None:
     file_path = tmp_path / "old.py"
     _write_sample_file(file_path)
 
-    manager = SemanticIndexManager(lambda: str(tmp_path), workers=ImmediateWorkers())
+    manager = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
     manager.reindex()
     manager._remove_file(file_path)
 
     assert all(node.file != file_path for node in manager.graph.nodes())
 
 
-def test_record_runtime_event_updates_hotspots(tmp_path: Path) -> None:
+def test_record_runtime_event_updates_hotspots(tmp_path: Path, immediate_workers) -> None:
     file_path = tmp_path / "runtime.py"
     file_path.write_text("def sample():\n    return True\n", encoding="utf-8")
 
-    manager = SemanticIndexManager(lambda: str(tmp_path), workers=ImmediateWorkers())
+    manager = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
     manager.reindex()
 
     observations: list[Path] = []
@@ -76,3 +65,85 @@ def test_record_runtime_event_updates_hotspots(tmp_path: Path) -> None:
 
     assert GraphNode("sample", "function", file_path) in manager.graph.nodes()
     assert observations[-1] == file_path
+
+
+def test_reindexing_a_file_replaces_its_nodes(tmp_path: Path, immediate_workers) -> None:
+    file_path = tmp_path / "edited.py"
+    file_path.write_text("import os\n\ndef old_name():\n    helper()\n", encoding="utf-8")
+    other = tmp_path / "other.py"
+    other.write_text("def kept():\n    return 1\n", encoding="utf-8")
+
+    manager = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
+    manager.reindex()
+    file_path.write_text("import os\n\n\ndef new_name():\n    return 2\n", encoding="utf-8")
+    manager.handle_file_event("modified", str(file_path))
+
+    graph = manager.graph
+    names = {node.name for node in graph.nodes_in_file(file_path)}
+    assert "new_name" in names
+    assert not names & {"old_name", "helper"}
+    assert not graph.references("old_name")
+    assert {edge.relation for edge in graph.edges_for_file(file_path)} == {"imports"}
+    assert "kept" in {node.name for node in graph.nodes_in_file(other)}
+
+    file_path.write_text("def broken(:\n", encoding="utf-8")
+    manager.handle_file_event("modified", str(file_path))
+    assert "new_name" in {node.name for node in graph.nodes_in_file(file_path)}
+
+
+def test_process_pool_extraction_matches_in_process(tmp_path: Path, immediate_workers) -> None:
+    for index in range(6):
+        (tmp_path / f"mod{index}.py").write_text(
+            f"import os\n\nclass Item{index}:\n    pass\n\ndef make{index}():\n    return Item{index}()\n",
+            encoding="utf-8",
+        )
+
+    inline = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers, persist=False)
+    inline.reindex()
+    pooled = SemanticIndexManager(
+        lambda: str(tmp_path), workers=immediate_workers, persist=False, process_threshold=2, process_workers=2
+    )
+    try:
+        pooled.reindex()
+        assert pooled.processes.started
+        assert set(pooled.graph.nodes()) == set(inline.graph.nodes())
+        assert set(pooled.graph.edges()) == set(inline.graph.edges())
+    finally:
+        pooled.shutdown()
+
+
+def test_calls_resolve_across_modules(tmp_path: Path, immediate_workers) -> None:
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from .core import helper\n", encoding="utf-8")
+    core = package / "core.py"
+    core_source = (
+        "def helper():\n    return 1\n\n\nclass Engine:\n    def run(self):\n        return self.step()\n\n"
+        "    def step(self):\n        return helper()\n"
+    )
+    core.write_text(core_source, encoding="utf-8")
+    (tmp_path / "app.py").write_text(
+        "import pkg.core as core\nfrom pkg import helper as h\n\n\n"
+        "def main():\n    h()\n    core.Engine().run()\n    print('done')\n",
+        encoding="utf-8",
+    )
+
+    manager = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers, persist=False)
+    manager.reindex()
+    query = SemanticQueryEngine(manager.graph, symbols=manager.symbol_table)
+
+    helper = manager.symbol_table.lookup("pkg.core.helper")
+    assert helper is not None and helper.file == core
+    assert manager.symbol_table.lookup("pkg.helper") == helper
+    assert {node.name for node in query.callers("pkg.core.helper")} == {"main", "step"}
+    assert {node.name for node in query.callees("app.main")} == {"helper", "Engine"}
+    assert [node.name for node in query.callees("pkg.core.Engine.run")] == ["step"]
+    assert query.find_usages("pkg.core.helper")[0] == helper
+    assert not manager.graph.references("print")
+    assert manager.graph.references("helper") == {helper}
+
+    core.write_text("\n\n" + core_source, encoding="utf-8")
+    manager.handle_file_event("modified", str(core))
+    moved = manager.symbol_table.lookup("pkg.core.helper")
+    assert moved != helper
+    assert {node.name for node in query.callers("pkg.core.helper")} == {"main", "step"}
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ghostline.semantic import index_manager
+from ghostline.semantic.graph import SemanticGraph
+from ghostline.semantic.index_manager import SemanticIndexManager
+from ghostline.semantic.query import SemanticQueryEngine
+from ghostline.semantic.store import SemanticStore
+
+
+SOURCE = "import os\n\n\nclass Widget:\n    pass\n\n\ndef build():\n    return Widget()\n"
+
+
+@pytest.fixture
+def indexed_twice(tmp_path: Path, immediate_workers, monkeypatch):
+    """Index the workspace, edit changed.py, then reindex with a fresh manager."""
+
+    (tmp_path / "widgets.py").write_text(SOURCE, encoding="utf-8")
+    (tmp_path / "changed.py").write_text("def before():\n    pass\n", encoding="utf-8")
+    first = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
+    first.reindex()
+    expected = first.graph.nodes(), first.graph.edges()
+    first.shutdown()
+
+    (tmp_path / "changed.py").write_text("def after():\n    pass\n", encoding="utf-8")
+    second = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
+    parsed: list[str] = []
+    original = index_manager.extract_files
+    monkeypatch.setattr(index_manager, "extract_files", lambda paths: parsed.extend(paths) or original(paths))
+    second.reindex()
+    yield second, expected, parsed
+    second.shutdown()
+
+
+def test_unchanged_files_are_restored_without_parsing(tmp_path: Path, indexed_twice) -> None:
+    _manager, _expected, parsed = indexed_twice
+
+    assert parsed == [str(tmp_path / "changed.py")]
+
+
+def test_restored_files_match_the_first_parse(indexed_twice) -> None:
+    manager, (nodes, edges), _parsed = indexed_twice
+
+    assert {node for node in nodes if node.file.name == "widgets.py"} <= manager.graph.nodes()
+    assert {edge for edge in edges if edge.source.file.name == "widgets.py"} <= manager.graph.edges()
+
+
+def test_changed_files_are_reparsed(indexed_twice) -> None:
+    manager, _expected, _parsed = indexed_twice
+
+    names = {node.name for node in manager.graph.nodes()}
+    assert {"Widget", "build", "after"} <= names
+    assert "before" not in names
+
+
+@pytest.fixture
+def store(tmp_path: Path, immediate_workers):
+    (tmp_path / "widgets.py").write_text(SOURCE, encoding="utf-8")
+    manager = SemanticIndexManager(lambda: str(tmp_path), workers=immediate_workers)
+    manager.reindex()
+    manager.shutdown()
+    store = SemanticStore(tmp_path)
+    yield store
+    store.close()
+
+
+def test_store_finds_nodes(tmp_path: Path, store: SemanticStore) -> None:
+    assert [node.file for node in store.find_nodes(name="Widget", kind="class")] == [tmp_path / "widgets.py"]
+
+
+def test_store_finds_edges(store: SemanticStore) -> None:
+    assert {edge.target.name for edge in store.find_edges(relation="imports")} == {"os"}
+    assert {edge.target.name for edge in store.find_edges(relation="calls", source_name="build")} == {"Widget"}
+
+
+def test_query_engine_falls_back_to_the_store(store: SemanticStore) -> None:
+    query = SemanticQueryEngine(SemanticGraph(), store=lambda: store)
+
+    assert [node.name for node in query.find_usages("build")] == ["build"]
+    assert [node.name for node in query.search_by_kind("class")] == ["Widget"]
+
+
+def test_store_forgets_removed_files(tmp_path: Path, store: SemanticStore) -> None:
+    store.remove_files([tmp_path / "widgets.py"])
+
+    assert store.find_nodes(name="Widget") == []
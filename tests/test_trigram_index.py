@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ghostline.indexer.trigram_index import TrigramIndex, required_literals, trigrams
+from ghostline.indexer.workspace_indexer import WorkspaceIndexer
+from ghostline.search.global_search import search_workspace
+
+
+def test_required_literals_are_conservative() -> None:
+    assert required_literals(r"foo\.bar") == ["foo.bar"]
+    assert required_literals(r"colou?r_name") == ["colo", "r_name"]
+    assert required_literals(r"(optional)?suffix") == ["suffix"]
+    assert required_literals(r"def\s+parse_\w+") == ["def", "parse_"]
+    assert required_literals(r"left|right") is None
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"\x41bcd", r"\u0041bcd", r"\U00000041bcd", r"\N{LATIN CAPITAL LETTER A}bcd", r"\101bcd", r"(A)\1bcd"],
+)
+def test_required_literals_skip_whole_escapes(pattern: str) -> None:
+    assert required_literals(pattern) == ["bcd"]
+    assert required_literals("a" + pattern) == ["a", "bcd"]
+
+
+def test_escaped_regexes_keep_matching_files(tmp_path: Path, immediate_workers) -> None:
+    (tmp_path / "escaped.py").write_text("value = 'Abcd'\n", encoding="utf-8")
+    indexer = WorkspaceIndexer(lambda: tmp_path, workers=immediate_workers)
+    indexer.set_workspace(tmp_path)
+
+    for pattern in (r"\x41bcd", r"\N{LATIN CAPITAL LETTER A}bcd", r"\101bcd"):
+        assert [file.path.name for file in indexer.candidate_files(pattern, regex=True)] == ["escaped.py"]
+
+
+def test_trigram_candidates_intersect_postings() -> None:
+    index: TrigramIndex[str] = TrigramIndex()
+    index.add("a", trigrams(b"def ParseConfig(): pass"))
+    index.add("b", trigrams(b"parse nothing here"))
+
+    assert index.query(["parseconfig"]) == {"a"}
+    assert index.query(["parse"]) == {"a", "b"}
+    assert index.query(["xyz123"]) == set()
+
+
+def test_short_literals_cannot_narrow() -> None:
+    index: TrigramIndex[str] = TrigramIndex()
+    index.add("a", trigrams(b"ab"))
+
+    assert index.query(["ab"]) is None
+
+
+def test_removed_keys_leave_the_postings() -> None:
+    index: TrigramIndex[str] = TrigramIndex()
+    index.add("a", trigrams(b"def ParseConfig(): pass"))
+
+    index.remove("a")
+
+    assert index.query(["parseconfig"]) == set()
+
+
+def _workspace(root: Path) -> None:
+    (root / "match.py").write_text("value = load_settings()\n", encoding="utf-8")
+    for index in range(5):
+        (root / f"other{index}.py").write_text("print('unrelated')\n", encoding="utf-8")
+
+
+@pytest.fixture
+def indexer(tmp_path: Path, immediate_workers) -> WorkspaceIndexer:
+    _workspace(tmp_path)
+    indexer = WorkspaceIndexer(lambda: tmp_path, workers=immediate_workers)
+    indexer.set_workspace(tmp_path)
+    return indexer
+
+
+def test_candidate_files_narrow_literals(indexer: WorkspaceIndexer) -> None:
+    assert [file.path.name for file in indexer.candidate_files("LOAD_SETTINGS")] == ["match.py"]
+
+
+def test_candidate_files_narrow_regexes(indexer: WorkspaceIndexer) -> None:
+    assert [file.path.name for file in indexer.candidate_files(r"load_\w+\(", regex=True)] == ["match.py"]
+
+
+def test_search_workspace_uses_candidates(tmp_path: Path, indexer: WorkspaceIndexer) -> None:
+    results = search_workspace(str(tmp_path), "Load_Settings", indexer)
+
+    assert [(result.path.name, result.line) for result in results] == [("match.py", 1)]
+
+
+def test_find_by_name_uses_path_trigrams(indexer: WorkspaceIndexer) -> None:
+    assert [file.path.name for file in indexer.find_by_name("other3")] == ["other3.py"]
+
+
+def test_restored_files_are_candidates_until_scanned(tmp_path: Path, indexer, immediate_workers) -> None:
+    warm = WorkspaceIndexer(lambda: tmp_path, workers=immediate_workers)
+    warm.set_workspace(tmp_path)
+    assert len(warm.candidate_files("load_settings")) == 6
+
+    assert len(search_workspace(str(tmp_path), "load_settings", warm)) == 1
+    assert [file.path.name for file in warm.candidate_files("load_settings")] == ["match.py"]
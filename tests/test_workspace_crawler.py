@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ghostline.workspace.crawler import WorkspaceCrawler
+
+
+def _touch(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _tree(root: Path) -> None:
+    _touch(root / ".gitignore", "build/\n*.log\n!keep.log\n/generated\n")
+    _touch(root / "pkg" / ".ghostlineignore", "fixtures/**\n")
+    _touch(root / "pkg" / "module.py", "import os\n")
+    _touch(root / "pkg" / "fixtures" / "big" / "data.py")
+    _touch(root / "pkg" / "generated" / "kept.py")
+    _touch(root / "generated" / "skipped.py")
+    _touch(root / "build" / "out.py")
+    _touch(root / "node_modules" / "lib" / "index.js")
+    _touch(root / ".git" / "HEAD")
+    _touch(root / "debug.log")
+    _touch(root / "keep.log")
+    _touch(root / "README.md")
+
+
+def test_walk_prunes_ignored_directories(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    crawler = WorkspaceCrawler()
+
+    found = {path.relative_to(tmp_path).as_posix() for path in crawler.iter_files(tmp_path)}
+
+    assert found == {"pkg/module.py", "pkg/generated/kept.py", "keep.log", "README.md"}
+    assert {p.name for p in crawler.iter_files(tmp_path, suffixes=(".py",))} == {"module.py", "kept.py"}
+    assert crawler.is_ignored(tmp_path / "build" / "out.py", tmp_path)
+    assert crawler.is_ignored(tmp_path / "pkg" / "fixtures" / "big" / "data.py", tmp_path)
+    assert not crawler.is_ignored(tmp_path / "pkg" / "module.py", tmp_path)
+
+
+def test_crawl_streams_batches(tmp_path: Path) -> None:
+    for index in range(7):
+        _touch(tmp_path / f"file{index}.txt", "x" * index)
+    crawler = WorkspaceCrawler(batch_size=3, max_workers=2)
+
+    batches = list(crawler.crawl(tmp_path, lambda path: path.stat().st_size or None))
+
+    assert sorted(size for batch in batches for size in batch) == [1, 2, 3, 4, 5, 6]
+    assert all(len(batch) <= 3 for batch in batches[:-1])
+    assert [len(batch) for batch in crawler.iter_batches(tmp_path)] == [3, 3, 1]
+    crawler.shutdown()
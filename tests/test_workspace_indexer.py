@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ghostline.ai.context_engine import ContextEngine
+from ghostline.core.cache import CacheManager
+from ghostline.indexer.index_store import IndexStore
+from ghostline.indexer.text_index import InvertedIndex
+from ghostline.indexer.workspace_indexer import WorkspaceIndexer
+
+
+@pytest.fixture
+def make_indexer(immediate_workers):
+    def _make(root: Path, **kwargs) -> WorkspaceIndexer:
+        return WorkspaceIndexer(lambda: root, workers=immediate_workers, **kwargs)
+
+    return _make
+
+
+def _populate(root: Path) -> None:
+    (root / "alpha.py").write_text("def compute_total(values):\n    return sum(values)\n", encoding="utf-8")
+    (root / "beta.py").write_text("class ReportBuilder:\n    pass\n", encoding="utf-8")
+    hidden = root / ".venv"
+    hidden.mkdir()
+    (hidden / "ignored.py").write_text("def ignored():\n    pass\n", encoding="utf-8")
+
+
+def _track_reads(monkeypatch) -> list[str]:
+    reads: list[str] = []
+    original = Path.read_bytes
+
+    def _tracking_read(self: Path) -> bytes:
+        reads.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _tracking_read)
+    return reads
+
+
+def test_index_is_persisted_and_searchable(tmp_path: Path, make_indexer) -> None:
+    _populate(tmp_path)
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    assert IndexStore(tmp_path).path.exists()
+    assert [file.path.name for file in indexer.search("compute total")] == ["alpha.py"]
+    assert [file.path.name for file in indexer.symbols_for("ReportBuilder")] == ["beta.py"]
+
+
+def test_hidden_directories_are_not_indexed(tmp_path: Path, make_indexer) -> None:
+    _populate(tmp_path)
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    assert indexer.get(tmp_path / ".venv" / "ignored.py") is None
+
+
+def test_warm_start_only_rereads_changed_files(tmp_path: Path, make_indexer, monkeypatch) -> None:
+    _populate(tmp_path)
+    make_indexer(tmp_path).set_workspace(tmp_path)
+    changed = tmp_path / "beta.py"
+    changed.write_text("class ReportWriter:\n    pass\n", encoding="utf-8")
+    stat = changed.stat()
+    os.utime(changed, (stat.st_atime, stat.st_mtime + 5))
+    reads = _track_reads(monkeypatch)
+
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    assert reads == ["beta.py"]
+    assert indexer.symbols_for("ReportBuilder") == []
+    assert [file.path.name for file in indexer.symbols_for("ReportWriter")] == ["beta.py"]
+
+
+def test_warm_start_drops_deleted_files(tmp_path: Path, make_indexer) -> None:
+    _populate(tmp_path)
+    make_indexer(tmp_path).set_workspace(tmp_path)
+    (tmp_path / "alpha.py").unlink()
+
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    assert indexer.get(tmp_path / "alpha.py") is None
+    assert indexer.search("compute total") == []
+
+
+def test_inverted_index_ranks_by_bm25() -> None:
+    index: InvertedIndex[str] = InvertedIndex()
+    index.add("dense", {"parser": 5, "token": 1})
+    index.add("sparse", {"parser": 1, "lexer": 8})
+    index.add("other", {"render": 3})
+
+    assert [key for _, key in index.search(["parser"], limit=5)] == ["dense", "sparse"]
+    assert [key for _, key in index.search(["lexer", "parser"], limit=1)] == ["sparse"]
+
+
+def test_inverted_index_forgets_replaced_and_removed_docs() -> None:
+    index: InvertedIndex[str] = InvertedIndex()
+    index.add("dense", {"parser": 5, "token": 1})
+    index.add("sparse", {"parser": 1, "lexer": 8})
+
+    index.add("dense", {"token": 2})
+    index.remove("sparse")
+
+    assert index.term_counts("dense") == {"token": 2}
+    assert index.search(["parser"]) == []
+    assert len(index) == 1
+
+
+def test_contents_are_not_resident(tmp_path: Path, make_indexer) -> None:
+    (tmp_path / "long.txt").write_text("line\n" * 50, encoding="utf-8")
+    indexer = make_indexer(tmp_path, content_budget_bytes=64)
+    indexer.set_workspace(tmp_path)
+
+    indexed = indexer.get(tmp_path / "long.txt")
+    assert indexed is not None and indexed.content is None
+    indexed.text()
+    assert indexer._contents.resident_bytes <= 64
+
+
+def test_snippets_read_line_ranges(tmp_path: Path, make_indexer) -> None:
+    lines = [f"line {index}" for index in range(1, 51)]
+    (tmp_path / "long.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    indexer = make_indexer(tmp_path, content_budget_bytes=64)
+    indexer.set_workspace(tmp_path)
+
+    indexed = indexer.get(tmp_path / "long.txt")
+    assert indexed is not None
+    assert indexed.snippet(13) == "line 1\nline 2"
+    assert indexed.read_lines(10, 12) == "line 10\nline 11\nline 12"
+    assert indexed.text().splitlines() == lines
+
+
+def test_line_ranges_follow_splitlines(tmp_path: Path, make_indexer) -> None:
+    source = (
+        "import os\r\n\x0c\n\ndef alpha():\r\n    return 1\x85\n"
+        "\x0c\n\ndef beta():\n    return '\u2028'\n"
+    )
+    (tmp_path / "breaks.py").write_bytes(source.encode("utf-8"))
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    indexed = indexer.get(tmp_path / "breaks.py")
+    assert indexed is not None
+    lines = source.splitlines()
+    for chunk in indexed.chunks:
+        assert indexed.read_lines(chunk.start_line, chunk.end_line) == "\n".join(
+            lines[chunk.start_line - 1 : chunk.end_line]
+        )
+    assert {chunk.name for chunk in indexed.chunks} >= {"alpha", "beta"}
+
+
+def test_restored_files_rebuild_line_offsets(tmp_path: Path, make_indexer, monkeypatch) -> None:
+    lines = [f"line {index}" for index in range(1, 51)]
+    (tmp_path / "long.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    make_indexer(tmp_path).set_workspace(tmp_path)
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+    indexed = indexer.get(tmp_path / "long.txt")
+    assert indexed is not None and indexed.line_offsets is None
+    reads = _track_reads(monkeypatch)
+
+    assert indexed.read_lines(10, 11) == "line 10\nline 11"
+    assert indexed.read_lines(49, 50) == "line 49\nline 50"
+    assert reads == ["long.txt"]
+    assert indexed.line_offsets is not None
+
+
+BILLING = (
+    "\n".join(f"# licence line {index}" for index in range(20))
+    + "\nimport os\n\n\n"
+    "def unrelated_helper():\n    return os.getcwd()\n\n\n"
+    "def parse_invoice(payload):\n    total = payload['invoice_total']\n    return total\n"
+)
+
+
+def test_chunks_are_ranked_by_content(tmp_path: Path, make_indexer) -> None:
+    (tmp_path / "billing.py").write_text(BILLING, encoding="utf-8")
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    [match] = indexer.search_chunks("invoice total", limit=1)
+    assert match.chunk.name == "parse_invoice"
+    assert match.text().startswith("def parse_invoice(payload):")
+    assert "licence" not in match.text()
+
+
+def test_chunks_survive_warm_start(tmp_path: Path, make_indexer) -> None:
+    (tmp_path / "billing.py").write_text(BILLING, encoding="utf-8")
+    make_indexer(tmp_path).set_workspace(tmp_path)
+
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+
+    assert [match.chunk.name for match in indexer.search_chunks("invoice total", limit=1)] == ["parse_invoice"]
+    assert [m.chunk.kind for m in indexer.chunks_for_symbol("unrelated_helper")] == ["function"]
+
+
+@pytest.fixture
+def counted_context(tmp_path: Path, make_indexer, monkeypatch):
+    _populate(tmp_path)
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+    lookups: list[str] = []
+    original = indexer.search_chunks
+
+    def _counting_search(query: str, limit: int = 5):
+        lookups.append(query)
+        return original(query, limit)
+
+    monkeypatch.setattr(indexer, "search_chunks", _counting_search)
+    return indexer, ContextEngine(indexer), lookups
+
+
+def test_context_cache_survives_unrelated_edits(tmp_path: Path, counted_context) -> None:
+    _indexer, engine, lookups = counted_context
+    scratch = tmp_path / "scratch.py"
+
+    engine.build_context("compute total", active_document=(scratch, "x = 1"))
+    _, chunks = engine.build_context("compute total", active_document=(scratch, "x = 12"))
+
+    assert len(lookups) == 1
+    assert any(chunk.source_path == tmp_path / "alpha.py" for chunk in chunks)
+
+
+def test_unchanged_memory_snapshot_keeps_file_version(tmp_path: Path, counted_context) -> None:
+    indexer, _engine, _lookups = counted_context
+    scratch = tmp_path / "scratch.py"
+    indexer.update_memory_snapshot(scratch, "x = 12")
+    version = indexer.file_version(scratch)
+
+    indexer.update_memory_snapshot(scratch, "x = 12")
+
+    assert indexer.file_version(scratch) == version
+
+
+def test_context_cache_invalidated_by_indexed_edit(tmp_path: Path, counted_context) -> None:
+    indexer, engine, lookups = counted_context
+    engine.build_context("compute total")
+
+    indexer.update_memory_snapshot(tmp_path / "alpha.py", "def compute_total(items):\n    pass\n")
+    engine.build_context("compute total")
+
+    assert len(lookups) == 2
+
+
+def test_context_cache_reports_through_its_namespace(tmp_path: Path, make_indexer) -> None:
+    _populate(tmp_path)
+    indexer = make_indexer(tmp_path)
+    indexer.set_workspace(tmp_path)
+    cache = CacheManager(auto_cleanup=False)
+    engine = ContextEngine(indexer, cache=cache.namespace("ai.context", max_entries=1))
+
+    engine.build_context("compute total")
+    engine.build_context("compute total")
+    engine.build_context("report builder")
+
+    stats = cache.all_stats()["ai.context"]
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 2, 1, 1)